@@ -58,6 +58,7 @@ This project demonstrates a complete DevOps implementation for deploying a 3-tie
 │       ├── alb/
 │       ├── ecs/
 │       ├── rds/
+│       ├── redis/
 │       └── security/
 ├── scripts/               # Deployment and utility scripts
 ├── docs/                 # Additional documentation
@@ -70,7 +71,7 @@ This project demonstrates a complete DevOps implementation for deploying a 3-tie
 - AWS CLI configured with appropriate permissions
 - Terraform >= 1.0 installed
 - Docker installed (for local development)
-- Node.js 16+ (for application development)
+- Node.js 18.2+ (for application development)
 
 ### Deployment Steps
 
@@ -420,6 +421,8 @@ module "ecs" {{
   private_subnet_ids      = module.vpc.private_subnet_ids
   ecs_security_group_id   = module.security.ecs_security_group_id
   alb_target_group_arn    = module.alb.backend_target_group_arn
+  deregistration_delay    = module.alb.backend_deregistration_delay
+  alb_idle_timeout        = module.alb.idle_timeout
   
   # Application configuration
   app_image               = var.backend_image
@@ -432,6 +435,10 @@ module "ecs" {{
   
   # Database configuration
   database_url           = module.rds.database_url
+  db_max_connections     = var.db_max_connections
+  
+  # Rate limit buckets and idempotency keys shared by all tasks
+  redis_url              = module.redis.redis_url
   
   common_tags = local.common_tags
 }}
@@ -452,12 +459,27 @@ module "rds" {{
   db_instance_class        = var.db_instance_class
   allocated_storage        = var.db_allocated_storage
   max_allocated_storage    = var.db_max_allocated_storage
+  max_connections          = var.db_max_connections
   multi_az                = local.is_production
   backup_retention_period = local.is_production ? 7 : 1
   
   common_tags = local.common_tags
 }}
 
+# ElastiCache Redis Module
+module "redis" {{
+  source = "../../modules/redis"
+  
+  environment             = local.environment
+  subnet_ids             = module.vpc.database_subnet_ids
+  redis_security_group_id = module.security.redis_security_group_id
+  
+  node_type              = var.redis_node_type
+  multi_az               = local.is_production
+  
+  common_tags = local.common_tags
+}}
+
 # CloudWatch Module for Monitoring
 module "monitoring" {{
   source = "../../modules/monitoring"
@@ -467,6 +489,7 @@ module "monitoring" {{
   ecs_cluster_name    = module.ecs.cluster_name
   ecs_service_name    = module.ecs.service_name
   rds_instance_id     = module.rds.instance_id
+  app_log_group_name  = module.ecs.log_group_name
   
   common_tags = local.common_tags
 }}
@@ -498,8 +521,12 @@ db_name = "webapp_dev"
 db_username = "admin"
 db_password = "dev-password-123" # Use AWS Secrets Manager in production
 db_instance_class = "db.t3.micro"
+db_max_connections = 60
 db_allocated_storage = 20
 db_max_allocated_storage = 100
+
+# Redis Configuration
+redis_node_type = "cache.t3.micro"
 '''
     elif env == "staging":
         project_files[f"terraform/environments/{env}/terraform.tfvars"] = '''# Staging Environment Variables
@@ -526,8 +553,12 @@ db_name = "webapp_staging"
 db_username = "admin"
 db_password = "staging-password-123" # Use AWS Secrets Manager in production
 db_instance_class = "db.t3.small"
+db_max_connections = 150
 db_allocated_storage = 50
 db_max_allocated_storage = 200
+
+# Redis Configuration
+redis_node_type = "cache.t3.micro"
 '''
     else:  # prod
         project_files[f"terraform/environments/{env}/terraform.tfvars"] = '''# Production Environment Variables
@@ -554,8 +585,12 @@ db_name = "webapp_prod"
 db_username = "admin"
 db_password = "prod-password-123" # Use AWS Secrets Manager in production
 db_instance_class = "db.t3.medium"
+db_max_connections = 300
 db_allocated_storage = 100
 db_max_allocated_storage = 500
+
+# Redis Configuration
+redis_node_type = "cache.t3.small"
 '''
 
     # Variables definition
@@ -659,6 +694,17 @@ variable "db_max_allocated_storage" {
   description = "Maximum allocated storage for RDS"
   type        = number
 }
+
+variable "db_max_connections" {
+  description = "RDS max_connections; also used to size each backend task's connection pool"
+  type        = number
+}
+
+# Redis Variables
+variable "redis_node_type" {
+  description = "ElastiCache node type for the shared Redis"
+  type        = string
+}
 '''
 
     # Outputs
@@ -683,6 +729,11 @@ output "database_endpoint" {
   sensitive   = true
 }
 
+output "redis_endpoint" {
+  description = "Redis primary endpoint"
+  value       = module.redis.primary_endpoint
+}
+
 output "ecs_cluster_name" {
   description = "Name of the ECS cluster"
   value       = module.ecs.cluster_name
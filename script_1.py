@@ -402,6 +402,29 @@ resource "aws_security_group" "rds" {
   }
 }
 
+# Redis Security Group
+resource "aws_security_group" "redis" {
+  name_prefix = "${var.environment}-redis-"
+  vpc_id      = var.vpc_id
+  description = "Security group for ElastiCache Redis"
+
+  ingress {
+    description     = "Redis from ECS"
+    from_port       = 6379
+    to_port         = 6379
+    protocol        = "tcp"
+    security_groups = [aws_security_group.ecs.id]
+  }
+
+  tags = merge(var.common_tags, {
+    Name = "${var.environment}-redis-sg"
+  })
+
+  lifecycle {
+    create_before_destroy = true
+  }
+}
+
 # Bastion Host Security Group (Optional for troubleshooting)
 resource "aws_security_group" "bastion" {
   name_prefix = "${var.environment}-bastion-"
@@ -535,6 +558,11 @@ output "rds_security_group_id" {
   value       = aws_security_group.rds.id
 }
 
+output "redis_security_group_id" {
+  description = "ID of the Redis security group"
+  value       = aws_security_group.redis.id
+}
+
 output "bastion_security_group_id" {
   description = "ID of the bastion security group"
   value       = aws_security_group.bastion.id
@@ -11,6 +11,7 @@ resource "aws_lb" "main" {
   load_balancer_type = "application"
   security_groups    = [var.alb_security_group_id]
   subnets            = var.public_subnet_ids
+  idle_timeout       = var.idle_timeout
 
   enable_deletion_protection = var.environment == "prod" ? true : false
 
@@ -124,13 +125,18 @@ resource "aws_lb_target_group" "backend" {
   vpc_id      = var.vpc_id
   target_type = "ip"
 
+  # How long in-flight requests may finish after a task is deregistered.
+  # The ECS module derives the app's shutdown deadline from it.
+  deregistration_delay = var.deregistration_delay
+
   health_check {
     enabled             = true
     healthy_threshold   = 2
     unhealthy_threshold = 3
     timeout             = 5
     interval            = 30
-    path                = "/health"
+    # Fails until the task's DB pool is warm and whenever the DB is unreachable
+    path                = "/ready"
     matcher             = "200"
     port                = "traffic-port"
     protocol            = "HTTP"
@@ -277,6 +283,18 @@ variable "certificate_arn" {
   default     = ""
 }
 
+variable "idle_timeout" {
+  description = "Seconds an idle client or target connection is kept open by the ALB"
+  type        = number
+  default     = 60
+}
+
+variable "deregistration_delay" {
+  description = "Seconds the backend target group lets in-flight requests drain"
+  type        = number
+  default     = 30
+}
+
 variable "common_tags" {
   description = "Common tags to be applied to all resources"
   type        = map(string)
@@ -308,6 +326,16 @@ output "backend_target_group_arn" {
   value       = aws_lb_target_group.backend.arn
 }
 
+output "backend_deregistration_delay" {
+  description = "Draining time of the backend target group in seconds"
+  value       = aws_lb_target_group.backend.deregistration_delay
+}
+
+output "idle_timeout" {
+  description = "Idle timeout of the Application Load Balancer in seconds"
+  value       = aws_lb.main.idle_timeout
+}
+
 output "frontend_target_group_arn" {
   description = "ARN of the frontend target group"
   value       = aws_lb_target_group.frontend.arn
@@ -377,6 +405,17 @@ resource "aws_cloudwatch_log_group" "ecs_exec" {
   tags = var.common_tags
 }
 
+# Database connection pool sizing
+# Every task gets an equal share of the RDS connection budget. During a
+# rolling deployment (maximum_percent = 200) up to twice max_capacity tasks
+# can be running, so the share is computed against that peak.
+locals {
+  db_connection_budget = floor(var.db_max_connections * (1 - var.db_connection_headroom))
+  db_peak_task_count   = var.max_capacity * 2
+  db_pool_size         = max(2, min(var.db_pool_max_size, floor(local.db_connection_budget / local.db_peak_task_count)))
+  db_queue_limit       = local.db_pool_size * var.db_queue_factor
+}
+
 # ECS Task Definition
 resource "aws_ecs_task_definition" "app" {
   family                   = "${var.environment}-app"
@@ -392,6 +431,8 @@ resource "aws_ecs_task_definition" "app" {
       name      = "app"
       image     = var.app_image
       essential = true
+      # Leaves the app its full drain deadline before SIGKILL (Fargate max 120)
+      stopTimeout = min(var.deregistration_delay + 15, 120)
 
       portMappings = [
         {
@@ -415,6 +456,34 @@ resource "aws_ecs_task_definition" "app" {
         {
           name  = "DATABASE_URL"
           value = var.database_url
+        },
+        {
+          name  = "DB_POOL_SIZE"
+          value = tostring(local.db_pool_size)
+        },
+        {
+          name  = "DB_QUEUE_LIMIT"
+          value = tostring(local.db_queue_limit)
+        },
+        {
+          name  = "DB_ACQUIRE_TIMEOUT_MS"
+          value = tostring(var.db_acquire_timeout_ms)
+        },
+        {
+          name  = "DB_QUERY_TIMEOUT_MS"
+          value = tostring(var.db_query_timeout_ms)
+        },
+        {
+          name  = "SHUTDOWN_TIMEOUT_MS"
+          value = tostring(var.deregistration_delay * 1000)
+        },
+        {
+          name  = "KEEP_ALIVE_TIMEOUT_MS"
+          value = tostring((var.alb_idle_timeout + 5) * 1000)
+        },
+        {
+          name  = "REDIS_URL"
+          value = var.redis_url
         }
       ]
 
@@ -434,8 +503,12 @@ resource "aws_ecs_task_definition" "app" {
         }
       }
 
+      # Liveness only: /ready fails while the database is unreachable or the
+      # breaker is open, and failing this check would replace every task at
+      # once. Readiness is the ALB target group's job.
       healthCheck = {
-        command     = ["CMD-SHELL", "curl -f http://localhost:${var.app_port}/health || exit 1"]
+        # node:18-alpine ships busybox wget but not curl
+        command     = ["CMD-SHELL", "wget -q -O /dev/null http://localhost:${var.app_port}/health || exit 1"]
         interval    = 30
         timeout     = 5
         retries     = 3
@@ -714,6 +787,60 @@ variable "database_url" {
   type        = string
 }
 
+variable "db_max_connections" {
+  description = "RDS max_connections shared by all tasks"
+  type        = number
+  default     = 100
+}
+
+variable "db_connection_headroom" {
+  description = "Fraction of max_connections kept free for admin sessions, migrations and monitoring"
+  type        = number
+  default     = 0.2
+}
+
+variable "db_pool_max_size" {
+  description = "Upper bound for a single task's connection pool"
+  type        = number
+  default     = 50
+}
+
+variable "db_queue_factor" {
+  description = "Requests allowed to wait for a connection, as a multiple of the pool size"
+  type        = number
+  default     = 4
+}
+
+variable "db_acquire_timeout_ms" {
+  description = "How long a request may wait for a pooled connection before failing"
+  type        = number
+  default     = 2000
+}
+
+variable "db_query_timeout_ms" {
+  description = "Driver-side timeout for a single query"
+  type        = number
+  default     = 10000
+}
+
+variable "deregistration_delay" {
+  description = "Deregistration delay of the ALB target group; bounds graceful shutdown"
+  type        = number
+  default     = 30
+}
+
+variable "redis_url" {
+  description = "Redis endpoint for rate limit buckets and idempotency keys shared by all tasks; empty keeps them per task"
+  type        = string
+  default     = ""
+}
+
+variable "alb_idle_timeout" {
+  description = "ALB idle timeout; the app keeps idle connections open a little longer"
+  type        = number
+  default     = 60
+}
+
 variable "common_tags" {
   description = "Common tags to be applied to all resources"
   type        = map(string)
@@ -759,6 +886,16 @@ output "task_role_arn" {
   description = "ECS task role ARN"
   value       = aws_iam_role.ecs_task_role.arn
 }
+
+output "db_pool_size" {
+  description = "Connection pool size configured for each backend task"
+  value       = local.db_pool_size
+}
+
+output "log_group_name" {
+  description = "CloudWatch log group receiving application container logs"
+  value       = aws_cloudwatch_log_group.app.name
+}
 '''
 }
 
@@ -512,6 +512,26 @@ resource "aws_cloudwatch_dashboard" "main" {
           period  = 300
         }
       },
+      {
+        type   = "metric"
+        x      = 12
+        y      = 0
+        width  = 12
+        height = 6
+
+        properties = {
+          metrics = [
+            ["AWS/ApplicationELB", "TargetResponseTime", "LoadBalancer", var.alb_arn_suffix, { stat = "p50", label = "p50" }],
+            ["AWS/ApplicationELB", "TargetResponseTime", "LoadBalancer", var.alb_arn_suffix, { stat = "p95", label = "p95" }],
+            ["AWS/ApplicationELB", "TargetResponseTime", "LoadBalancer", var.alb_arn_suffix, { stat = "p99", label = "p99" }]
+          ]
+          view    = "timeSeries"
+          stacked = false
+          region  = data.aws_region.current.name
+          title   = "Target Response Time Percentiles"
+          period  = 60
+        }
+      },
       {
         type   = "metric"
         x      = 0
@@ -648,16 +668,23 @@ resource "aws_cloudwatch_log_group" "application_logs" {
 }
 
 # Log Insights Queries
+# The backend writes one JSON line per request (route, status, duration_ms,
+# db_time_ms, sample_rate) to the ECS container log group.
+locals {
+  insights_log_groups = compact([
+    aws_cloudwatch_log_group.application_logs.name,
+    var.app_log_group_name
+  ])
+}
+
 resource "aws_cloudwatch_query_definition" "error_logs" {
   name = "${var.environment}-error-logs"
 
-  log_group_names = [
-    aws_cloudwatch_log_group.application_logs.name
-  ]
+  log_group_names = local.insights_log_groups
 
   query_string = <<EOF
-fields @timestamp, @message
-| filter @message like /ERROR/
+fields @timestamp, message, route, status, @message
+| filter level = "error" or status >= 500
 | sort @timestamp desc
 | limit 100
 EOF
@@ -666,20 +693,32 @@ EOF
 resource "aws_cloudwatch_query_definition" "slow_requests" {
   name = "${var.environment}-slow-requests"
 
-  log_group_names = [
-    aws_cloudwatch_log_group.application_logs.name
-  ]
+  log_group_names = local.insights_log_groups
 
   query_string = <<EOF
-fields @timestamp, @message
-| filter @message like /duration/
-| parse @message "duration=*ms" as duration
-| filter duration > 1000
-| sort @timestamp desc
+fields @timestamp, method, route, status, duration_ms, db_time_ms
+| filter message = "request" and duration_ms > 1000
+| sort duration_ms desc
 | limit 50
 EOF
 }
 
+resource "aws_cloudwatch_query_definition" "route_latency" {
+  name = "${var.environment}-route-latency"
+
+  log_group_names = local.insights_log_groups
+
+  query_string = <<EOF
+filter message = "request"
+| stats sum(1 / sample_rate) as requests,
+        pct(duration_ms, 50) as p50_ms,
+        pct(duration_ms, 99) as p99_ms,
+        avg(db_time_ms) as avg_db_ms
+  by route
+| sort p99_ms desc
+EOF
+}
+
 # Composite Alarm for Application Health
 resource "aws_cloudwatch_composite_alarm" "application_health" {
   alarm_name          = "${var.environment}-application-health"
@@ -722,6 +761,12 @@ variable "rds_instance_id" {
   type        = string
 }
 
+variable "app_log_group_name" {
+  description = "Log group receiving the backend's structured request logs"
+  type        = string
+  default     = ""
+}
+
 variable "alert_email_addresses" {
   description = "Email addresses for alerts"
   type        = list(string)
@@ -751,10 +796,131 @@ output "log_group_name" {
 '''
 }
 
-# Add RDS and monitoring modules to project files
-for module_name in ["rds", "monitoring"]:
+# ElastiCache Redis Module
+modules["redis"] = {
+    "main.tf": '''# ElastiCache Module for Redis
+# Holds the state every backend task has to agree on: rate limit buckets
+# and idempotency keys. Tasks reach it with TLS (rediss://).
+
+# Cache Subnet Group
+resource "aws_elasticache_subnet_group" "main" {
+  name       = "${var.environment}-redis-subnet-group"
+  subnet_ids = var.subnet_ids
+
+  tags = var.common_tags
+}
+
+# Parameter Group
+# Keys are written with a TTL, so only those are evicted under memory
+# pressure
+resource "aws_elasticache_parameter_group" "main" {
+  family = "redis7"
+  name   = "${var.environment}-redis-parameter-group"
+
+  parameter {
+    name  = "maxmemory-policy"
+    value = "volatile-lru"
+  }
+
+  tags = var.common_tags
+}
+
+# Replication Group (a replica in another AZ in production)
+resource "aws_elasticache_replication_group" "main" {
+  replication_group_id = "${var.environment}-redis"
+  description          = "Shared rate limit and idempotency state for ${var.environment}"
+
+  engine               = "redis"
+  engine_version       = var.engine_version
+  node_type            = var.node_type
+  port                 = 6379
+  parameter_group_name = aws_elasticache_parameter_group.main.name
+
+  num_cache_clusters         = var.multi_az ? 2 : 1
+  automatic_failover_enabled = var.multi_az
+  multi_az_enabled           = var.multi_az
+
+  subnet_group_name  = aws_elasticache_subnet_group.main.name
+  security_group_ids = [var.redis_security_group_id]
+
+  at_rest_encryption_enabled = true
+  transit_encryption_enabled = true
+
+  snapshot_retention_limit = var.multi_az ? 1 : 0
+  maintenance_window       = var.maintenance_window
+  apply_immediately        = !var.multi_az
+
+  tags = merge(var.common_tags, {
+    Name = "${var.environment}-redis"
+  })
+}
+''',
+    "variables.tf": '''variable "environment" {
+  description = "Environment name"
+  type        = string
+}
+
+variable "subnet_ids" {
+  description = "Subnet IDs for the cache nodes"
+  type        = list(string)
+}
+
+variable "redis_security_group_id" {
+  description = "Security group ID for Redis"
+  type        = string
+}
+
+variable "node_type" {
+  description = "ElastiCache node type"
+  type        = string
+  default     = "cache.t3.micro"
+}
+
+variable "engine_version" {
+  description = "Redis engine version"
+  type        = string
+  default     = "7.1"
+}
+
+variable "multi_az" {
+  description = "Add a replica in another AZ with automatic failover"
+  type        = bool
+  default     = false
+}
+
+variable "maintenance_window" {
+  description = "Maintenance window"
+  type        = string
+  default     = "sun:05:00-sun:06:00"
+}
+
+variable "common_tags" {
+  description = "Common tags to be applied to all resources"
+  type        = map(string)
+  default     = {}
+}
+''',
+    "outputs.tf": '''output "primary_endpoint" {
+  description = "Redis primary endpoint"
+  value       = aws_elasticache_replication_group.main.primary_endpoint_address
+}
+
+output "port" {
+  description = "Redis port"
+  value       = aws_elasticache_replication_group.main.port
+}
+
+output "redis_url" {
+  description = "Redis connection URL"
+  value       = "rediss://${aws_elasticache_replication_group.main.primary_endpoint_address}:${aws_elasticache_replication_group.main.port}"
+}
+'''
+}
+
+# Add RDS, Redis and monitoring modules to project files
+for module_name in ["rds", "redis", "monitoring"]:
     for file_name, content in modules[module_name].items():
         project_files[f"terraform/modules/{module_name}/{file_name}"] = content
 
-print("Created RDS and Monitoring modules")
+print("Created RDS, Redis and Monitoring modules")
 print(f"Total files so far: {len(project_files)}")
\ No newline at end of file
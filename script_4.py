@@ -9,6 +9,10 @@ project_files["application/backend/package.json"] = '''{
   "scripts": {
     "start": "node server.js",
     "dev": "nodemon server.js",
+    "migrate": "node lib/migrate.js",
+    "bench": "node bench/serialize.js",
+    "bench:http": "node bench/http.js",
+    "bench:tracing": "node bench/tracing.js",
     "test": "jest",
     "test:watch": "jest --watch",
     "lint": "eslint .",
@@ -22,10 +26,11 @@ project_files["application/backend/package.json"] = '''{
     "dotenv": "^16.3.1",
     "bcryptjs": "^2.4.3",
     "jsonwebtoken": "^9.0.2",
-    "express-rate-limit": "^6.8.1",
+    "ioredis": "^5.3.2",
     "winston": "^3.10.0",
     "compression": "^1.7.4",
-    "morgan": "^1.10.0"
+    "fast-json-stringify": "^5.8.0",
+    "prom-client": "^15.1.0"
   },
   "devDependencies": {
     "nodemon": "^3.0.1",
@@ -34,7 +39,7 @@ project_files["application/backend/package.json"] = '''{
     "eslint": "^8.47.0"
   },
   "engines": {
-    "node": ">=16.0.0"
+    "node": ">=18.2.0"
   },
   "keywords": ["express", "api", "mysql", "docker", "aws"],
   "author": "DevOps Team",
@@ -45,14 +50,50 @@ project_files["application/backend/server.js"] = '''const express = require('exp
 const mysql = require('mysql2/promise');
 const cors = require('cors');
 const helmet = require('helmet');
-const rateLimit = require('express-rate-limit');
 const compression = require('compression');
-const morgan = require('morgan');
 const winston = require('winston');
+const { pipeline } = require('stream');
+const { EXPORT_FORMATS, createExportSerializer } = require('./lib/export');
+const { IMPORT_FORMATS, importFormatOf, createImportParser, createImportSink } = require('./lib/import');
+const metrics = require('./lib/metrics');
+const tracing = require('./lib/tracing');
+const Database = require('./lib/db');
+const { migrate } = require('./lib/migrate');
+const { deadline } = require('./lib/deadline');
+const serializers = require('./lib/serializers');
+const { TokenBucketLimiter, RedisBucketStore, MemoryBucketStore, rateLimit } = require('./lib/rate-limiter');
+const { MemoryIdempotencyStore, RedisIdempotencyStore, idempotent } = require('./lib/idempotency');
+const { createRequestLogger } = require('./lib/request-logger');
+const SingleFlight = require('./lib/single-flight');
+const { strongEtag, handleConditionalGet, timestampOf } = require('./lib/etag');
+const CompressedResponseCache = require('./lib/response-cache');
+const { validateUserRows, parseIdList } = require('./lib/user-batch');
+const { MysqlUserRepository, MemoryUserRepository } = require('./lib/repositories');
+const LRUCache = require('./lib/lru-cache');
 require('dotenv').config();
 
 const app = express();
+// req.ip is the client address from X-Forwarded-For, as set by the ALB
+app.set('trust proxy', parseInt(process.env.TRUST_PROXY_HOPS, 10) || 1);
 const PORT = process.env.PORT || 3000;
+const EXPORT_HIGH_WATER_MARK = parseInt(process.env.EXPORT_HIGH_WATER_MARK, 10) || 1000;
+const COMPRESSION_THRESHOLD = parseInt(process.env.COMPRESSION_THRESHOLD, 10) || 1024;
+const BATCH_MAX_SIZE = parseInt(process.env.BATCH_MAX_SIZE, 10) || 500;
+const BATCH_MAX_IDS = parseInt(process.env.BATCH_MAX_IDS, 10) || 500;
+const IMPORT_CHUNK_SIZE = parseInt(process.env.IMPORT_CHUNK_SIZE, 10) || 1000;
+const IMPORT_MAX_BYTES = parseInt(process.env.IMPORT_MAX_BYTES, 10) || 512 * 1024 * 1024;
+const SEARCH_MAX_LIMIT = 100;
+const LIST_MAX_LIMIT = 200;
+const IMPORT_REQUEST_TIMEOUT_MS = parseInt(process.env.IMPORT_REQUEST_TIMEOUT_MS, 10) || 30 * 60 * 1000;
+// End-to-end budgets per route; every query gets what is left of them
+const REQUEST_DEADLINE_MS = parseInt(process.env.REQUEST_DEADLINE_MS, 10) || 5000;
+const BATCH_DEADLINE_MS = parseInt(process.env.BATCH_DEADLINE_MS, 10) || 30000;
+const READY_DEADLINE_MS = 3000;
+const RATE_LIMIT_MAX = parseInt(process.env.RATE_LIMIT_MAX, 10) || 100;
+const RATE_LIMIT_WINDOW_MS = parseInt(process.env.RATE_LIMIT_WINDOW_MS, 10) || 15 * 60 * 1000;
+// Aligned with the ALB deregistration delay and idle timeout (see the ECS module)
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS, 10) || 30000;
+const KEEP_ALIVE_TIMEOUT_MS = parseInt(process.env.KEEP_ALIVE_TIMEOUT_MS, 10) || 65000;
 
 // Configure Winston logger
 const logger = winston.createLogger({
@@ -63,76 +104,275 @@ const logger = winston.createLogger({
     winston.format.json()
   ),
   defaultMeta: { service: '3tier-backend' },
+  // JSON lines so CloudWatch Logs Insights discovers fields automatically
   transports: [
-    new winston.transports.Console({
-      format: winston.format.simple()
-    })
+    new winston.transports.Console()
   ]
 });
 
+// Tracing of sampled requests, exported to an OTLP/HTTP collector or a local
+// NDJSON file. Off unless TRACE_EXPORTER is set.
+const tracingOptions = {
+  exporter: process.env.TRACE_EXPORTER || 'none',
+  sampleRate: process.env.TRACE_SAMPLE_RATE !== undefined
+    ? parseFloat(process.env.TRACE_SAMPLE_RATE)
+    : 0.01,
+  endpoint: process.env.OTEL_EXPORTER_OTLP_ENDPOINT || 'http://localhost:4318',
+  file: process.env.TRACE_FILE || 'traces.ndjson',
+  serviceName: '3tier-backend'
+};
+if (tracing.configure(tracingOptions)) {
+  logger.info('Tracing enabled', { exporter: tracingOptions.exporter, sample_rate: tracingOptions.sampleRate });
+}
+
 // Database configuration
 const dbConfig = {
   host: process.env.DB_HOST || 'localhost',
   user: process.env.DB_USER || 'admin',
   password: process.env.DB_PASSWORD || 'password',
   database: process.env.DB_NAME || 'webapp_dev',
-  connectionLimit: 10,
-  acquireTimeout: 60000,
-  timeout: 60000
+  // Pool size and queue limit are derived per environment from the RDS
+  // max_connections budget and the ECS max task count (see the ECS module)
+  connectionLimit: parseInt(process.env.DB_POOL_SIZE, 10) || 10,
+  queueLimit: parseInt(process.env.DB_QUEUE_LIMIT, 10) || 40,
+  waitForConnections: true,
+  connectTimeout: parseInt(process.env.DB_CONNECT_TIMEOUT_MS, 10) || 5000,
+  // Keeps warmed-up idle connections from being dropped by the network
+  enableKeepAlive: true,
+  keepAliveInitialDelay: 10000
+};
+
+// 'memory' serves users from process memory instead of MySQL, for
+// benchmarking the API on its own (see bench/http.js). Data is not persisted.
+const DB_DRIVER = process.env.DB_DRIVER || 'mysql';
+
+// Connections opened before the task reports ready
+const DB_POOL_MIN_IDLE = Math.min(
+  parseInt(process.env.DB_POOL_MIN_IDLE, 10) || 5,
+  dbConfig.connectionLimit
+);
+
+// Bulkhead and circuit breaker in front of the pool. At most maxConcurrent
+// statements run at once and maxQueue more may wait; beyond that, or when the
+// breaker is open, requests fail fast with 503 and Retry-After. maxStreams
+// connections of the pool (at most a quarter) are kept for exports, which
+// hold theirs for the whole download, so statements only get the rest.
+const dbPoolSplit = Database.splitPool(
+  dbConfig.connectionLimit,
+  parseInt(process.env.DB_MAX_STREAMS, 10) || 2
+);
+const dbOptions = {
+  acquireTimeoutMs: parseInt(process.env.DB_ACQUIRE_TIMEOUT_MS, 10) || 2000,
+  queryTimeoutMs: parseInt(process.env.DB_QUERY_TIMEOUT_MS, 10) || 10000,
+  maxConcurrent: parseInt(process.env.DB_MAX_CONCURRENT, 10) || dbPoolSplit.maxConcurrent,
+  maxStreams: dbPoolSplit.maxStreams,
+  maxQueue: parseInt(process.env.DB_MAX_QUEUE, 10) || dbConfig.queueLimit,
+  breaker: {
+    failureRateThreshold: parseFloat(process.env.DB_BREAKER_FAILURE_RATE) || 0.5,
+    minimumRequests: parseInt(process.env.DB_BREAKER_MIN_REQUESTS, 10) || 20,
+    openMs: parseInt(process.env.DB_BREAKER_OPEN_MS, 10) || 5000
+  }
 };
 
 let pool;
+let db;
+// All user data access goes through this repository
+let users;
+// Set once the pool is warm and migrations have run; see /ready
+let databaseReady = false;
+let server;
+let shuttingDown = false;
+
+// Concurrent identical user reads share one query; writes reset it
+const userReads = new SingleFlight('users', { budgetMs: REQUEST_DEADLINE_MS });
+
+// Recent search pages, dropped on any write made by this task. Writes made
+// by other tasks show up once the TTL expires.
+const searchCache = new LRUCache({
+  maxEntries: parseInt(process.env.SEARCH_CACHE_MAX_ENTRIES, 10) || 1000,
+  ttlMs: parseInt(process.env.SEARCH_CACHE_TTL_MS, 10) || 5000
+});
+
+// Redis, when REDIS_URL is set, holds state that has to be shared by all
+// tasks: rate limit buckets and idempotent responses
+function createRedisClient() {
+  if (!process.env.REDIS_URL) {
+    if (process.env.NODE_ENV === 'production') {
+      logger.warn('REDIS_URL is not set, rate limits and idempotency keys are per task');
+    }
+    return null;
+  }
+
+  // Required lazily so that ioredis is only needed when Redis is used
+  const Redis = require('ioredis');
+  const client = new Redis(process.env.REDIS_URL, {
+    // Fail fast instead of queueing; callers then carry on without Redis
+    enableOfflineQueue: false,
+    maxRetriesPerRequest: 1,
+    commandTimeout: parseInt(process.env.REDIS_TIMEOUT_MS, 10) || 50
+  });
+  client.on('error', (error) => logger.warn('Redis error', { error: error.message }));
+  return client;
+}
+
+const redis = createRedisClient();
+
+// Retried writes carrying the same Idempotency-Key get the original response
+const idempotentWrite = idempotent({
+  store: redis ? new RedisIdempotencyStore(redis) : new MemoryIdempotencyStore(),
+  ttlMs: parseInt(process.env.IDEMPOTENCY_TTL_MS, 10) || 24 * 60 * 60 * 1000,
+  logger
+});
+
+function invalidateUserReads() {
+  userReads.forget();
+  searchCache.clear();
+}
+
+// Cacheable responses are kept already gzip/brotli encoded, keyed by ETag
+const responseCache = new CompressedResponseCache({
+  threshold: COMPRESSION_THRESHOLD,
+  maxBytes: parseInt(process.env.RESPONSE_CACHE_MAX_BYTES, 10) || 32 * 1024 * 1024
+});
 
 // Initialize database connection pool
 async function initializeDatabase() {
   try {
+    if (DB_DRIVER === 'memory') {
+      users = new MemoryUserRepository({
+        latencyMs: parseFloat(process.env.MEMORY_DB_LATENCY_MS) || 0,
+        jitterMs: parseFloat(process.env.MEMORY_DB_JITTER_MS) || 0,
+        seedUsers: parseInt(process.env.MEMORY_DB_SEED_USERS, 10) || 0
+      });
+      logger.warn('Using the in-memory user repository, data will not be persisted');
+      databaseReady = true;
+      return;
+    }
+
     pool = mysql.createPool(dbConfig);
+    db = new Database(pool, dbOptions);
+    users = new MysqlUserRepository(db);
     
-    // Test the connection
-    const connection = await pool.getConnection();
-    logger.info('Database connected successfully');
-    
-    // Create users table if it doesn't exist
-    await connection.execute(`
-      CREATE TABLE IF NOT EXISTS users (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        name VARCHAR(255) NOT NULL,
-        email VARCHAR(255) UNIQUE NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-      )
-    `);
-    
-    connection.release();
-    logger.info('Database tables initialized');
+    // Also tests the connection
+    const opened = await db.warmUp(DB_POOL_MIN_IDLE);
+    logger.info(`Database connected successfully, ${opened} connections warmed up`);
+
+    // Migrations can instead run as a one-off task (npm run migrate)
+    if (process.env.MIGRATE_ON_START !== 'false') {
+      await migrate(pool, { logger });
+    }
+    databaseReady = true;
   } catch (error) {
     logger.error('Database connection failed:', error);
     process.exit(1);
   }
 }
 
+// Per-route opt-out for responses too small or too frequent to be worth
+// compressing on every request
+function skipCompression(req, res, next) {
+  res.locals.compress = false;
+  next();
+}
+
+// Send a success response with one of the compiled serializers
+function sendSerialized(res, serialize, body, status = 200) {
+  res.status(status).type('json').send(tracing.traceSync('serialize', () => serialize(body)));
+}
+
+// Send an error response. Errors that carry an HTTP status (load shedding,
+// open circuit breaker, ...) keep it and set Retry-After; anything else is
+// logged and reported as a 500.
+function sendError(res, error, logMessage) {
+  if (res.headersSent) {
+    // The deadline middleware already answered with a 504
+    logger.warn(`${logMessage} ${error.message}`, { code: error.code });
+    return;
+  }
+  if (error.status) {
+    logger.warn(`${logMessage} ${error.message}`, { code: error.code });
+    if (error.retryAfter) {
+      res.set('Retry-After', String(error.retryAfter));
+    }
+    return res.status(error.status).json({
+      success: false,
+      message: error.message
+    });
+  }
+
+  logger.error(logMessage, error);
+  return res.status(500).json({
+    success: false,
+    message: 'Internal server error',
+    error: process.env.NODE_ENV === 'development' ? error.message : undefined
+  });
+}
+
+// Metrics are recorded first so request timings include every middleware
+app.use(metrics.middleware);
+app.use(tracing.middleware());
+metrics.registerPoolMetrics(() => pool);
+metrics.registerDatabaseMetrics(() => db);
+
+// While draining, ask clients to close keep-alive connections after the
+// response instead of sending further requests on them. Requests already in
+// flight when the drain started have answered with keep-alive, so their
+// sockets are closed as soon as they go idle; server.close() waits for them.
+app.use((req, res, next) => {
+  if (shuttingDown) {
+    res.set('Connection', 'close');
+  }
+  res.on('finish', () => {
+    if (shuttingDown && server) {
+      setImmediate(() => server.closeIdleConnections());
+    }
+  });
+  next();
+});
+
 // Middleware
-app.use(helmet());
-app.use(compression());
-app.use(cors());
-app.use(express.json({ limit: '10mb' }));
-app.use(express.urlencoded({ extended: true }));
-
-// Request logging
-app.use(morgan('combined', {
-  stream: { write: message => logger.info(message.trim()) }
+app.use(tracing.wrap('helmet', helmet()));
+app.use(tracing.wrap('compression', compression({
+  threshold: COMPRESSION_THRESHOLD,
+  filter: (req, res) => res.locals.compress !== false && compression.filter(req, res)
+})));
+app.use(tracing.wrap('cors', cors()));
+app.use(tracing.wrap('json', express.json({ limit: '10mb' })));
+app.use(tracing.wrap('urlencoded', express.urlencoded({ extended: true })));
+
+// Request logging: structured, with successful requests sampled
+app.use(createRequestLogger(logger, {
+  sampleRate2xx: process.env.LOG_SAMPLE_RATE_2XX !== undefined
+    ? parseFloat(process.env.LOG_SAMPLE_RATE_2XX)
+    : 0.1,
+  slowRequestMs: parseInt(process.env.SLOW_REQUEST_MS, 10) || 1000
 }));
 
-// Rate limiting
-const limiter = rateLimit({
-  windowMs: 15 * 60 * 1000, // 15 minutes
-  max: 100, // limit each IP to 100 requests per windowMs
-  message: 'Too many requests from this IP, please try again later.'
+// Prometheus metrics endpoint (not routed through the ALB, scraped inside the VPC)
+app.get('/metrics', async (req, res) => {
+  try {
+    res.set('Content-Type', metrics.register.contentType);
+    res.end(await metrics.register.metrics());
+  } catch (error) {
+    logger.error('Error collecting metrics:', error);
+    res.status(500).end();
+  }
 });
-app.use(limiter);
+
+// Rate limiting: a token bucket per client IP, refilled at RATE_LIMIT_MAX
+// per RATE_LIMIT_WINDOW_MS
+app.use(tracing.wrap('rateLimit', rateLimit({
+  limiter: new TokenBucketLimiter({
+    store: redis ? new RedisBucketStore(redis) : new MemoryBucketStore(),
+    capacity: RATE_LIMIT_MAX,
+    windowMs: RATE_LIMIT_WINDOW_MS
+  }),
+  logger,
+  message: 'Too many requests from this IP, please try again later.'
+})));
 
 // Health check endpoint
-app.get('/health', (req, res) => {
+app.get('/health', skipCompression, (req, res) => {
   res.status(200).json({
     status: 'healthy',
     timestamp: new Date().toISOString(),
@@ -144,60 +384,276 @@ app.get('/health', (req, res) => {
 
 // API Routes
 
-// Get all users
-app.get('/api/users', async (req, res) => {
+// Readiness check used by the ALB target group and the ECS container health
+// check. Unlike /health it fails until the pool is warm and whenever the
+// database cannot be reached, so traffic only goes to tasks that can serve it.
+app.get('/ready', skipCompression, deadline(READY_DEADLINE_MS), async (req, res) => {
+  if (shuttingDown) {
+    return res.status(503).json({ status: 'draining' });
+  }
+  if (!databaseReady) {
+    return res.status(503).json({ status: 'starting' });
+  }
+
   try {
-    const [rows] = await pool.execute(
-      'SELECT id, name, email, created_at FROM users ORDER BY created_at DESC'
-    );
+    await users.ping();
+    res.status(200).json({ status: 'ready' });
+  } catch (error) {
+    logger.warn('Readiness check failed', { error: error.message, code: error.code });
+    if (!res.headersSent) {
+      res.status(503).json({ status: 'unavailable' });
+    }
+  }
+});
+
+// Get all users, a page of them with ?limit=50&cursor=..., or a specific
+// set with ?ids=1,2,3
+app.get('/api/users', deadline(REQUEST_DEADLINE_MS), async (req, res) => {
+  try {
+    if (req.query.ids !== undefined) {
+      const ids = parseIdList(req.query.ids);
+      if (!ids) {
+        return res.status(400).json({
+          success: false,
+          message: 'ids must be a comma-separated list of positive integers'
+        });
+      }
+      if (ids.length > BATCH_MAX_IDS) {
+        return res.status(400).json({
+          success: false,
+          message: `At most ${BATCH_MAX_IDS} ids can be requested at once`
+        });
+      }
+
+      const rows = await users.findByIds(ids);
+      const found = new Set(rows.map((row) => row.id));
+      return sendSerialized(res, serializers.serializeUsersByIds, {
+        success: true,
+        data: rows,
+        count: rows.length,
+        missing: ids.filter((id) => !found.has(id))
+      });
+    }
+
+    // Pages are newest first; nextCursor fetches the page after this one.
+    // Their ETag comes from the rows returned, so a page never reads the
+    // whole table the way the list's version check does.
+    if (req.query.limit !== undefined || req.query.cursor !== undefined) {
+      const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 50, 1), LIST_MAX_LIMIT);
+      const cursor = req.query.cursor ? String(req.query.cursor) : '';
+      const page = await userReads.do(`page:${limit}|${cursor}`, () => users.listPage({ limit, cursor }));
+      const etag = strongEtag(
+        'users-page',
+        req.originalUrl,
+        page.nextCursor,
+        ...page.data.map((user) => `${user.id}@${timestampOf(user.updated_at)}`)
+      );
+      if (handleConditionalGet(req, res, etag)) {
+        return;
+      }
+      await responseCache.send(req, res, etag, () => serializers.serializeUserPage({
+        success: true,
+        data: page.data,
+        count: page.data.length,
+        nextCursor: page.nextCursor
+      }));
+      return;
+    }
+
+    // The table version is read before the list, so the body sent is never
+    // older than the ETag describing it
+    const version = await userReads.do('version', () => users.version());
+    const etag = strongEtag('users', version.total, timestampOf(version.lastModified), req.originalUrl);
+    if (handleConditionalGet(req, res, etag)) {
+      return;
+    }
+
+    const rows = await userReads.do('list', () => users.list());
     
-    logger.info(\`Retrieved \${rows.length} users\`);
-    res.json({
+    logger.info(`Retrieved ${rows.length} users`);
+    await responseCache.send(req, res, etag, () => serializers.serializeUserList({
       success: true,
       data: rows,
       count: rows.length
+    }));
+  } catch (error) {
+    sendError(res, error, 'Error fetching users:');
+  }
+});
+
+// Export all users as a stream (ndjson, json or csv)
+// Rows are streamed in primary key order so the first byte does not wait for
+// a filesort, and the serializer applies backpressure to the query.
+app.get('/api/users/export', async (req, res) => {
+  const format = String(req.query.format || 'ndjson').toLowerCase();
+  const exportFormat = EXPORT_FORMATS[format];
+
+  if (!exportFormat) {
+    return res.status(400).json({
+      success: false,
+      message: `Unsupported export format. Use one of: ${Object.keys(EXPORT_FORMATS).join(', ')}`
     });
+  }
+
+  let rows;
+  let done;
+  try {
+    ({ rows, done } = await users.streamAll(EXPORT_HIGH_WATER_MARK));
   } catch (error) {
-    logger.error('Error fetching users:', error);
-    res.status(500).json({
+    return sendError(res, error, 'Error starting user export:');
+  }
+
+  const serializer = createExportSerializer(format);
+
+  res.status(200);
+  res.setHeader('Content-Type', exportFormat.contentType);
+  res.setHeader('Content-Disposition', `attachment; filename="users.${exportFormat.extension}"`);
+
+  pipeline(rows, serializer, res, (error) => {
+    done(error);
+    if (error) {
+      logger.error('User export aborted:', error);
+      return;
+    }
+    logger.info(`Exported ${serializer.rowCount} users as ${format}`);
+  });
+});
+
+// Bulk import from a streamed CSV (name,email header) or NDJSON upload.
+// Rows are inserted in chunks of IMPORT_CHUNK_SIZE, each in its own
+// transaction, and the response is an NDJSON stream with one progress line
+// per chunk (including that chunk's row errors) and a final summary line.
+// Chunks already committed stay committed if the upload fails part way;
+// re-uploading the same file reports those rows as duplicates.
+app.post('/api/users/import', skipCompression, (req, res) => {
+  const format = importFormatOf(req);
+
+  if (!format) {
+    return res.status(415).json({
       success: false,
-      message: 'Internal server error',
-      error: process.env.NODE_ENV === 'development' ? error.message : undefined
+      message: `Unsupported import format. Use one of: ${Object.keys(IMPORT_FORMATS).join(', ')}`
+    });
+  }
+
+  const writeLine = (line) => new Promise((resolve) => {
+    if (!res.headersSent) {
+      res.status(200);
+      res.setHeader('Content-Type', 'application/x-ndjson; charset=utf-8');
+    }
+    if (res.write(JSON.stringify(line) + '\\n')) {
+      return resolve();
+    }
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.once('drain', done);
+    res.once('close', done);
+  });
+
+  const parser = createImportParser(format, { maxBytes: IMPORT_MAX_BYTES });
+  const sink = createImportSink(users, {
+    chunkSize: IMPORT_CHUNK_SIZE,
+    onProgress: (stats, chunk) => {
+      invalidateUserReads();
+      return writeLine({ type: 'progress', ...stats, ...chunk });
+    }
+  });
+
+  pipeline(req, parser, sink, async (error) => {
+    if (!error) {
+      logger.info(`Imported ${sink.stats.created} of ${sink.stats.processed} users from ${format}`);
+      res.end(JSON.stringify({ type: 'summary', success: true, ...sink.stats }) + '\\n');
+      return;
+    }
+
+    // A chunk still being inserted commits and reports its progress first
+    await sink.settled();
+    if (!res.headersSent) {
+      // No chunk was committed, so the usual error response applies
+      req.unpipe(parser);
+      res.set('Connection', 'close');
+      return sendError(res, error, 'Error importing users:');
+    }
+
+    logger.error('User import aborted:', error);
+    if (!res.destroyed) {
+      res.end(JSON.stringify({
+        type: 'summary',
+        success: false,
+        message: error.status ? error.message : 'Import aborted',
+        ...sink.stats
+      }) + '\\n');
+    }
+  });
+});
+
+// Search users by email or name prefix, paginated with an opaque cursor
+app.get('/api/users/search', deadline(REQUEST_DEADLINE_MS), async (req, res) => {
+  try {
+    const q = String(req.query.q || '').trim();
+    const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 20, 1), SEARCH_MAX_LIMIT);
+    const cursor = req.query.cursor ? String(req.query.cursor) : '';
+
+    if (!q || q.length > 255) {
+      return res.status(400).json({
+        success: false,
+        message: 'q must be between 1 and 255 characters'
+      });
+    }
+
+    const key = `${q.toLowerCase()}|${limit}|${cursor}`;
+    let page = searchCache.get(key);
+    if (page) {
+      metrics.recordCacheResult('user_search', 'hit');
+    } else {
+      metrics.recordCacheResult('user_search', 'miss');
+      page = await userReads.do(`search:${key}`, () => users.search({ q, limit, cursor }));
+      searchCache.set(key, page);
+    }
+
+    sendSerialized(res, serializers.serializeUserSearch, {
+      success: true,
+      data: page.data,
+      count: page.data.length,
+      nextCursor: page.nextCursor
     });
+  } catch (error) {
+    sendError(res, error, 'Error searching users:');
   }
 });
 
 // Get user by ID
-app.get('/api/users/:id', async (req, res) => {
+app.get('/api/users/:id', deadline(REQUEST_DEADLINE_MS), async (req, res) => {
   try {
     const { id } = req.params;
-    const [rows] = await pool.execute(
-      'SELECT id, name, email, created_at FROM users WHERE id = ?',
-      [id]
-    );
+    const user = await userReads.do(`id:${id}`, () => users.findById(id));
     
-    if (rows.length === 0) {
+    if (!user) {
       return res.status(404).json({
         success: false,
         message: 'User not found'
       });
     }
+
+    const etag = strongEtag('user', user.id, timestampOf(user.updated_at));
+    if (handleConditionalGet(req, res, etag)) {
+      return;
+    }
     
-    res.json({
+    // The schema leaves out updated_at, which is only used for the ETag
+    await responseCache.send(req, res, etag, () => serializers.serializeUserResult({
       success: true,
-      data: rows[0]
-    });
+      data: user
+    }));
   } catch (error) {
-    logger.error('Error fetching user:', error);
-    res.status(500).json({
-      success: false,
-      message: 'Internal server error'
-    });
+    sendError(res, error, 'Error fetching user:');
   }
 });
 
 // Create new user
-app.post('/api/users', async (req, res) => {
+app.post('/api/users', deadline(REQUEST_DEADLINE_MS), idempotentWrite, async (req, res) => {
   try {
     const { name, email } = req.body;
     
@@ -208,46 +664,69 @@ app.post('/api/users', async (req, res) => {
       });
     }
     
-    // Check if user already exists
-    const [existingUsers] = await pool.execute(
-      'SELECT id FROM users WHERE email = ?',
-      [email]
-    );
+    // Null when a user with this email already exists
+    const newUser = await users.create({ name, email });
     
-    if (existingUsers.length > 0) {
+    if (!newUser) {
       return res.status(409).json({
         success: false,
         message: 'User with this email already exists'
       });
     }
+    invalidateUserReads();
     
-    const [result] = await pool.execute(
-      'INSERT INTO users (name, email) VALUES (?, ?)',
-      [name, email]
-    );
-    
-    const [newUser] = await pool.execute(
-      'SELECT id, name, email, created_at FROM users WHERE id = ?',
-      [result.insertId]
-    );
-    
-    logger.info(\`Created new user: \${email}\`);
-    res.status(201).json({
+    logger.info(`Created new user: ${email}`);
+    sendSerialized(res, serializers.serializeUserResult, {
       success: true,
-      data: newUser[0],
+      data: newUser,
       message: 'User created successfully'
-    });
+    }, 201);
   } catch (error) {
-    logger.error('Error creating user:', error);
-    res.status(500).json({
-      success: false,
-      message: 'Internal server error'
-    });
+    sendError(res, error, 'Error creating user:');
+  }
+});
+
+// Create users in bulk with one multi-row INSERT
+// Rows are reported individually: created, duplicates (email already taken)
+// and errors (invalid or repeated within the batch). Partial success is 207.
+app.post('/api/users/batch', deadline(BATCH_DEADLINE_MS), idempotentWrite, async (req, res) => {
+  try {
+    const items = Array.isArray(req.body) ? req.body : req.body.users;
+
+    if (!Array.isArray(items) || items.length === 0) {
+      return res.status(400).json({
+        success: false,
+        message: 'A non-empty users array is required'
+      });
+    }
+    if (items.length > BATCH_MAX_SIZE) {
+      return res.status(413).json({
+        success: false,
+        message: `At most ${BATCH_MAX_SIZE} users can be created per batch`
+      });
+    }
+
+    const { valid, errors } = validateUserRows(items);
+    const { created, duplicates } = await users.insertBatch(valid);
+    if (created.length > 0) {
+      invalidateUserReads();
+    }
+
+    logger.info(`Batch created ${created.length} of ${items.length} users`);
+    sendSerialized(res, serializers.serializeUserBatch, {
+      success: true,
+      data: created,
+      count: created.length,
+      duplicates,
+      errors
+    }, duplicates.length === 0 && errors.length === 0 ? 201 : 207);
+  } catch (error) {
+    sendError(res, error, 'Error creating users in batch:');
   }
 });
 
 // Update user
-app.put('/api/users/:id', async (req, res) => {
+app.put('/api/users/:id', deadline(REQUEST_DEADLINE_MS), idempotentWrite, async (req, res) => {
   try {
     const { id } = req.params;
     const { name, email } = req.body;
@@ -259,119 +738,3676 @@ app.put('/api/users/:id', async (req, res) => {
       });
     }
     
-    const [result] = await pool.execute(
-      'UPDATE users SET name = ?, email = ? WHERE id = ?',
-      [name, email, id]
-    );
+    const updatedUser = await users.update(id, { name, email });
+    invalidateUserReads();
     
-    if (result.affectedRows === 0) {
+    if (!updatedUser) {
       return res.status(404).json({
         success: false,
         message: 'User not found'
       });
     }
     
-    const [updatedUser] = await pool.execute(
-      'SELECT id, name, email, created_at FROM users WHERE id = ?',
-      [id]
-    );
-    
-    logger.info(\`Updated user: \${id}\`);
-    res.json({
+    logger.info(`Updated user: ${id}`);
+    sendSerialized(res, serializers.serializeUserResult, {
       success: true,
-      data: updatedUser[0],
+      data: updatedUser,
       message: 'User updated successfully'
     });
   } catch (error) {
-    logger.error('Error updating user:', error);
-    res.status(500).json({
-      success: false,
-      message: 'Internal server error'
-    });
+    sendError(res, error, 'Error updating user:');
   }
 });
 
 // Delete user
-app.delete('/api/users/:id', async (req, res) => {
+app.delete('/api/users/:id', deadline(REQUEST_DEADLINE_MS), idempotentWrite, async (req, res) => {
   try {
     const { id } = req.params;
     
-    const [result] = await pool.execute(
-      'DELETE FROM users WHERE id = ?',
-      [id]
-    );
+    const deleted = await users.remove(id);
+    invalidateUserReads();
     
-    if (result.affectedRows === 0) {
+    if (!deleted) {
       return res.status(404).json({
         success: false,
         message: 'User not found'
       });
     }
-    
-    logger.info(\`Deleted user: \${id}\`);
-    res.json({
-      success: true,
-      message: 'User deleted successfully'
-    });
-  } catch (error) {
-    logger.error('Error deleting user:', error);
-    res.status(500).json({
-      success: false,
-      message: 'Internal server error'
-    });
+    
+    logger.info(`Deleted user: ${id}`);
+    res.json({
+      success: true,
+      message: 'User deleted successfully'
+    });
+  } catch (error) {
+    sendError(res, error, 'Error deleting user:');
+  }
+});
+
+// Error handling middleware
+app.use((err, req, res, next) => {
+  sendError(res, err, 'Unhandled error:');
+});
+
+// 404 handler
+app.use('*', (req, res) => {
+  res.status(404).json({
+    success: false,
+    message: 'Route not found'
+  });
+});
+
+// Graceful shutdown: stop accepting connections, fail readiness, let
+// in-flight requests finish until SHUTDOWN_TIMEOUT_MS, then close any
+// remaining sockets and the database pool.
+async function shutdown(signal) {
+  if (shuttingDown) {
+    return;
+  }
+  shuttingDown = true;
+  logger.info(`${signal} received, draining connections`);
+
+  if (server) {
+    const deadline = setTimeout(() => {
+      logger.warn(`Requests still in flight after ${SHUTDOWN_TIMEOUT_MS}ms, closing connections`);
+      server.closeAllConnections();
+    }, SHUTDOWN_TIMEOUT_MS);
+
+    const closed = new Promise((resolve) => server.close(resolve));
+    server.closeIdleConnections();
+    await closed;
+    clearTimeout(deadline);
+    logger.info('HTTP server closed');
+  }
+
+  if (pool) {
+    await pool.end();
+  }
+  if (redis) {
+    await redis.quit().catch(() => {});
+  }
+  await tracing.shutdown();
+  process.exit(0);
+}
+
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+
+// Start server
+// Listens before the database is initialized so /health and /metrics answer
+// during warm-up; /ready keeps traffic away until it is done
+async function startServer() {
+  server = app.listen(PORT, '0.0.0.0', () => {
+    logger.info(`Server running on port ${PORT}`);
+    logger.info(`Environment: ${process.env.NODE_ENV || 'development'}`);
+  });
+  // Node's 5 minute default would cut off large streamed imports
+  server.requestTimeout = IMPORT_REQUEST_TIMEOUT_MS;
+  // Idle keep-alive connections must outlive the ALB's idle timeout, or the
+  // ALB can reuse a socket just as Node closes it and return a 502
+  server.keepAliveTimeout = KEEP_ALIVE_TIMEOUT_MS;
+  server.headersTimeout = KEEP_ALIVE_TIMEOUT_MS + 1000;
+
+  await initializeDatabase();
+}
+
+startServer().catch(error => {
+  logger.error('Failed to start server:', error);
+  process.exit(1);
+});
+
+module.exports = app;
+'''
+
+project_files["application/backend/lib/export.js"] = '''const { Transform } = require('stream');
+const { serializeUser } = require('./serializers');
+
+// Supported export formats and their response headers
+const EXPORT_FORMATS = {
+  ndjson: { contentType: 'application/x-ndjson; charset=utf-8', extension: 'ndjson' },
+  json: { contentType: 'application/json; charset=utf-8', extension: 'json' },
+  csv: { contentType: 'text/csv; charset=utf-8', extension: 'csv' }
+};
+
+const CSV_COLUMNS = ['id', 'name', 'email', 'created_at'];
+
+// Serialized rows are batched into chunks of roughly this size before being
+// pushed downstream, so a large export is not written one tiny chunk per row.
+const CHUNK_SIZE = 64 * 1024;
+
+function csvField(value) {
+  if (value === null || value === undefined) {
+    return '';
+  }
+  const text = value instanceof Date ? value.toISOString() : String(value);
+  return /[",\\r\\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+const formatters = {
+  ndjson: {
+    header: () => '',
+    row: (row) => serializeUser(row) + '\\n',
+    footer: () => ''
+  },
+  json: {
+    header: () => '{"success":true,"data":[',
+    row: (row, index) => (index === 0 ? '' : ',') + serializeUser(row),
+    footer: (count) => `],"count":${count}}`
+  },
+  csv: {
+    header: () => CSV_COLUMNS.join(',') + '\\n',
+    row: (row) => CSV_COLUMNS.map((column) => csvField(row[column])).join(',') + '\\n',
+    footer: () => ''
+  }
+};
+
+// Transform stream turning row objects into serialized text for the given format.
+// It is object mode on the writable side only, so backpressure from the HTTP
+// response propagates back to the MySQL query stream.
+function createExportSerializer(format) {
+  const formatter = formatters[format];
+  if (!formatter) {
+    throw new Error(`Unsupported export format: ${format}`);
+  }
+
+  let buffer = formatter.header();
+
+  const serializer = new Transform({
+    writableObjectMode: true,
+    transform(row, encoding, callback) {
+      buffer += formatter.row(row, serializer.rowCount);
+      serializer.rowCount += 1;
+      if (buffer.length >= CHUNK_SIZE) {
+        const chunk = buffer;
+        buffer = '';
+        return callback(null, chunk);
+      }
+      callback();
+    },
+    flush(callback) {
+      callback(null, buffer + formatter.footer(serializer.rowCount));
+    }
+  });
+
+  serializer.rowCount = 0;
+  return serializer;
+}
+
+module.exports = {
+  EXPORT_FORMATS,
+  createExportSerializer
+};
+'''
+
+project_files["application/backend/lib/import.js"] = '''const { Transform, Writable } = require('stream');
+const { StringDecoder } = require('string_decoder');
+const { HttpError } = require('./errors');
+const { validateUserRows } = require('./user-batch');
+
+// Supported upload formats, keyed by name and by request Content-Type
+const IMPORT_FORMATS = {
+  csv: ['text/csv', 'application/csv'],
+  ndjson: ['application/x-ndjson', 'application/jsonl', 'application/json-seq']
+};
+
+const CSV_COLUMNS = ['name', 'email'];
+
+function importFormatOf(req) {
+  if (req.query.format) {
+    const format = String(req.query.format).toLowerCase();
+    return IMPORT_FORMATS[format] ? format : null;
+  }
+  const contentType = (req.get('content-type') || '').split(';')[0].trim().toLowerCase();
+  return Object.keys(IMPORT_FORMATS).find((format) => IMPORT_FORMATS[format].includes(contentType)) || null;
+}
+
+// Incremental RFC 4180 parser. Quoted fields may contain commas, quotes and
+// newlines; state is carried across chunks so records can span them.
+class CsvRecordParser {
+  constructor(maxRecordBytes) {
+    this.maxRecordBytes = maxRecordBytes;
+    this.field = '';
+    this.record = [];
+    this.recordBytes = 0;
+    this.inQuotes = false;
+    this.quotePending = false;
+  }
+
+  // Returns the complete records found in text
+  write(text) {
+    const records = [];
+    for (let i = 0; i < text.length; i++) {
+      const char = text[i];
+
+      if (this.quotePending) {
+        this.quotePending = false;
+        if (char === '"') {
+          this.field += '"';
+          continue;
+        }
+        this.inQuotes = false;
+      }
+
+      if (this.inQuotes) {
+        if (char === '"') {
+          this.quotePending = true;
+        } else {
+          this.field += char;
+        }
+      } else if (char === '"' && this.field === '') {
+        this.inQuotes = true;
+      } else if (char === ',') {
+        this.endField();
+      } else if (char === '\\n') {
+        this.endRecord(records);
+      } else if (char !== '\\r') {
+        this.field += char;
+      }
+
+      this.recordBytes += 1;
+      if (this.recordBytes > this.maxRecordBytes) {
+        throw new HttpError(413, `CSV record exceeds ${this.maxRecordBytes} bytes`, { code: 'IMPORT_ROW_TOO_LARGE' });
+      }
+    }
+    return records;
+  }
+
+  end() {
+    const records = [];
+    if (this.inQuotes && !this.quotePending) {
+      throw new HttpError(400, 'Unterminated quoted field at end of CSV', { code: 'IMPORT_INVALID_CSV' });
+    }
+    this.quotePending = false;
+    this.inQuotes = false;
+    if (this.field !== '' || this.record.length > 0) {
+      this.endRecord(records);
+    }
+    return records;
+  }
+
+  endField() {
+    this.record.push(this.field);
+    this.field = '';
+  }
+
+  endRecord(records) {
+    this.endField();
+    // Blank lines are skipped
+    if (this.record.length > 1 || this.record[0] !== '') {
+      records.push(this.record);
+    }
+    this.record = [];
+    this.recordBytes = 0;
+  }
+}
+
+// Transform turning the raw upload into user objects, one per row. It is
+// object mode on the readable side only, so a slow consumer stops the
+// request body from being read. Unparseable rows are passed on as Error
+// instances so they are reported in order with the other row errors.
+function createImportParser(format, options = {}) {
+  const maxRowBytes = options.maxRowBytes || 64 * 1024;
+  const maxBytes = options.maxBytes || Infinity;
+  const decoder = new StringDecoder('utf8');
+  let bytes = 0;
+  let toRows;
+  let finish;
+
+  if (format === 'csv') {
+    const csv = new CsvRecordParser(maxRowBytes);
+    let columns = null;
+
+    const toUsers = (records) => records.flatMap((record) => {
+      if (!columns) {
+        columns = record.map((column) => column.trim().toLowerCase());
+        const missing = CSV_COLUMNS.filter((column) => !columns.includes(column));
+        if (missing.length > 0) {
+          throw new HttpError(400, `CSV header is missing column(s): ${missing.join(', ')}`, { code: 'IMPORT_INVALID_CSV' });
+        }
+        return [];
+      }
+      const user = {};
+      columns.forEach((column, i) => {
+        user[column] = record[i];
+      });
+      return [user];
+    });
+
+    toRows = (text) => toUsers(csv.write(text));
+    finish = () => toUsers(csv.end());
+  } else if (format === 'ndjson') {
+    let partial = '';
+
+    const parseLine = (line) => {
+      if (line.trim() === '') {
+        return [];
+      }
+      try {
+        return [JSON.parse(line)];
+      } catch (error) {
+        return [new Error('Invalid JSON')];
+      }
+    };
+
+    toRows = (text) => {
+      const lines = (partial + text).split('\\n');
+      partial = lines.pop();
+      if (partial.length > maxRowBytes) {
+        throw new HttpError(413, `NDJSON line exceeds ${maxRowBytes} bytes`, { code: 'IMPORT_ROW_TOO_LARGE' });
+      }
+      return lines.flatMap(parseLine);
+    };
+    finish = () => parseLine(partial);
+  } else {
+    throw new Error(`Unsupported import format: ${format}`);
+  }
+
+  const pushAll = (stream, rows) => {
+    for (const row of rows) {
+      stream.push(row);
+    }
+  };
+
+  return new Transform({
+    readableObjectMode: true,
+    decodeStrings: false,
+    transform(chunk, encoding, callback) {
+      bytes += chunk.length;
+      if (bytes > maxBytes) {
+        return callback(new HttpError(413, `Upload exceeds ${maxBytes} bytes`, { code: 'IMPORT_TOO_LARGE' }));
+      }
+      try {
+        pushAll(this, toRows(decoder.write(chunk)));
+        callback();
+      } catch (error) {
+        callback(error);
+      }
+    },
+    flush(callback) {
+      try {
+        pushAll(this, toRows(decoder.end()));
+        pushAll(this, finish());
+        callback();
+      } catch (error) {
+        callback(error);
+      }
+    }
+  });
+}
+
+// Writable collecting parsed rows into chunks that are each inserted in one
+// transaction through the user repository. The write callback is held while a chunk is being inserted
+// (and while onProgress waits for the response to drain), which is what
+// applies backpressure to the upload. Only one chunk is buffered at a time,
+// and per-row errors are handed to onProgress instead of being accumulated.
+// If the pipeline fails while a chunk is being inserted, that chunk still
+// completes; settled() waits for it, so stats then covers every committed row.
+function createImportSink(users, options = {}) {
+  const chunkSize = options.chunkSize || 1000;
+  const onProgress = options.onProgress || (() => {});
+  let rows = [];
+  let flushing = null;
+
+  const sink = new Writable({
+    objectMode: true,
+    write(row, encoding, callback) {
+      rows.push(row);
+      if (rows.length < chunkSize) {
+        return callback();
+      }
+      sink.flushChunk().then(() => callback(), callback);
+    },
+    final(callback) {
+      sink.flushChunk().then(() => callback(), callback);
+    }
+  });
+
+  sink.stats = { processed: 0, created: 0, duplicates: 0, failed: 0, chunks: 0 };
+
+  sink.flushChunk = () => {
+    flushing = insertChunk();
+    return flushing;
+  };
+
+  sink.settled = () => (flushing ? flushing.then(() => {}, () => {}) : Promise.resolve());
+
+  const insertChunk = async () => {
+    if (rows.length === 0) {
+      return;
+    }
+    const chunk = rows;
+    const startIndex = sink.stats.processed;
+    rows = [];
+
+    const { valid, errors } = validateUserRows(chunk, startIndex);
+    const { created, duplicates } = await users.insertBatch(valid);
+
+    sink.stats.processed += chunk.length;
+    sink.stats.created += created.length;
+    sink.stats.duplicates += duplicates.length;
+    sink.stats.failed += errors.length;
+    sink.stats.chunks += 1;
+
+    await onProgress({ ...sink.stats }, { duplicates, errors });
+  };
+
+  return sink;
+}
+
+module.exports = {
+  IMPORT_FORMATS,
+  importFormatOf,
+  createImportParser,
+  createImportSink
+};
+'''
+
+project_files["application/backend/lib/migrate.js"] = '''const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+
+const MIGRATIONS_DIR = path.join(__dirname, '..', 'migrations');
+const LOCK_NAME = 'schema_migrations';
+
+// Errors from re-applying DDL that already exists, e.g. indexes created by
+// scripts/init.sql on local databases. The migration is recorded as applied.
+const ALREADY_APPLIED_CODES = new Set([
+  'ER_DUP_KEYNAME',
+  'ER_DUP_FIELDNAME',
+  'ER_TABLE_EXISTS_ERROR'
+]);
+
+// Marks a migration that blocks writes while it runs (e.g. a table copy).
+// Tasks starting up do not apply it or anything after it; it is run out of
+// band with `npm run migrate` in a maintenance window.
+const OFFLINE_MARKER = /^--\\s*migrate:\\s*offline\\s*$/m;
+
+// Migration files are named NNN_description.sql and applied in version order
+function loadMigrations(directory = MIGRATIONS_DIR) {
+  return fs.readdirSync(directory)
+    .filter((file) => /^\\d+_.+\\.sql$/.test(file))
+    .map((file) => {
+      const sql = fs.readFileSync(path.join(directory, file), 'utf8');
+      return {
+        version: parseInt(file, 10),
+        name: file,
+        checksum: crypto.createHash('sha256').update(sql).digest('hex'),
+        offline: OFFLINE_MARKER.test(sql),
+        statements: splitStatements(sql)
+      };
+    })
+    .sort((a, b) => a.version - b.version);
+}
+
+// One statement per query; the pool does not enable multipleStatements
+function splitStatements(sql) {
+  return sql
+    .split(/;\\s*(?:\\r?\\n|$)/)
+    .map((statement) => statement.replace(/^\\s*--.*$/gm, '').trim())
+    .filter(Boolean);
+}
+
+// Returns applied versions, or null when schema_migrations does not exist yet
+async function appliedVersions(connection) {
+  try {
+    const [rows] = await connection.query('SELECT version, checksum FROM schema_migrations');
+    return new Map(rows.map((row) => [row.version, row.checksum]));
+  } catch (error) {
+    if (error.code === 'ER_NO_SUCH_TABLE') {
+      return null;
+    }
+    throw error;
+  }
+}
+
+async function applyMigration(connection, migration, logger) {
+  const startedAt = Date.now();
+  for (const statement of migration.statements) {
+    try {
+      await connection.query(statement);
+    } catch (error) {
+      if (!ALREADY_APPLIED_CODES.has(error.code)) {
+        throw error;
+      }
+      logger.warn(`Migration ${migration.name}: ${error.message}, skipping statement`);
+    }
+  }
+  const durationMs = Date.now() - startedAt;
+  await connection.query(
+    'INSERT INTO schema_migrations (version, name, checksum, duration_ms) VALUES (?, ?, ?, ?)',
+    [migration.version, migration.name, migration.checksum, durationMs]
+  );
+  logger.info(`Applied migration ${migration.name} in ${durationMs}ms`);
+}
+
+// Brings the schema up to date. The common case, a task starting against an
+// already migrated database, is one SELECT and no DDL. Otherwise a MySQL
+// advisory lock ensures only one of several starting tasks migrates while
+// the others wait for it and then find nothing left to do. Offline
+// migrations, and those after them, are only applied with options.offline.
+async function migrate(pool, options = {}) {
+  const logger = options.logger || console;
+  const lockTimeoutSeconds = options.lockTimeoutSeconds || 300;
+  const migrations = loadMigrations(options.directory);
+  const connection = await pool.getConnection();
+  let warned = false;
+
+  const pendingIn = (applied) => {
+    const pending = migrations.filter((migration) => {
+      if (!applied || !applied.has(migration.version)) {
+        return true;
+      }
+      if (applied.get(migration.version) !== migration.checksum) {
+        logger.warn(`Migration ${migration.name} changed after it was applied`);
+      }
+      return false;
+    });
+    const offline = options.offline ? -1 : pending.findIndex((migration) => migration.offline);
+    if (offline === -1) {
+      return pending;
+    }
+    if (!warned) {
+      warned = true;
+      logger.warn(`Migration ${pending[offline].name} blocks writes and is not applied at startup; ` +
+        `run npm run migrate out of band (${pending.length - offline} migration(s) left pending)`);
+    }
+    return pending.slice(0, offline);
+  };
+
+  try {
+    if (pendingIn(await appliedVersions(connection)).length === 0) {
+      logger.info('Database schema is up to date');
+      return [];
+    }
+
+    const [[{ locked }]] = await connection.query(
+      'SELECT GET_LOCK(?, ?) AS locked',
+      [LOCK_NAME, lockTimeoutSeconds]
+    );
+    if (locked !== 1) {
+      throw new Error(`Timed out waiting for the ${LOCK_NAME} lock`);
+    }
+
+    try {
+      await connection.query(`
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+          version INT PRIMARY KEY,
+          name VARCHAR(255) NOT NULL,
+          checksum CHAR(64) NOT NULL,
+          duration_ms INT NOT NULL,
+          applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+      `);
+
+      // Re-read under the lock: another task may have migrated meanwhile
+      const pending = pendingIn(await appliedVersions(connection));
+      for (const migration of pending) {
+        await applyMigration(connection, migration, logger);
+      }
+      return pending.map((migration) => migration.name);
+    } finally {
+      await connection.query('SELECT RELEASE_LOCK(?)', [LOCK_NAME]);
+    }
+  } finally {
+    connection.release();
+  }
+}
+
+module.exports = {
+  migrate,
+  loadMigrations
+};
+
+// `npm run migrate` runs migrations without starting the server
+if (require.main === module) {
+  require('dotenv').config();
+  const mysql = require('mysql2/promise');
+
+  const pool = mysql.createPool({
+    host: process.env.DB_HOST || 'localhost',
+    user: process.env.DB_USER || 'admin',
+    password: process.env.DB_PASSWORD || 'password',
+    database: process.env.DB_NAME || 'webapp_dev',
+    connectionLimit: 1
+  });
+
+  migrate(pool, { offline: true })
+    .then((applied) => console.log(`Applied ${applied.length} migration(s)`))
+    .catch((error) => {
+      console.error('Migration failed:', error);
+      process.exitCode = 1;
+    })
+    .finally(() => pool.end());
+}
+'''
+
+project_files["application/backend/migrations/001_create_users.sql"] = '''-- Users table as originally created by server.js on startup
+CREATE TABLE IF NOT EXISTS users (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  name VARCHAR(255) NOT NULL,
+  email VARCHAR(255) UNIQUE NOT NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+'''
+
+project_files["application/backend/migrations/002_add_users_timestamp_indexes.sql"] = '''-- GET /api/users sorts by created_at and its ETag reads MAX(updated_at).
+-- Tables created by older releases lack these indexes, so both queries
+-- filesort or scan. Lookups by email already use the UNIQUE index.
+-- Built online so a deploy does not block writes to users.
+CREATE INDEX idx_created_at ON users (created_at) ALGORITHM=INPLACE LOCK=NONE;
+CREATE INDEX idx_updated_at ON users (updated_at) ALGORITHM=INPLACE LOCK=NONE;
+'''
+
+project_files["application/backend/migrations/003_add_users_name_index.sql"] = '''-- Name prefix search (GET /api/users/search) ranges over this index.
+-- Email prefixes already use the UNIQUE index on email.
+CREATE INDEX idx_name ON users (name) ALGORITHM=INPLACE LOCK=NONE;
+'''
+
+project_files["application/backend/migrations/004_users_updated_at_microseconds.sql"] = '''-- The list ETag is built from COUNT(*) and MAX(updated_at). With whole
+-- seconds, two writes within the same second left it unchanged and clients
+-- got 304s for stale lists; with microseconds every write moves it.
+-- Changing the column type rebuilds the table, which blocks writes to users
+-- for the whole copy (INPLACE is not available for this change). It is
+-- therefore not applied by tasks starting during a rolling deploy: run
+-- `npm run migrate` (e.g. as a one-off ECS task) in a maintenance window.
+-- Until then ETags keep whole-second precision.
+-- migrate: offline
+ALTER TABLE users MODIFY updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6), ALGORITHM=COPY, LOCK=SHARED;
+'''
+
+project_files["application/backend/lib/metrics.js"] = '''const client = require('prom-client');
+const { routeLabel } = require('./request-context');
+
+const register = new client.Registry();
+register.setDefaultLabels({ service: '3tier-backend' });
+
+// Process metrics, including event loop lag percentiles and GC pause durations
+client.collectDefaultMetrics({ register });
+
+const httpRequestDuration = new client.Histogram({
+  name: 'http_request_duration_seconds',
+  help: 'HTTP request latency by route',
+  labelNames: ['method', 'route', 'status_code'],
+  buckets: [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+  registers: [register]
+});
+
+const httpRequestsInFlight = new client.Gauge({
+  name: 'http_requests_in_flight',
+  help: 'HTTP requests currently being served',
+  labelNames: ['method'],
+  registers: [register]
+});
+
+const cacheOperations = new client.Counter({
+  name: 'cache_operations_total',
+  help: 'Cache lookups by cache name and result',
+  labelNames: ['cache', 'result'],
+  registers: [register]
+});
+
+function middleware(req, res, next) {
+  const method = req.method;
+  const endTimer = httpRequestDuration.startTimer();
+  httpRequestsInFlight.inc({ method });
+
+  let recorded = false;
+  const record = () => {
+    if (recorded) {
+      return;
+    }
+    recorded = true;
+    httpRequestsInFlight.dec({ method });
+    endTimer({ method, route: routeLabel(req), status_code: res.statusCode });
+  };
+
+  res.once('finish', record);
+  res.once('close', record);
+  next();
+}
+
+// Pool gauges are read from the mysql2 pool at scrape time. The promise
+// pool wraps the callback pool, which keeps the connection bookkeeping.
+function registerPoolMetrics(getPool) {
+  const poolState = () => {
+    const promisePool = getPool();
+    return promisePool && promisePool.pool;
+  };
+
+  new client.Gauge({
+    name: 'db_pool_connections',
+    help: 'Database pool connections by state',
+    labelNames: ['state'],
+    registers: [register],
+    collect() {
+      const pool = poolState();
+      if (!pool) {
+        return;
+      }
+      const total = pool._allConnections.length;
+      const idle = pool._freeConnections.length;
+      this.set({ state: 'active' }, total - idle);
+      this.set({ state: 'idle' }, idle);
+    }
+  });
+
+  new client.Gauge({
+    name: 'db_pool_pending_acquisitions',
+    help: 'Requests waiting for a database connection',
+    registers: [register],
+    collect() {
+      const pool = poolState();
+      if (pool) {
+        this.set(pool._connectionQueue.length);
+      }
+    }
+  });
+
+  new client.Gauge({
+    name: 'db_pool_max_connections',
+    help: 'Configured database pool size',
+    registers: [register],
+    collect() {
+      const pool = poolState();
+      if (pool) {
+        this.set(pool.config.connectionLimit);
+      }
+    }
+  });
+}
+
+const dbRejections = new client.Counter({
+  name: 'db_requests_rejected_total',
+  help: 'Database calls rejected by load shedding, by reason',
+  labelNames: ['reason'],
+  registers: [register]
+});
+
+// Bulkhead and circuit breaker state of the Database wrapper
+function registerDatabaseMetrics(getDb) {
+  new client.Gauge({
+    name: 'db_bulkhead_operations',
+    help: 'Database operations in the bulkhead by state',
+    labelNames: ['state'],
+    registers: [register],
+    collect() {
+      const db = getDb();
+      if (db) {
+        this.set({ state: 'active' }, db.bulkhead.active);
+        this.set({ state: 'queued' }, db.bulkhead.queue.length);
+      }
+    }
+  });
+
+  new client.Gauge({
+    name: 'db_circuit_breaker_open',
+    help: '1 when the database circuit breaker is open or half-open',
+    registers: [register],
+    collect() {
+      const db = getDb();
+      if (db) {
+        this.set(db.breaker.state === 'closed' ? 0 : 1);
+      }
+    }
+  });
+}
+
+function recordDbRejection(reason) {
+  dbRejections.inc({ reason: reason || 'unknown' });
+}
+
+// Coalescing ratio = shared / (leader + shared)
+const singleFlightCalls = new client.Counter({
+  name: 'singleflight_calls_total',
+  help: 'Coalesced reads: leader calls hit the database, shared calls joined one in flight',
+  labelNames: ['group', 'result'],
+  registers: [register]
+});
+
+function recordSingleFlight(group, result) {
+  singleFlightCalls.inc({ group, result });
+}
+
+const rateLimitDecisions = new client.Counter({
+  name: 'rate_limit_decisions_total',
+  help: 'Rate limiter decisions: allowed, limited, or error when the store was unavailable',
+  labelNames: ['result'],
+  registers: [register]
+});
+
+function recordRateLimit(result) {
+  rateLimitDecisions.inc({ result });
+}
+
+const traceSpans = new client.Counter({
+  name: 'trace_spans_total',
+  help: 'Ended trace spans: exported, failed (export error) or dropped (export queue full)',
+  labelNames: ['result'],
+  registers: [register]
+});
+
+function recordSpans(result, count) {
+  traceSpans.inc({ result }, count);
+}
+
+// Caches report every lookup as hit, miss or another cache-specific result
+function recordCacheResult(cache, result) {
+  cacheOperations.inc({ cache, result });
+}
+
+module.exports = {
+  register,
+  middleware,
+  registerPoolMetrics,
+  registerDatabaseMetrics,
+  recordDbRejection,
+  recordSingleFlight,
+  recordCacheResult,
+  recordRateLimit,
+  recordSpans
+};
+'''
+
+project_files["application/backend/lib/request-context.js"] = '''const { AsyncLocalStorage } = require('async_hooks');
+
+// Per-request state (timings, deadlines, ...) that has to be reachable from
+// code which does not receive req, such as the database helpers.
+const storage = new AsyncLocalStorage();
+
+function run(context, callback) {
+  return storage.run(context, callback);
+}
+
+function current() {
+  return storage.getStore();
+}
+
+function addDbTime(elapsedMs) {
+  const context = storage.getStore();
+  if (context) {
+    context.dbTimeMs += elapsedMs;
+  }
+}
+
+// Route template for a request, e.g. /api/users/:id. Unmatched paths share
+// one label so that scanners cannot blow up metric series or log cardinality.
+function routeLabel(req) {
+  if (req.route && req.route.path) {
+    return req.baseUrl + req.route.path;
+  }
+  return 'unmatched';
+}
+
+module.exports = {
+  run,
+  current,
+  addDbTime,
+  routeLabel
+};
+'''
+
+project_files["application/backend/lib/db.js"] = '''const requestContext = require('./request-context');
+const metrics = require('./metrics');
+const tracing = require('./tracing');
+const { Bulkhead, CircuitBreaker } = require('./bulkhead');
+const { remainingMs } = require('./deadline');
+const { ServiceUnavailableError, GatewayTimeoutError } = require('./errors');
+
+// mysql2 reports a driver-side query timeout with this code; the connection
+// is left mid-protocol and must not go back to the pool.
+const QUERY_TIMEOUT_CODE = 'PROTOCOL_SEQUENCE_TIMEOUT';
+
+// MySQL aborted a SELECT that ran past its MAX_EXECUTION_TIME hint. The
+// connection stays usable.
+const EXECUTION_TIME_CODE = 'ER_QUERY_TIMEOUT';
+
+// SELECTs carry a MAX_EXECUTION_TIME hint so the server stops them at the
+// budget; the driver timeout is a backstop this much later. Hints are
+// rounded down to HINT_STEP_MS so that prepared statements, which mysql2
+// caches by SQL text, only come in a few variants.
+const DRIVER_GRACE_MS = 1000;
+const HINT_STEP_MS = 500;
+
+// Errors that indicate the database is slow or unreachable, as opposed to a
+// bad statement or a constraint violation. Only these trip the breaker.
+const UNAVAILABLE_CODES = new Set([
+  QUERY_TIMEOUT_CODE,
+  EXECUTION_TIME_CODE,
+  'DB_ACQUIRE_TIMEOUT',
+  'BULKHEAD_TIMEOUT',
+  'ECONNREFUSED',
+  'ECONNRESET',
+  'ETIMEDOUT',
+  'PROTOCOL_CONNECTION_LOST',
+  'ER_CON_COUNT_ERROR'
+]);
+
+function isUnavailableError(error) {
+  return Boolean(error.fatal) || UNAVAILABLE_CODES.has(error.code);
+}
+
+function withExecutionHint(sql, budgetMs) {
+  if (!/^\\s*SELECT\\s/i.test(sql) || /\\bFOR\\s+UPDATE\\b/i.test(sql)) {
+    return null;
+  }
+  const hintMs = Math.max(HINT_STEP_MS, Math.floor(budgetMs / HINT_STEP_MS) * HINT_STEP_MS);
+  return sql.replace(/^\\s*SELECT\\s/i, `SELECT /*+ MAX_EXECUTION_TIME(${hintMs}) */ `);
+}
+
+// Thin wrapper around the mysql2 promise pool. Every statement issued by the
+// API goes through here so that per-request database time can be recorded
+// and waits for a connection or a result are bounded. Statements pass through
+// a circuit breaker and a bulkhead so that a slow database turns into fast
+// 503s rather than a growing queue of requests.
+class Database {
+  constructor(pool, options = {}) {
+    this.pool = pool;
+    this.acquireTimeoutMs = options.acquireTimeoutMs || 2000;
+    this.queryTimeoutMs = options.queryTimeoutMs || 10000;
+    this.bulkhead = new Bulkhead({
+      maxConcurrent: options.maxConcurrent,
+      maxQueue: options.maxQueue,
+      queueTimeoutMs: this.acquireTimeoutMs
+    });
+    this.breaker = new CircuitBreaker({
+      ...options.breaker,
+      isFailure: isUnavailableError
+    });
+    // Connections held by streams (exports) for as long as the client reads.
+    // There is no queue: when all are taken, a new stream gets a 503 at once.
+    this.streams = new Bulkhead({ maxConcurrent: options.maxStreams || 2, maxQueue: 0 });
+  }
+
+  // Splits a pool of poolSize connections between streams and statements.
+  // Streams get the requested number but at most a quarter of the pool (and
+  // at least one), so statements always keep most of it; the statement
+  // bulkhead gets the rest, which leaves stream connections free in the pool.
+  static splitPool(poolSize, requestedStreams = 2) {
+    const maxStreams = Math.max(Math.min(requestedStreams, Math.floor(poolSize / 4)), 1);
+    return { maxStreams, maxConcurrent: Math.max(poolSize - maxStreams, 1) };
+  }
+
+  // Prepared statement (server-side placeholders)
+  execute(sql, params) {
+    return this.withConnection((connection) => this.statement(connection, 'execute', sql, params));
+  }
+
+  // Text protocol query, needed for IN (?) list and VALUES ? expansion
+  query(sql, params) {
+    return this.withConnection((connection) => this.statement(connection, 'query', sql, params));
+  }
+
+  // Runs work(tx) in a transaction on a single connection. tx exposes
+  // execute() and query(); the transaction commits when work resolves and
+  // rolls back when it throws.
+  transaction(work) {
+    return this.withConnection(async (connection) => {
+      await connection.beginTransaction();
+      try {
+        const result = await work({
+          execute: (sql, params) => this.statement(connection, 'execute', sql, params),
+          query: (sql, params) => this.statement(connection, 'query', sql, params)
+        });
+        await connection.commit();
+        return result;
+      } catch (error) {
+        if (error.code !== QUERY_TIMEOUT_CODE) {
+          await connection.rollback().catch(() => {});
+        }
+        throw error;
+      }
+    });
+  }
+
+  // Opens `count` connections up front so the first requests served by a new
+  // task do not pay the TCP, TLS and authentication handshakes. They are
+  // released straight back to the pool, where they stay idle.
+  async warmUp(count) {
+    const results = await Promise.allSettled(
+      Array.from({ length: count }, () => this.pool.getConnection())
+    );
+    const opened = results.filter((result) => result.status === 'fulfilled');
+    opened.forEach((result) => result.value.release());
+
+    const failed = results.find((result) => result.status === 'rejected');
+    if (failed) {
+      throw failed.reason;
+    }
+    return opened.length;
+  }
+
+  // Round trip for readiness checks. It bypasses the breaker and the
+  // statement bulkhead: an open circuit or a full bulkhead under load must
+  // not fail readiness (the ALB would pull every task at once), only a
+  // database that cannot be reached.
+  async ping() {
+    const connection = await this.acquire();
+    try {
+      await connection.ping();
+    } finally {
+      connection.release();
+    }
+  }
+
+  // Connection for a long-running stream, e.g. an export. Streams have
+  // their own bulkhead, and the statement bulkhead is sized to leave their
+  // connections free in the pool (see maxStreams in server.js), so a long
+  // export neither holds a connection nothing counts nor makes requests
+  // time out waiting for the pool. Returns { connection, release(error) };
+  // release destroys the connection when the stream failed part way.
+  async acquireStream() {
+    let connection;
+    try {
+      await this.streams.enter();
+    } catch (error) {
+      metrics.recordDbRejection(error.code);
+      throw error;
+    }
+    try {
+      connection = await this.breaker.run(() => this.acquire());
+    } catch (error) {
+      this.streams.leave();
+      if (error instanceof ServiceUnavailableError) {
+        metrics.recordDbRejection(error.code);
+      }
+      throw error;
+    }
+
+    let released = false;
+    return {
+      connection,
+      release: (error) => {
+        if (released) {
+          return;
+        }
+        released = true;
+        if (error) {
+          connection.destroy();
+        } else {
+          connection.release();
+        }
+        this.streams.leave();
+      }
+    };
+  }
+
+  // Get a pooled connection, failing after acquireTimeoutMs instead of
+  // waiting in the pool queue indefinitely. mysql2 has no acquire timeout of
+  // its own, so a connection handed out after we gave up is released again.
+  // The wait is also cut short by the request deadline, if that comes first.
+  acquire() {
+    return tracing.trace('db.pool.acquire', {}, () => this.waitForConnection());
+  }
+
+  waitForConnection() {
+    return new Promise((resolve, reject) => {
+      const remaining = remainingMs();
+      const limitedByDeadline = remaining < this.acquireTimeoutMs;
+      let timedOut = false;
+      const timer = setTimeout(() => {
+        timedOut = true;
+        reject(limitedByDeadline
+          ? new GatewayTimeoutError('Request deadline exceeded waiting for a database connection', {
+            code: 'DEADLINE_EXCEEDED'
+          })
+          : new ServiceUnavailableError('Timed out waiting for a database connection', {
+            code: 'DB_ACQUIRE_TIMEOUT',
+            retryAfter: 1
+          }));
+      }, Math.min(remaining, this.acquireTimeoutMs));
+
+      this.pool.getConnection().then(
+        (connection) => {
+          if (timedOut) {
+            connection.release();
+            return;
+          }
+          clearTimeout(timer);
+          resolve(connection);
+        },
+        (error) => {
+          if (!timedOut) {
+            clearTimeout(timer);
+            reject(error);
+          }
+        }
+      );
+    });
+  }
+
+  async withConnection(work) {
+    const start = process.hrtime.bigint();
+    try {
+      return await this.breaker.run(() => this.bulkhead.run(() => this.onConnection(work)));
+    } catch (error) {
+      if (error instanceof ServiceUnavailableError) {
+        metrics.recordDbRejection(error.code);
+      }
+      // Raw timeouts are seen by the breaker above; callers get a 504
+      if (error.code === QUERY_TIMEOUT_CODE || error.code === EXECUTION_TIME_CODE) {
+        throw new GatewayTimeoutError('Database query exceeded its time budget', { code: 'QUERY_TIMEOUT' });
+      }
+      throw error;
+    } finally {
+      requestContext.addDbTime(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+  }
+
+  async onConnection(work) {
+    const connection = await this.acquire();
+    try {
+      const result = await work(connection);
+      connection.release();
+      return result;
+    } catch (error) {
+      if (error.code === QUERY_TIMEOUT_CODE) {
+        connection.destroy();
+      } else {
+        connection.release();
+      }
+      throw error;
+    }
+  }
+
+  // Each statement gets what is left of the request deadline, capped at
+  // queryTimeoutMs
+  statement(connection, method, sql, params) {
+    const budgetMs = Math.min(this.queryTimeoutMs, remainingMs());
+    const hinted = withExecutionHint(sql, budgetMs);
+    return tracing.trace('db.statement', {
+      kind: tracing.SPAN_KIND.client,
+      attributes: () => ({
+        'db.system': 'mysql',
+        'db.operation': method,
+        'db.statement': tracing.normalizeSql(sql)
+      })
+    }, () => (hinted
+      ? connection[method]({ sql: hinted, timeout: budgetMs + DRIVER_GRACE_MS }, params)
+      : connection[method]({ sql, timeout: budgetMs }, params)));
+  }
+}
+
+module.exports = Database;
+'''
+
+project_files["application/backend/lib/request-logger.js"] = '''const requestContext = require('./request-context');
+
+const round = (value) => Math.round(value * 100) / 100;
+
+// One structured JSON line per request with route, status, duration_ms and
+// db_time_ms. Errors and slow requests are always logged; successful ones are
+// sampled so logging stays cheap under load. sample_rate is included so Log
+// Insights queries can scale sampled counts back up.
+function createRequestLogger(logger, options = {}) {
+  const sampleRate2xx = options.sampleRate2xx === undefined ? 1 : options.sampleRate2xx;
+  const slowRequestMs = options.slowRequestMs || 1000;
+
+  return (req, res, next) => {
+    const start = process.hrtime.bigint();
+    // span is the request's root span when it is traced (see tracing.js)
+    const context = { dbTimeMs: 0, span: req.span || null };
+
+    let logged = false;
+    const log = () => {
+      if (logged) {
+        return;
+      }
+      logged = true;
+
+      const durationMs = Number(process.hrtime.bigint() - start) / 1e6;
+      // 499 marks requests the client abandoned before the response completed
+      const status = res.writableFinished ? res.statusCode : 499;
+      const sampled = status >= 400 || durationMs >= slowRequestMs;
+      if (!sampled && Math.random() >= sampleRate2xx) {
+        return;
+      }
+
+      logger.info('request', {
+        method: req.method,
+        route: requestContext.routeLabel(req),
+        path: req.originalUrl,
+        status,
+        duration_ms: round(durationMs),
+        db_time_ms: round(context.dbTimeMs),
+        sample_rate: sampled ? 1 : sampleRate2xx,
+        trace_id: context.span ? context.span.traceId : undefined,
+        user_agent: req.get('user-agent')
+      });
+    };
+
+    res.once('finish', log);
+    res.once('close', log);
+    requestContext.run(context, next);
+  };
+}
+
+module.exports = { createRequestLogger };
+'''
+
+project_files["application/backend/lib/tracing.js"] = '''const crypto = require('crypto');
+const fs = require('fs');
+const http = require('http');
+const https = require('https');
+const { performance } = require('perf_hooks');
+const requestContext = require('./request-context');
+const metrics = require('./metrics');
+
+// Lightweight request tracing. A sampled request gets a root span, and code
+// running for it (middleware, pool acquire, SQL statements, serialization,
+// response write) adds child spans. Ended spans are exported in batches to
+// an OTLP/HTTP collector or appended to a local NDJSON file. Requests that
+// are not sampled carry no span, so instrumented code only pays for one
+// context lookup.
+
+const SPAN_KIND = { internal: 1, server: 2, client: 3 };
+const STATUS_ERROR = 2;
+const TRACEPARENT = /^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$/;
+
+function nowNanos() {
+  return BigInt(Math.round((performance.timeOrigin + performance.now()) * 1000)) * 1000n;
+}
+
+// Ids are cut from a buffer of random bytes refilled in bulk, which costs a
+// fraction of a randomBytes() call per span
+const ID_POOL_SIZE = 8192;
+const idPool = Buffer.alloc(ID_POOL_SIZE);
+let idOffset = ID_POOL_SIZE;
+
+function randomId(bytes) {
+  if (idOffset + bytes > ID_POOL_SIZE) {
+    crypto.randomFillSync(idPool);
+    idOffset = 0;
+  }
+  const id = idPool.toString('hex', idOffset, idOffset + bytes);
+  idOffset += bytes;
+  return id;
+}
+
+class Span {
+  constructor(name, kind, traceId, parentSpanId, attributes) {
+    this.name = name;
+    this.kind = kind;
+    this.traceId = traceId;
+    this.spanId = randomId(8);
+    this.parentSpanId = parentSpanId;
+    this.attributes = attributes || {};
+    this.startNanos = nowNanos();
+    this.endNanos = null;
+    this.status = null;
+  }
+
+  setAttribute(key, value) {
+    this.attributes[key] = value;
+    return this;
+  }
+
+  setError(error) {
+    this.status = { code: STATUS_ERROR, message: error.message };
+    if (error.code) {
+      this.attributes['error.code'] = String(error.code);
+    }
+    return this;
+  }
+
+  end() {
+    if (this.endNanos === null) {
+      this.endNanos = nowNanos();
+      processor.onEnd(this);
+    }
+  }
+}
+
+// Appends one JSON line per span. Meant for local profiling: durations are
+// precomputed so the file can be read with jq or loaded into a notebook.
+class FileSpanExporter {
+  constructor(path) {
+    this.stream = fs.createWriteStream(path, { flags: 'a' });
+  }
+
+  export(spans) {
+    const lines = spans.map((span) => JSON.stringify({
+      traceId: span.traceId,
+      spanId: span.spanId,
+      parentSpanId: span.parentSpanId,
+      name: span.name,
+      start: new Date(Number(span.startNanos / 1000000n)).toISOString(),
+      durationMs: Number(span.endNanos - span.startNanos) / 1e6,
+      attributes: span.attributes,
+      error: span.status ? span.status.message : undefined
+    }) + '\\n');
+    return new Promise((resolve, reject) => {
+      this.stream.write(lines.join(''), (error) => (error ? reject(error) : resolve()));
+    });
+  }
+
+  shutdown() {
+    return new Promise((resolve) => this.stream.end(resolve));
+  }
+}
+
+function otlpValue(value) {
+  if (typeof value === 'boolean') {
+    return { boolValue: value };
+  }
+  if (Number.isInteger(value)) {
+    return { intValue: String(value) };
+  }
+  if (typeof value === 'number') {
+    return { doubleValue: value };
+  }
+  return { stringValue: String(value) };
+}
+
+function otlpAttributes(attributes) {
+  return Object.keys(attributes)
+    .filter((key) => attributes[key] !== undefined)
+    .map((key) => ({ key, value: otlpValue(attributes[key]) }));
+}
+
+// OTLP/HTTP with the JSON encoding, accepted by the OpenTelemetry collector,
+// the ADOT collector sidecar and most tracing backends
+class OtlpHttpSpanExporter {
+  constructor(options) {
+    this.url = new URL('/v1/traces', options.endpoint);
+    this.serviceName = options.serviceName;
+    this.timeoutMs = options.timeoutMs || 10000;
+  }
+
+  export(spans) {
+    const body = JSON.stringify({
+      resourceSpans: [{
+        resource: { attributes: otlpAttributes({ 'service.name': this.serviceName }) },
+        scopeSpans: [{
+          scope: { name: this.serviceName },
+          spans: spans.map((span) => ({
+            traceId: span.traceId,
+            spanId: span.spanId,
+            parentSpanId: span.parentSpanId || undefined,
+            name: span.name,
+            kind: span.kind,
+            startTimeUnixNano: String(span.startNanos),
+            endTimeUnixNano: String(span.endNanos),
+            attributes: otlpAttributes(span.attributes),
+            status: span.status || undefined
+          }))
+        }]
+      }]
+    });
+
+    const transport = this.url.protocol === 'https:' ? https : http;
+    return new Promise((resolve, reject) => {
+      const req = transport.request(this.url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'Content-Length': Buffer.byteLength(body) },
+        timeout: this.timeoutMs
+      }, (res) => {
+        res.resume();
+        if (res.statusCode >= 200 && res.statusCode < 300) {
+          resolve();
+        } else {
+          reject(new Error(`OTLP export failed with status ${res.statusCode}`));
+        }
+      });
+      req.on('timeout', () => req.destroy(new Error('OTLP export timed out')));
+      req.on('error', reject);
+      req.end(body);
+    });
+  }
+
+  async shutdown() {}
+}
+
+// Buffers ended spans and hands them to the exporter in batches. When the
+// exporter falls behind, new spans are dropped (and counted) rather than
+// buffered without bound.
+class BatchSpanProcessor {
+  constructor() {
+    this.exporter = null;
+    this.queue = [];
+    this.timer = null;
+  }
+
+  configure(exporter, options) {
+    this.exporter = exporter;
+    this.batchSize = options.batchSize || 512;
+    this.maxQueue = options.maxQueue || 4096;
+    this.timer = setInterval(() => this.flush(), options.flushIntervalMs || 5000);
+    this.timer.unref();
+  }
+
+  onEnd(span) {
+    if (this.queue.length >= this.maxQueue) {
+      metrics.recordSpans('dropped', 1);
+      return;
+    }
+    this.queue.push(span);
+    if (this.queue.length >= this.batchSize) {
+      this.flush();
+    }
+  }
+
+  flush() {
+    if (this.queue.length === 0) {
+      return Promise.resolve();
+    }
+    const spans = this.queue.splice(0, this.queue.length);
+    return this.exporter.export(spans).then(
+      () => metrics.recordSpans('exported', spans.length),
+      () => metrics.recordSpans('failed', spans.length)
+    );
+  }
+
+  async shutdown() {
+    clearInterval(this.timer);
+    await this.flush();
+    await this.exporter.shutdown();
+  }
+}
+
+const processor = new BatchSpanProcessor();
+let sampleRate = 0;
+let enabled = false;
+
+// options: { exporter: 'otlp' | 'file' | 'none', sampleRate, endpoint, file,
+// serviceName }. Tracing stays off with 'none' or a sample rate of 0.
+function configure(options) {
+  if (!options.exporter || options.exporter === 'none' || !(options.sampleRate > 0)) {
+    return false;
+  }
+  const exporter = options.exporter === 'file'
+    ? new FileSpanExporter(options.file)
+    : new OtlpHttpSpanExporter(options);
+  processor.configure(exporter, options);
+  sampleRate = options.sampleRate;
+  enabled = true;
+  return true;
+}
+
+// Sampling is decided once per request. A sampled W3C traceparent from the
+// caller keeps its trace id and decision, so traces started upstream stay
+// complete.
+function startRootSpan(traceparent) {
+  const parent = TRACEPARENT.exec(traceparent || '');
+  if (parent) {
+    return parseInt(parent[3], 16) & 1
+      ? new Span('request', SPAN_KIND.server, parent[1], parent[2])
+      : null;
+  }
+  return Math.random() < sampleRate
+    ? new Span('request', SPAN_KIND.server, randomId(16), null)
+    : null;
+}
+
+function childOf(parent, name, kind, attributes) {
+  return new Span(name, kind, parent.traceId, parent.spanId, attributes);
+}
+
+// Span of the request being served, if it is sampled
+function activeSpan() {
+  const context = requestContext.current();
+  return context ? context.span : null;
+}
+
+// Runs work() (which returns a promise) inside a child span of the current
+// request. attributes is a function so that building them, e.g. normalizing
+// SQL, only costs anything for sampled requests.
+function trace(name, options, work) {
+  const parent = activeSpan();
+  if (!parent) {
+    return work();
+  }
+  const span = childOf(parent, name, options.kind || SPAN_KIND.internal, options.attributes && options.attributes());
+  return work().then(
+    (result) => {
+      span.end();
+      return result;
+    },
+    (error) => {
+      span.setError(error).end();
+      throw error;
+    }
+  );
+}
+
+// Synchronous variant of trace(), e.g. for serialization
+function traceSync(name, work) {
+  const parent = activeSpan();
+  if (!parent) {
+    return work();
+  }
+  const span = childOf(parent, name, SPAN_KIND.internal);
+  try {
+    return work();
+  } finally {
+    span.end();
+  }
+}
+
+// Root span per sampled request, named after the route once it is known,
+// with a child span from the first byte of the response to its last. The
+// span is kept on req until the request context exists (see
+// request-logger.js), since middleware ahead of it runs without one.
+function middleware() {
+  return (req, res, next) => {
+    if (!enabled) {
+      return next();
+    }
+    const span = startRootSpan(req.get('traceparent'));
+    if (!span) {
+      return next();
+    }
+    req.span = span;
+    span.setAttribute('http.request.method', req.method);
+
+    let write = null;
+    const writeHead = res.writeHead;
+    res.writeHead = function tracedWriteHead() {
+      res.writeHead = writeHead;
+      write = childOf(span, 'response.write', SPAN_KIND.internal);
+      return writeHead.apply(this, arguments);
+    };
+
+    let ended = false;
+    const end = () => {
+      if (ended) {
+        return;
+      }
+      ended = true;
+      // 499 marks requests the client abandoned, as in the request log
+      const status = res.writableFinished ? res.statusCode : 499;
+      const route = requestContext.routeLabel(req);
+      if (write) {
+        write.end();
+      }
+      span.name = `${req.method} ${route}`;
+      span.setAttribute('http.route', route).setAttribute('http.response.status_code', status);
+      if (status >= 500) {
+        span.status = { code: STATUS_ERROR, message: `HTTP ${status}` };
+      }
+      span.end();
+    };
+    res.once('finish', end);
+    res.once('close', end);
+    next();
+  };
+}
+
+// Wraps an application middleware so sampled requests get a span from when
+// it is entered until it calls next() or, if it answers itself, until the
+// response is finished
+function wrap(name, handler) {
+  return (req, res, next) => {
+    if (!req.span) {
+      return handler(req, res, next);
+    }
+    const span = childOf(req.span, `middleware - ${name}`, SPAN_KIND.internal);
+    const end = () => span.end();
+    res.once('finish', end);
+    handler(req, res, (error) => {
+      res.removeListener('finish', end);
+      if (error) {
+        span.setError(error);
+      }
+      span.end();
+      next(error);
+    });
+  };
+}
+
+// Statement text with literals replaced and IN lists collapsed, so spans of
+// the same statement group together. Cached, as the API only issues a few
+// dozen distinct statements.
+const normalizedStatements = new Map();
+
+function normalizeSql(sql) {
+  let normalized = normalizedStatements.get(sql);
+  if (normalized === undefined) {
+    normalized = sql
+      .replace(/'(?:[^'\\\\]|\\\\.)*'/g, '?')
+      .replace(/\\b\\d+(?:\\.\\d+)?\\b/g, '?')
+      .replace(/\\(\\s*\\?(?:\\s*,\\s*\\?)*\\s*\\)/g, '(?)')
+      .replace(/\\s+/g, ' ')
+      .trim();
+    if (normalizedStatements.size >= 1000) {
+      normalizedStatements.clear();
+    }
+    normalizedStatements.set(sql, normalized);
+  }
+  return normalized;
+}
+
+function shutdown() {
+  return enabled ? processor.shutdown() : Promise.resolve();
+}
+
+module.exports = {
+  SPAN_KIND,
+  configure,
+  middleware,
+  wrap,
+  trace,
+  traceSync,
+  normalizeSql,
+  shutdown
+};
+'''
+
+project_files["application/backend/lib/errors.js"] = '''// Errors carrying an HTTP status. Route handlers and the error middleware
+// send these with their own status instead of a generic 500.
+class HttpError extends Error {
+  constructor(status, message, options = {}) {
+    super(message);
+    this.name = this.constructor.name;
+    this.status = status;
+    this.code = options.code;
+    this.retryAfter = options.retryAfter;
+  }
+}
+
+// The service is shedding load; retryAfter is in seconds
+class ServiceUnavailableError extends HttpError {
+  constructor(message, options = {}) {
+    super(503, message, options);
+  }
+}
+
+// The request ran out of time, either its own deadline or a query budget
+class GatewayTimeoutError extends HttpError {
+  constructor(message, options = {}) {
+    super(504, message, options);
+  }
+}
+
+module.exports = {
+  HttpError,
+  ServiceUnavailableError,
+  GatewayTimeoutError
+};
+'''
+
+project_files["application/backend/lib/deadline.js"] = '''const requestContext = require('./request-context');
+const { HttpError, GatewayTimeoutError } = require('./errors');
+
+// Per-route request deadline. The absolute deadline and an AbortSignal are
+// stored in the request context, where the database helpers read them to
+// bound connection waits and query time. The signal is aborted when the
+// deadline passes (after a 504 has been sent) or when the client goes away,
+// so work still queued for the request fails fast instead of running.
+function deadline(ms) {
+  return (req, res, next) => {
+    const controller = new AbortController();
+    const context = requestContext.current();
+    if (context) {
+      context.deadline = Date.now() + ms;
+      context.signal = controller.signal;
+    }
+
+    const timer = setTimeout(() => {
+      controller.abort(new GatewayTimeoutError(`Request exceeded its ${ms}ms deadline`, {
+        code: 'DEADLINE_EXCEEDED'
+      }));
+      if (!res.headersSent) {
+        // Tells the idempotency middleware the handler may still finish
+        res.locals.deadlineExceeded = true;
+        res.status(504).json({ success: false, message: 'Request timed out' });
+      }
+    }, ms);
+
+    res.on('close', () => {
+      clearTimeout(timer);
+      if (!res.writableFinished && !controller.signal.aborted) {
+        controller.abort(new HttpError(499, 'Client closed request', { code: 'REQUEST_ABORTED' }));
+      }
+    });
+    next();
+  };
+}
+
+// Milliseconds left before the current request's deadline (Infinity when
+// the route has none). Throws if the request has already been aborted.
+function remainingMs() {
+  const context = requestContext.current();
+  if (!context || !context.deadline) {
+    return Infinity;
+  }
+  if (context.signal.aborted) {
+    throw context.signal.reason;
+  }
+  const remaining = context.deadline - Date.now();
+  if (remaining <= 0) {
+    throw new GatewayTimeoutError('Request deadline exceeded', { code: 'DEADLINE_EXCEEDED' });
+  }
+  return remaining;
+}
+
+module.exports = {
+  deadline,
+  remainingMs
+};
+'''
+
+project_files["application/backend/lib/serializers.js"] = '''const fastJson = require('fast-json-stringify');
+
+// Response schemas for the user routes, compiled once at startup into
+// serializers specialized for these shapes. They replace the generic
+// JSON.stringify walk that res.json does, which dominates CPU on large
+// lists. Properties missing from a schema are not sent, so a schema has to
+// change together with the route that uses it.
+const user = {
+  type: 'object',
+  properties: {
+    id: { type: 'integer' },
+    name: { type: 'string' },
+    email: { type: 'string' },
+    created_at: { type: 'string', format: 'date-time' }
+  }
+};
+
+const rowIssue = {
+  type: 'object',
+  properties: {
+    index: { type: 'integer' },
+    email: { type: 'string' },
+    message: { type: 'string' }
+  }
+};
+
+const envelope = (properties) => ({
+  type: 'object',
+  properties: {
+    success: { type: 'boolean' },
+    ...properties
+  }
+});
+
+const users = { type: 'array', items: user };
+
+const schemas = {
+  userList: envelope({
+    data: users,
+    count: { type: 'integer' }
+  }),
+  usersByIds: envelope({
+    data: users,
+    count: { type: 'integer' },
+    missing: { type: 'array', items: { type: 'integer' } }
+  }),
+  userPage: envelope({
+    data: users,
+    count: { type: 'integer' },
+    nextCursor: { type: ['string', 'null'] }
+  }),
+  userSearch: envelope({
+    data: users,
+    count: { type: 'integer' },
+    nextCursor: { type: ['string', 'null'] }
+  }),
+  userResult: envelope({
+    data: user,
+    message: { type: 'string' }
+  }),
+  userBatch: envelope({
+    data: users,
+    count: { type: 'integer' },
+    duplicates: { type: 'array', items: rowIssue },
+    errors: { type: 'array', items: rowIssue }
+  })
+};
+
+module.exports = {
+  schemas,
+  serializeUser: fastJson(user),
+  serializeUserList: fastJson(schemas.userList),
+  serializeUsersByIds: fastJson(schemas.usersByIds),
+  serializeUserPage: fastJson(schemas.userPage),
+  serializeUserSearch: fastJson(schemas.userSearch),
+  serializeUserResult: fastJson(schemas.userResult),
+  serializeUserBatch: fastJson(schemas.userBatch)
+};
+'''
+
+project_files["application/backend/lib/rate-limiter.js"] = '''const LRUCache = require('./lru-cache');
+const metrics = require('./metrics');
+
+// Refills a token bucket and takes up to `want` tokens in one atomic step.
+// Time comes from the Redis server so that tasks with skewed clocks agree.
+// Returns { granted, remaining, waitMs until the next token }.
+const TAKE_SCRIPT = `
+local capacity = tonumber(ARGV[1])
+local refill_per_ms = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local ttl_ms = tonumber(ARGV[4])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill_per_ms)
+local granted = math.min(want, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+local wait_ms = 0
+if tokens < 1 then
+  wait_ms = math.ceil((1 - tokens) / refill_per_ms)
+end
+return {granted, math.floor(tokens), wait_ms}
+`;
+
+// Shared bucket store on Redis (or anything speaking its protocol and Lua,
+// such as ElastiCache or Valkey), through an ioredis client
+class RedisBucketStore {
+  constructor(client, prefix = 'ratelimit:') {
+    this.client = client;
+    this.prefix = prefix;
+    client.defineCommand('takeTokens', { numberOfKeys: 1, lua: TAKE_SCRIPT });
+  }
+
+  async take(key, want, bucket) {
+    const [granted, remaining, waitMs] = await this.client.takeTokens(
+      this.prefix + key,
+      bucket.capacity,
+      bucket.refillPerMs,
+      want,
+      bucket.ttlMs
+    );
+    return { granted, remaining, waitMs };
+  }
+}
+
+// Same algorithm in process memory, for local development and tests. Limits
+// are per task, so it is not meant for more than one instance.
+class MemoryBucketStore {
+  constructor(options = {}) {
+    this.buckets = new LRUCache({ maxEntries: options.maxEntries || 100000 });
+  }
+
+  async take(key, want, bucket) {
+    const now = Date.now();
+    const state = this.buckets.get(key) || { tokens: bucket.capacity, ts: now };
+    const tokens = Math.min(bucket.capacity, state.tokens + Math.max(0, now - state.ts) * bucket.refillPerMs);
+    const granted = Math.min(want, Math.floor(tokens));
+    const left = tokens - granted;
+
+    this.buckets.set(key, { tokens: left, ts: now }, bucket.ttlMs);
+    return {
+      granted,
+      remaining: Math.floor(left),
+      waitMs: left < 1 ? Math.ceil((1 - left) / bucket.refillPerMs) : 0
+    };
+  }
+}
+
+// Token bucket per key on a shared store. To keep the store off the hot
+// path, a task leases tokens locally and serves requests from the lease.
+// Leases start at one token and double, up to maxBatch, only while a key
+// keeps using up its lease within leaseMs. Quiet clients therefore lose no
+// tokens to leases that expire unused. A key that is out of tokens is
+// answered locally until its next token is due.
+class TokenBucketLimiter {
+  constructor(options) {
+    this.store = options.store;
+    this.capacity = options.capacity;
+    this.bucket = {
+      capacity: options.capacity,
+      refillPerMs: options.capacity / options.windowMs,
+      ttlMs: options.windowMs
+    };
+    this.maxBatch = options.maxBatch || 10;
+    this.leaseMs = options.leaseMs || 1000;
+    this.leases = new LRUCache({ maxEntries: options.maxKeys || 100000, ttlMs: this.leaseMs });
+    this.pending = new Map();
+  }
+
+  // Resolves to { allowed, remaining, retryAfterMs }. Every renewal either
+  // grants a token or marks the key blocked, so the loop always ends.
+  async consume(key) {
+    for (;;) {
+      const lease = this.leases.get(key);
+      if (lease && lease.tokens > 0) {
+        lease.tokens -= 1;
+        return { allowed: true, remaining: lease.remaining + lease.tokens, retryAfterMs: 0 };
+      }
+      if (lease && lease.blockedUntil > Date.now()) {
+        return { allowed: false, remaining: 0, retryAfterMs: lease.blockedUntil - Date.now() };
+      }
+      await this.renew(key, lease);
+    }
+  }
+
+  // Concurrent renewals for one key share a single store call
+  renew(key, lease) {
+    let pending = this.pending.get(key);
+    if (!pending) {
+      const batch = lease ? Math.min(this.maxBatch, lease.batch * 2) : 1;
+      pending = this.store.take(key, batch, this.bucket)
+        .then(({ granted, remaining, waitMs }) => {
+          this.leases.set(key, {
+            tokens: granted,
+            remaining,
+            batch: Math.max(1, granted),
+            blockedUntil: granted === 0 ? Date.now() + Math.min(waitMs, this.leaseMs) : 0
+          });
+        })
+        .finally(() => this.pending.delete(key));
+      this.pending.set(key, pending);
+    }
+    return pending;
+  }
+}
+
+// Express middleware. Store failures let the request through (and are
+// counted), so an unavailable Redis does not take the API down with it.
+function rateLimit(options) {
+  const { limiter, logger } = options;
+  const keyOf = options.keyGenerator || ((req) => req.ip);
+  const message = options.message || 'Too many requests, please try again later.';
+
+  return async (req, res, next) => {
+    let result;
+    try {
+      result = await limiter.consume(keyOf(req));
+    } catch (error) {
+      metrics.recordRateLimit('error');
+      logger.warn('Rate limiter store unavailable, allowing request', { error: error.message });
+      return next();
+    }
+
+    res.set('RateLimit-Limit', String(limiter.capacity));
+    res.set('RateLimit-Remaining', String(result.remaining));
+    if (result.allowed) {
+      metrics.recordRateLimit('allowed');
+      return next();
+    }
+
+    metrics.recordRateLimit('limited');
+    res.set('Retry-After', String(Math.max(1, Math.ceil(result.retryAfterMs / 1000))));
+    res.status(429).json({ success: false, message });
+  };
+}
+
+module.exports = {
+  TokenBucketLimiter,
+  RedisBucketStore,
+  MemoryBucketStore,
+  rateLimit
+};
+'''
+
+project_files["application/backend/lib/idempotency.js"] = '''const crypto = require('crypto');
+const LRUCache = require('./lru-cache');
+const metrics = require('./metrics');
+
+const HEADER = 'Idempotency-Key';
+const MAX_KEY_LENGTH = 255;
+
+// Records are { fingerprint, response } where response is null while the
+// first request is still running, then { status, contentType, body }.
+
+// In-process store for local development and single-task deployments.
+// Entries are evicted by TTL and by total body size.
+class MemoryIdempotencyStore {
+  constructor(options = {}) {
+    this.records = new LRUCache({
+      maxEntries: options.maxEntries || 10000,
+      maxSize: options.maxBytes || 16 * 1024 * 1024,
+      sizeOf: (record) => 64 + (record.response ? record.response.body.length : 0)
+    });
+  }
+
+  // Reserves the key for lockMs, or returns the record already stored
+  async begin(key, fingerprint, lockMs) {
+    const existing = this.records.get(key);
+    if (existing) {
+      return existing;
+    }
+    this.records.set(key, { fingerprint, response: null }, lockMs);
+    return null;
+  }
+
+  async complete(key, record, ttlMs) {
+    this.records.set(key, record, ttlMs);
+  }
+
+  async abandon(key) {
+    this.records.delete(key);
+  }
+}
+
+// Store shared by all tasks, so a retry routed to another task by the ALB
+// still finds the original response. SET NX makes the reservation atomic.
+class RedisIdempotencyStore {
+  constructor(client, prefix = 'idempotency:') {
+    this.client = client;
+    this.prefix = prefix;
+  }
+
+  async begin(key, fingerprint, lockMs) {
+    const reserved = await this.client.set(
+      this.prefix + key,
+      JSON.stringify({ fingerprint, response: null }),
+      'PX',
+      lockMs,
+      'NX'
+    );
+    if (reserved) {
+      return null;
+    }
+    const existing = await this.client.get(this.prefix + key);
+    return existing ? JSON.parse(existing) : null;
+  }
+
+  async complete(key, record, ttlMs) {
+    await this.client.set(this.prefix + key, JSON.stringify(record), 'PX', ttlMs);
+  }
+
+  async abandon(key) {
+    await this.client.del(this.prefix + key);
+  }
+}
+
+function fingerprintOf(req) {
+  return crypto.createHash('sha256')
+    .update(`${req.method} ${req.originalUrl}\\n`)
+    .update(JSON.stringify(req.body === undefined ? null : req.body))
+    .digest('base64url');
+}
+
+// Route middleware for mutating requests carrying an Idempotency-Key header.
+// The first request with a key runs normally and its response is stored;
+// retries with the same key and body get that response back without the
+// handler running again. Server errors are not stored, so the client can
+// retry them, except the 504 sent when the route's deadline passes: the
+// write may still be running then, so the key stays reserved and the
+// handler's own response, sent after the 504, is the one stored. Requests
+// without the header are not affected. A reservation only lasts lockMs, so
+// a task dying mid-request (or a handler failing after its 504) does not
+// block the key.
+function idempotent(options) {
+  const { store, logger } = options;
+  const ttlMs = options.ttlMs || 24 * 60 * 60 * 1000;
+  const lockMs = options.lockMs || 60 * 1000;
+
+  return async (req, res, next) => {
+    const clientKey = req.get(HEADER);
+    if (clientKey === undefined) {
+      return next();
+    }
+    if (!clientKey || clientKey.length > MAX_KEY_LENGTH) {
+      return res.status(400).json({
+        success: false,
+        message: `${HEADER} must be between 1 and ${MAX_KEY_LENGTH} characters`
+      });
+    }
+
+    const key = `${req.method}:${req.baseUrl}${req.route.path}:${clientKey}`;
+    const fingerprint = fingerprintOf(req);
+    let existing;
+    try {
+      existing = await store.begin(key, fingerprint, lockMs);
+    } catch (error) {
+      // Without the store the request still runs, just without protection
+      metrics.recordCacheResult('idempotency', 'error');
+      logger.warn('Idempotency store unavailable', { error: error.message });
+      return next();
+    }
+
+    if (existing) {
+      if (existing.fingerprint !== fingerprint) {
+        metrics.recordCacheResult('idempotency', 'mismatch');
+        return res.status(422).json({
+          success: false,
+          message: `${HEADER} was already used for a different request`
+        });
+      }
+      if (!existing.response) {
+        metrics.recordCacheResult('idempotency', 'in_progress');
+        res.set('Retry-After', '1');
+        return res.status(409).json({
+          success: false,
+          message: `A request with this ${HEADER} is still in progress`
+        });
+      }
+
+      metrics.recordCacheResult('idempotency', 'replay');
+      res.set('Idempotent-Replayed', 'true');
+      res.status(existing.response.status);
+      if (existing.response.contentType) {
+        res.set('Content-Type', existing.response.contentType);
+      }
+      return res.send(existing.response.body);
+    }
+
+    metrics.recordCacheResult('idempotency', 'miss');
+
+    // Every response path (res.json, res.send, sendSerialized) ends in
+    // res.send. The response is stored as it is sent, so it is kept even if
+    // the client has already disconnected and will retry.
+    const send = res.send;
+    const save = (body, contentType) => {
+      const stored = res.statusCode >= 500 || (typeof body !== 'string' && !Buffer.isBuffer(body))
+        ? store.abandon(key)
+        : store.complete(key, {
+          fingerprint,
+          response: { status: res.statusCode, contentType, body: body.toString() }
+        }, ttlMs);
+      stored.catch((error) => logger.warn('Failed to save idempotent response', { error: error.message }));
+    };
+
+    res.send = function sendAndStore(body) {
+      res.send = send;
+      if (!res.locals.deadlineExceeded) {
+        save(body, res.get('Content-Type'));
+        return send.apply(this, arguments);
+      }
+
+      // The deadline's 504 goes out without touching the reservation. The
+      // handler's late response has nowhere to go: its headers are kept off
+      // the finished response and its body is only stored.
+      const result = send.apply(this, arguments);
+      const { setHeader } = res;
+      let contentType = res.get('Content-Type');
+      res.setHeader = function setLateHeader(name, value) {
+        if (name.toLowerCase() === 'content-type') {
+          contentType = value;
+        }
+        return this;
+      };
+      res.send = function storeLateResponse(lateBody) {
+        res.send = send;
+        res.setHeader = setHeader;
+        save(lateBody, contentType);
+        return this;
+      };
+      return result;
+    };
+
+    next();
+  };
+}
+
+module.exports = {
+  MemoryIdempotencyStore,
+  RedisIdempotencyStore,
+  idempotent
+};
+'''
+
+project_files["application/backend/bench/serialize.js"] = '''// Compares the compiled user list serializer with JSON.stringify, which is
+// what res.json uses, on 1k and 10k row pages.
+//
+//   npm run bench
+//   BENCH_DURATION_MS=5000 npm run bench
+const { serializeUserList } = require('../lib/serializers');
+
+const DURATION_MS = parseInt(process.env.BENCH_DURATION_MS, 10) || 2000;
+const PAGE_SIZES = [1000, 10000];
+
+function makePage(size) {
+  const createdAt = Date.parse('2024-01-01T00:00:00Z');
+  const data = Array.from({ length: size }, (_, i) => ({
+    id: i + 1,
+    name: `User ${i + 1}`,
+    email: `user${i + 1}@example.com`,
+    created_at: new Date(createdAt + i * 1000)
+  }));
+  return { success: true, data, count: size };
+}
+
+function measure(serialize, page) {
+  // Warm up so both paths are optimized before timing
+  for (let i = 0; i < 20; i++) {
+    serialize(page);
+  }
+
+  let ops = 0;
+  let bytes = 0;
+  const start = process.hrtime.bigint();
+  const end = start + BigInt(DURATION_MS) * 1000000n;
+  while (process.hrtime.bigint() < end) {
+    bytes += serialize(page).length;
+    ops += 1;
+  }
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  return { opsPerSec: ops / seconds, mbPerSec: bytes / seconds / (1024 * 1024) };
+}
+
+for (const size of PAGE_SIZES) {
+  const page = makePage(size);
+
+  if (serializeUserList(page) !== JSON.stringify(page)) {
+    throw new Error(`Serializer output differs from JSON.stringify for ${size} rows`);
+  }
+
+  const baseline = measure(JSON.stringify, page);
+  const compiled = measure(serializeUserList, page);
+
+  console.log(`${size} rows`);
+  console.log(`  JSON.stringify       ${baseline.opsPerSec.toFixed(1).padStart(9)} ops/s  ${baseline.mbPerSec.toFixed(1).padStart(7)} MB/s`);
+  console.log(`  fast-json-stringify  ${compiled.opsPerSec.toFixed(1).padStart(9)} ops/s  ${compiled.mbPerSec.toFixed(1).padStart(7)} MB/s`);
+  console.log(`  speedup              ${(compiled.opsPerSec / baseline.opsPerSec).toFixed(2)}x`);
+}
+'''
+
+project_files["application/backend/bench/http.js"] = '''// Throughput and latency of the HTTP layer, without MySQL. Starts server.js
+// with the in-memory user repository (DB_DRIVER=memory) and keeps a fixed
+// number of requests in flight per route over keep-alive connections.
+//
+//   npm run bench:http
+//   BENCH_CONCURRENCY=64 BENCH_DURATION_MS=10000 MEMORY_DB_LATENCY_MS=1 npm run bench:http
+const http = require('http');
+const path = require('path');
+const { spawn } = require('child_process');
+
+const DURATION_MS = parseInt(process.env.BENCH_DURATION_MS, 10) || 5000;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY, 10) || 32;
+const PORT = parseInt(process.env.BENCH_PORT, 10) || 3900;
+const SEED_USERS = process.env.MEMORY_DB_SEED_USERS || '1000';
+
+const SCENARIOS = [
+  { name: 'GET /health', path: '/health' },
+  { name: 'GET /api/users/:id', path: '/api/users/1' },
+  { name: 'GET /api/users?ids=', path: '/api/users?ids=1,2,3,4,5,6,7,8,9,10' },
+  { name: 'GET /api/users/search', path: '/api/users/search?q=user1&limit=20' },
+  { name: 'GET /api/users', path: '/api/users' }
+];
+
+const agent = new http.Agent({ keepAlive: true, maxSockets: CONCURRENCY });
+
+function request(urlPath) {
+  return new Promise((resolve, reject) => {
+    const req = http.get({ host: '127.0.0.1', port: PORT, path: urlPath, agent }, (res) => {
+      res.resume();
+      res.on('end', () => resolve(res.statusCode));
+    });
+    req.on('error', reject);
+  });
+}
+
+function startServer(env) {
+  return spawn(process.execPath, [path.join(__dirname, '..', 'server.js')], {
+    env: {
+      ...process.env,
+      NODE_ENV: 'production',
+      PORT: String(PORT),
+      DB_DRIVER: 'memory',
+      MEMORY_DB_SEED_USERS: SEED_USERS,
+      // Neither the rate limiter nor request logs should be what is measured
+      RATE_LIMIT_MAX: '1000000000',
+      LOG_SAMPLE_RATE_2XX: '0',
+      REDIS_URL: '',
+      ...env
+    },
+    stdio: ['ignore', 'ignore', 'inherit']
+  });
+}
+
+async function waitUntilReady() {
+  for (let attempt = 0; attempt < 100; attempt++) {
+    try {
+      if (await request('/ready') === 200) {
+        return;
+      }
+    } catch (error) {
+      // Not listening yet
+    }
+    await new Promise((resolve) => setTimeout(resolve, 100));
+  }
+  throw new Error('Server did not become ready');
+}
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+async function run(scenario) {
+  const latencies = [];
+  let errors = 0;
+  const end = Date.now() + DURATION_MS;
+
+  const worker = async () => {
+    while (Date.now() < end) {
+      const start = process.hrtime.bigint();
+      try {
+        const status = await request(scenario.path);
+        if (status !== 200) {
+          errors += 1;
+        }
+      } catch (error) {
+        errors += 1;
+      }
+      latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+  };
+
+  const start = Date.now();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const seconds = (Date.now() - start) / 1000;
+
+  latencies.sort((a, b) => a - b);
+  return {
+    requestsPerSec: latencies.length / seconds,
+    p50: percentile(latencies, 0.5),
+    p95: percentile(latencies, 0.95),
+    p99: percentile(latencies, 0.99),
+    errors
+  };
+}
+
+// Runs every scenario against a fresh server started with `env` added to
+// its environment, and resolves to one result per scenario
+async function benchmark(env = {}, onResult = () => {}) {
+  const server = startServer(env);
+  const exited = new Promise((resolve) => server.once('exit', resolve));
+  try {
+    await waitUntilReady();
+    const results = [];
+    for (const scenario of SCENARIOS) {
+      // Warm up so the route is optimized before timing
+      for (let i = 0; i < 200; i++) {
+        await request(scenario.path);
+      }
+      const result = { name: scenario.name, ...await run(scenario) };
+      results.push(result);
+      onResult(result);
+    }
+    return results;
+  } finally {
+    agent.destroy();
+    server.kill('SIGTERM');
+    await exited;
+  }
+}
+
+function printResult(result) {
+  console.log(
+    `  ${result.name.padEnd(24)} ${result.requestsPerSec.toFixed(0).padStart(7)} req/s` +
+    `  p50 ${result.p50.toFixed(2).padStart(7)}ms  p95 ${result.p95.toFixed(2).padStart(7)}ms` +
+    `  p99 ${result.p99.toFixed(2).padStart(7)}ms  errors ${result.errors}`
+  );
+}
+
+if (require.main === module) {
+  console.log(`${CONCURRENCY} concurrent requests, ${DURATION_MS}ms per route, ${SEED_USERS} users`);
+  benchmark({}, printResult).catch((error) => {
+    console.error(error);
+    process.exitCode = 1;
+  });
+}
+
+module.exports = { benchmark, printResult, CONCURRENCY, DURATION_MS };
+'''
+
+project_files["application/backend/bench/tracing.js"] = '''// Overhead of request tracing. First the cost of the instrumentation itself
+// (an untraced call, a traced span, SQL normalization), then the HTTP
+// benchmark with tracing off, at 1% sampling and at 100% sampling, with
+// spans written to the null device by the file exporter.
+//
+//   npm run bench:tracing
+//   BENCH_DURATION_MS=10000 npm run bench:tracing
+const os = require('os');
+const tracing = require('../lib/tracing');
+const requestContext = require('../lib/request-context');
+const { benchmark, printResult, CONCURRENCY, DURATION_MS } = require('./http');
+
+const ITERATIONS = 200000;
+const SQL = 'SELECT id, name, email, created_at FROM users WHERE id IN (?)';
+
+async function nsPerCall(work) {
+  // Warm up so both paths are optimized before timing
+  for (let i = 0; i < 10000; i++) {
+    await work(i);
+  }
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < ITERATIONS; i++) {
+    await work(i);
+  }
+  return Number(process.hrtime.bigint() - start) / ITERATIONS;
+}
+
+async function instrumentation() {
+  tracing.configure({ exporter: 'file', file: os.devNull, sampleRate: 1 });
+  const resolved = Promise.resolve();
+  const query = () => resolved;
+  const statement = {
+    kind: tracing.SPAN_KIND.client,
+    attributes: () => ({ 'db.statement': tracing.normalizeSql(SQL) })
+  };
+  const parent = { traceId: '0af7651916cd43dd8448eb211c80319c', spanId: 'b7ad6b7169203331' };
+
+  const baseline = await nsPerCall(() => query());
+  const untraced = await requestContext.run({ span: null }, () => nsPerCall(() => tracing.trace('db.statement', statement, query)));
+  const traced = await requestContext.run({ span: parent }, () => nsPerCall(() => tracing.trace('db.statement', statement, query)));
+  const normalize = await nsPerCall((i) => tracing.normalizeSql(`SELECT * FROM users WHERE id = ${i % 10}`));
+  await tracing.shutdown();
+
+  console.log('Instrumentation cost per call');
+  console.log(`  unsampled request       ${(untraced - baseline).toFixed(0).padStart(7)} ns`);
+  console.log(`  sampled, with SQL span  ${(traced - baseline).toFixed(0).padStart(7)} ns`);
+  console.log(`  normalizeSql (cached)   ${normalize.toFixed(0).padStart(7)} ns`);
+}
+
+const CONFIGURATIONS = [
+  { name: 'tracing off', env: { TRACE_EXPORTER: 'none' } },
+  { name: '1% sampled', env: { TRACE_EXPORTER: 'file', TRACE_FILE: os.devNull, TRACE_SAMPLE_RATE: '0.01' } },
+  { name: '100% sampled', env: { TRACE_EXPORTER: 'file', TRACE_FILE: os.devNull, TRACE_SAMPLE_RATE: '1' } }
+];
+
+async function main() {
+  await instrumentation();
+
+  console.log(`\\nHTTP, ${CONCURRENCY} concurrent requests, ${DURATION_MS}ms per route`);
+  let baseline;
+  for (const configuration of CONFIGURATIONS) {
+    console.log(configuration.name);
+    const results = await benchmark(configuration.env, (result) => {
+      printResult(result);
+      const off = baseline && baseline.find((entry) => entry.name === result.name);
+      if (off) {
+        const throughput = (result.requestsPerSec / off.requestsPerSec - 1) * 100;
+        const p99 = result.p99 - off.p99;
+        console.log(`    vs off: ${throughput >= 0 ? '+' : ''}${throughput.toFixed(1)}% req/s, p99 ${p99 >= 0 ? '+' : ''}${p99.toFixed(2)}ms`);
+      }
+    });
+    baseline = baseline || results;
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exitCode = 1;
+});
+'''
+
+project_files["application/backend/test/shutdown.test.js"] = '''// Starts server.js with the in-memory user repository, sends SIGTERM while a
+// keep-alive request is in flight and checks that the drain completes as
+// soon as that request does, not when SHUTDOWN_TIMEOUT_MS forces it.
+const http = require('http');
+const net = require('net');
+const path = require('path');
+const { spawn } = require('child_process');
+
+const SHUTDOWN_TIMEOUT_MS = 10000;
+const LATENCY_MS = 500;
+
+function freePort() {
+  return new Promise((resolve, reject) => {
+    const probe = net.createServer();
+    probe.on('error', reject);
+    probe.listen(0, '127.0.0.1', () => {
+      const { port } = probe.address();
+      probe.close(() => resolve(port));
+    });
+  });
+}
+
+function get(port, urlPath, agent) {
+  return new Promise((resolve, reject) => {
+    const req = http.get({ host: '127.0.0.1', port, path: urlPath, agent }, (res) => {
+      res.resume();
+      res.on('end', () => resolve(res));
+    });
+    req.on('error', reject);
+  });
+}
+
+async function waitUntilReady(port) {
+  for (let attempt = 0; attempt < 100; attempt++) {
+    try {
+      if ((await get(port, '/ready')).statusCode === 200) {
+        return;
+      }
+    } catch (error) {
+      // Not listening yet
+    }
+    await new Promise((resolve) => setTimeout(resolve, 100));
+  }
+  throw new Error('Server did not become ready');
+}
+
+describe('graceful shutdown', () => {
+  let child;
+
+  afterEach(() => {
+    if (child && child.exitCode === null) {
+      child.kill('SIGKILL');
+    }
+  });
+
+  test('closes keep-alive connections of requests in flight at SIGTERM', async () => {
+    const port = await freePort();
+    child = spawn(process.execPath, [path.join(__dirname, '..', 'server.js')], {
+      env: {
+        ...process.env,
+        NODE_ENV: 'test',
+        PORT: String(port),
+        DB_DRIVER: 'memory',
+        MEMORY_DB_SEED_USERS: '1',
+        MEMORY_DB_LATENCY_MS: String(LATENCY_MS),
+        SHUTDOWN_TIMEOUT_MS: String(SHUTDOWN_TIMEOUT_MS),
+        REDIS_URL: ''
+      },
+      stdio: 'ignore'
+    });
+    const exited = new Promise((resolve) => child.once('exit', resolve));
+    await waitUntilReady(port);
+
+    const agent = new http.Agent({ keepAlive: true });
+    const inFlight = get(port, '/api/users/1', agent);
+    await new Promise((resolve) => setTimeout(resolve, LATENCY_MS / 5));
+    const signalledAt = Date.now();
+    child.kill('SIGTERM');
+
+    const res = await inFlight;
+    expect(res.statusCode).toBe(200);
+    expect(await exited).toBe(0);
+    expect(Date.now() - signalledAt).toBeLessThan(SHUTDOWN_TIMEOUT_MS / 4);
+    agent.destroy();
+  }, SHUTDOWN_TIMEOUT_MS * 2);
+});
+'''
+
+project_files["application/backend/test/db.test.js"] = '''const Database = require('../lib/db');
+
+describe('Database.splitPool', () => {
+  test('keeps most of a small pool for statements', () => {
+    expect(Database.splitPool(2)).toEqual({ maxStreams: 1, maxConcurrent: 1 });
+    expect(Database.splitPool(4)).toEqual({ maxStreams: 1, maxConcurrent: 3 });
+    expect(Database.splitPool(6)).toEqual({ maxStreams: 1, maxConcurrent: 5 });
+  });
+
+  test('gives streams at most a quarter of the pool', () => {
+    expect(Database.splitPool(10)).toEqual({ maxStreams: 2, maxConcurrent: 8 });
+    expect(Database.splitPool(12, 8)).toEqual({ maxStreams: 3, maxConcurrent: 9 });
+  });
+
+  test('never leaves streams or statements without a connection', () => {
+    expect(Database.splitPool(1)).toEqual({ maxStreams: 1, maxConcurrent: 1 });
+    expect(Database.splitPool(20, 0)).toEqual({ maxStreams: 1, maxConcurrent: 19 });
+  });
+});
+'''
+
+project_files["application/backend/lib/bulkhead.js"] = '''const { ServiceUnavailableError } = require('./errors');
+
+// Limits how many operations run concurrently and how many may wait for a
+// slot. Callers beyond the queue limit, or that wait longer than
+// queueTimeoutMs, are rejected immediately with a 503.
+class Bulkhead {
+  constructor(options = {}) {
+    this.maxConcurrent = options.maxConcurrent || 10;
+    this.maxQueue = options.maxQueue === undefined ? 40 : options.maxQueue;
+    this.queueTimeoutMs = options.queueTimeoutMs || 2000;
+    this.active = 0;
+    this.queue = [];
+  }
+
+  async run(operation) {
+    await this.enter();
+    try {
+      return await operation();
+    } finally {
+      this.leave();
+    }
+  }
+
+  enter() {
+    if (this.active < this.maxConcurrent) {
+      this.active += 1;
+      return Promise.resolve();
+    }
+
+    if (this.queue.length >= this.maxQueue) {
+      return Promise.reject(new ServiceUnavailableError('Database is saturated, please retry', {
+        code: 'BULKHEAD_FULL',
+        retryAfter: 1
+      }));
+    }
+
+    return new Promise((resolve, reject) => {
+      const waiter = { resolve, timer: null };
+      waiter.timer = setTimeout(() => {
+        this.queue.splice(this.queue.indexOf(waiter), 1);
+        reject(new ServiceUnavailableError('Timed out waiting for database capacity', {
+          code: 'BULKHEAD_TIMEOUT',
+          retryAfter: 1
+        }));
+      }, this.queueTimeoutMs);
+      this.queue.push(waiter);
+    });
+  }
+
+  // A finishing operation hands its slot straight to the oldest waiter
+  leave() {
+    const waiter = this.queue.shift();
+    if (waiter) {
+      clearTimeout(waiter.timer);
+      waiter.resolve();
+      return;
+    }
+    this.active -= 1;
+  }
+}
+
+// Opens when the failure rate over a rolling window crosses a threshold, then
+// rejects every call with a 503 until openMs has passed. One probe call is let
+// through afterwards (half-open); its outcome closes or re-opens the circuit.
+class CircuitBreaker {
+  constructor(options = {}) {
+    this.windowMs = options.windowMs || 10000;
+    this.bucketCount = 10;
+    this.minimumRequests = options.minimumRequests || 20;
+    this.failureRateThreshold = options.failureRateThreshold || 0.5;
+    this.openMs = options.openMs || 5000;
+    this.isFailure = options.isFailure || (() => true);
+
+    this.state = 'closed';
+    this.openedAt = 0;
+    this.probeInFlight = false;
+    this.buckets = [];
+  }
+
+  async run(operation) {
+    const probe = this.admit();
+    try {
+      const result = await operation();
+      this.record(false, probe);
+      return result;
+    } catch (error) {
+      this.record(this.isFailure(error), probe);
+      throw error;
+    }
+  }
+
+  // Returns true when the admitted call is the half-open probe
+  admit() {
+    if (this.state === 'closed') {
+      return false;
+    }
+
+    const remainingMs = this.openedAt + this.openMs - Date.now();
+    if (this.state === 'open' && remainingMs <= 0) {
+      this.state = 'half-open';
+    }
+    if (this.state === 'half-open' && !this.probeInFlight) {
+      this.probeInFlight = true;
+      return true;
+    }
+
+    throw new ServiceUnavailableError('Database temporarily unavailable, please retry', {
+      code: 'CIRCUIT_OPEN',
+      retryAfter: Math.max(1, Math.ceil(remainingMs / 1000))
+    });
+  }
+
+  record(failed, probe) {
+    if (probe) {
+      this.probeInFlight = false;
+      if (failed) {
+        this.open();
+      } else {
+        this.state = 'closed';
+        this.buckets = [];
+      }
+      return;
+    }
+
+    const bucket = this.currentBucket();
+    bucket.total += 1;
+    if (failed) {
+      bucket.failures += 1;
+    }
+
+    if (this.state === 'closed' && failed) {
+      let total = 0;
+      let failures = 0;
+      for (const entry of this.buckets) {
+        total += entry.total;
+        failures += entry.failures;
+      }
+      if (total >= this.minimumRequests && failures / total >= this.failureRateThreshold) {
+        this.open();
+      }
+    }
+  }
+
+  open() {
+    this.state = 'open';
+    this.openedAt = Date.now();
+    this.buckets = [];
+  }
+
+  currentBucket() {
+    const bucketMs = this.windowMs / this.bucketCount;
+    const start = Math.floor(Date.now() / bucketMs) * bucketMs;
+    const cutoff = start - this.windowMs;
+    while (this.buckets.length > 0 && this.buckets[0].start <= cutoff) {
+      this.buckets.shift();
+    }
+    let bucket = this.buckets[this.buckets.length - 1];
+    if (!bucket || bucket.start !== start) {
+      bucket = { start, total: 0, failures: 0 };
+      this.buckets.push(bucket);
+    }
+    return bucket;
+  }
+}
+
+module.exports = {
+  Bulkhead,
+  CircuitBreaker
+};
+'''
+
+project_files["application/backend/lib/single-flight.js"] = '''const metrics = require('./metrics');
+const requestContext = require('./request-context');
+
+// Coalesces concurrent identical reads: while a call for a key is in flight,
+// later callers with the same key share its promise instead of issuing their
+// own query. Results are shared, so callers must not mutate them.
+//
+// The shared operation runs in a context of its own, with a deadline of
+// budgetMs from when it starts, rather than in the first caller's request
+// context. Otherwise that caller's deadline and disconnect would fail the
+// read for every request waiting on it. Each caller is still bounded by
+// its own deadline, and is charged the operation's database time.
+class SingleFlight {
+  constructor(group, options = {}) {
+    this.group = group;
+    this.budgetMs = options.budgetMs;
+    this.inFlight = new Map();
+  }
+
+  do(key, operation) {
+    let flight = this.inFlight.get(key);
+    if (flight) {
+      metrics.recordSingleFlight(this.group, 'shared');
+    } else {
+      metrics.recordSingleFlight(this.group, 'leader');
+      flight = this.start(key, operation);
+    }
+
+    return flight.promise.finally(() => requestContext.addDbTime(flight.context.dbTimeMs));
+  }
+
+  start(key, operation) {
+    const caller = requestContext.current();
+    const context = {
+      dbTimeMs: 0,
+      // Database spans still go into the first caller's trace
+      span: caller ? caller.span : null,
+      deadline: this.budgetMs ? Date.now() + this.budgetMs : undefined,
+      signal: new AbortController().signal
+    };
+    const flight = { context, promise: null };
+    flight.promise = requestContext.run(context, () => Promise.resolve().then(operation))
+      .finally(() => {
+        if (this.inFlight.get(key) === flight) {
+          this.inFlight.delete(key);
+        }
+      });
+    this.inFlight.set(key, flight);
+    return flight;
+  }
+
+  // Called after a write so that reads starting afterwards do not join a
+  // query that may have begun before the write committed
+  forget() {
+    this.inFlight.clear();
+  }
+}
+
+module.exports = SingleFlight;
+'''
+
+project_files["application/backend/lib/etag.js"] = '''const crypto = require('crypto');
+
+// Strong ETag built from cheap version information (row count, last update
+// time, ...) instead of hashing the serialized response body.
+function strongEtag(...parts) {
+  const digest = crypto.createHash('sha1').update(parts.join('|')).digest('base64url');
+  return `"${digest.slice(0, 27)}"`;
+}
+
+// True when the client's If-None-Match already names this representation
+function isFresh(req, etag) {
+  const header = req.get('if-none-match');
+  if (!header) {
+    return false;
+  }
+  if (header.trim() === '*') {
+    return true;
+  }
+  return header.split(',').some((tag) => tag.trim().replace(/^W\\//, '') === etag);
+}
+
+// Sets validators on the response and reports whether a 304 was sent.
+// no-cache lets browsers (and axios running in them) keep the body but
+// revalidate it on every request.
+function handleConditionalGet(req, res, etag) {
+  res.set('ETag', etag);
+  res.set('Cache-Control', 'private, no-cache');
+  if (isFresh(req, etag)) {
+    res.status(304).end();
+    return true;
+  }
+  return false;
+}
+
+function timestampOf(value) {
+  return value instanceof Date ? value.getTime() : String(value);
+}
+
+module.exports = {
+  strongEtag,
+  isFresh,
+  handleConditionalGet,
+  timestampOf
+};
+'''
+
+project_files["application/backend/lib/lru-cache.js"] = '''// Small LRU cache with optional per-entry TTL and a total size budget.
+// A Map keeps insertion order, so re-inserting on access makes the first
+// key the least recently used one.
+class LRUCache {
+  constructor(options = {}) {
+    this.maxEntries = options.maxEntries || 1000;
+    this.maxSize = options.maxSize || Infinity;
+    this.ttlMs = options.ttlMs || 0;
+    this.sizeOf = options.sizeOf || (() => 1);
+    this.entries = new Map();
+    this.size = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    if (entry.expiresAt && entry.expiresAt <= Date.now()) {
+      this.delete(key);
+      return undefined;
+    }
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key, value, ttlMs = this.ttlMs) {
+    const size = this.sizeOf(value);
+    if (size > this.maxSize) {
+      return;
+    }
+    this.delete(key);
+    this.entries.set(key, { value, size, expiresAt: ttlMs ? Date.now() + ttlMs : 0 });
+    this.size += size;
+
+    while (this.entries.size > this.maxEntries || this.size > this.maxSize) {
+      this.delete(this.entries.keys().next().value);
+    }
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.entries.delete(key);
+      this.size -= entry.size;
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+    this.size = 0;
+  }
+}
+
+module.exports = LRUCache;
+'''
+
+project_files["application/backend/lib/response-cache.js"] = '''const zlib = require('zlib');
+const { promisify } = require('util');
+const LRUCache = require('./lru-cache');
+const metrics = require('./metrics');
+const tracing = require('./tracing');
+
+const gzip = promisify(zlib.gzip);
+const brotliCompress = promisify(zlib.brotliCompress);
+
+// Encodings in server preference order
+const ENCODINGS = ['br', 'gzip'];
+
+// Parses Accept-Encoding into { encoding: q }
+function parseAcceptEncoding(header) {
+  const accepted = {};
+  for (const part of (header || '').split(',')) {
+    const [name, ...params] = part.trim().toLowerCase().split(';');
+    if (!name) {
+      continue;
+    }
+    let q = 1;
+    for (const param of params) {
+      const [key, value] = param.trim().split('=');
+      if (key === 'q') {
+        q = parseFloat(value) || 0;
+      }
+    }
+    accepted[name] = q;
+  }
+  return accepted;
+}
+
+// Caches JSON response bodies keyed by their ETag, stored once uncompressed
+// and once per encoding. Repeated requests for the same representation are
+// served without serializing or compressing again. Bodies below the
+// threshold are stored and sent uncompressed.
+class CompressedResponseCache {
+  constructor(options = {}) {
+    this.threshold = options.threshold === undefined ? 1024 : options.threshold;
+    this.cache = new LRUCache({
+      maxEntries: options.maxEntries || 500,
+      maxSize: options.maxBytes || 32 * 1024 * 1024,
+      sizeOf: (entry) => entry.size
+    });
+    this.pending = new Map();
+  }
+
+  negotiate(req, entry) {
+    const accepted = parseAcceptEncoding(req.get('accept-encoding'));
+    for (const encoding of ENCODINGS) {
+      const q = accepted[encoding] !== undefined ? accepted[encoding] : accepted['*'];
+      if (entry[encoding] && q > 0) {
+        return encoding;
+      }
+    }
+    return 'identity';
+  }
+
+  async build(key, serialize) {
+    const identity = Buffer.from(tracing.traceSync('serialize', serialize));
+    const entry = { identity, size: identity.length };
+
+    if (identity.length >= this.threshold) {
+      const [gzipped, brotli] = await tracing.trace('compress', {}, () => Promise.all([
+        gzip(identity, { level: zlib.constants.Z_BEST_COMPRESSION }),
+        brotliCompress(identity, {
+          params: {
+            [zlib.constants.BROTLI_PARAM_QUALITY]: 9,
+            [zlib.constants.BROTLI_PARAM_SIZE_HINT]: identity.length
+          }
+        })
+      ]));
+      entry.gzip = gzipped;
+      entry.br = brotli;
+      entry.size += gzipped.length + brotli.length;
+    }
+
+    this.cache.set(key, entry);
+    return entry;
+  }
+
+  // Concurrent misses for the same key compress only once
+  async lookup(key, serialize) {
+    const cached = this.cache.get(key);
+    if (cached) {
+      metrics.recordCacheResult('responses', 'hit');
+      return cached;
+    }
+    metrics.recordCacheResult('responses', 'miss');
+
+    let pending = this.pending.get(key);
+    if (!pending) {
+      pending = this.build(key, serialize).finally(() => this.pending.delete(key));
+      this.pending.set(key, pending);
+    }
+    return pending;
+  }
+
+  async send(req, res, key, serialize) {
+    const entry = await this.lookup(key, serialize);
+    const encoding = this.negotiate(req, entry);
+    const body = entry[encoding];
+
+    res.set('Content-Type', 'application/json; charset=utf-8');
+    res.set('Vary', 'Accept-Encoding');
+    if (encoding !== 'identity') {
+      // Tells the compression middleware the body is already encoded
+      res.set('Content-Encoding', encoding);
+    }
+    res.set('Content-Length', String(body.length));
+    res.end(body);
+  }
+}
+
+module.exports = CompressedResponseCache;
+'''
+
+project_files["application/backend/lib/user-batch.js"] = '''// Helpers for the multi-row user endpoints
+
+// users.name and users.email are VARCHAR(255), counted in characters
+const MAX_FIELD_LENGTH = 255;
+
+// A concurrent batch inserted one of the same emails (it is found by the
+// next attempt) or the two batches deadlocked on the unique index
+const RETRYABLE_CODES = new Set(['ER_DUP_ENTRY', 'ER_LOCK_DEADLOCK']);
+const MAX_ATTEMPTS = 3;
+
+// Validates raw { name, email } items. Valid rows keep their position in the
+// request as `index` so results can be reported per row; Error items are rows
+// that could not be parsed and are reported with their message. Emails are compared
+// case-insensitively, matching the users.email unique index collation.
+function validateUserRows(items, startIndex = 0) {
+  const valid = [];
+  const errors = [];
+  const seen = new Set();
+
+  items.forEach((item, offset) => {
+    const index = startIndex + offset;
+    if (item instanceof Error) {
+      errors.push({ index, message: item.message });
+      return;
+    }
+    const name = item && typeof item.name === 'string' ? item.name.trim() : '';
+    const email = item && typeof item.email === 'string' ? item.email.trim() : '';
+
+    if (!name || !email) {
+      errors.push({ index, email: email || undefined, message: 'Name and email are required' });
+      return;
+    }
+    if ([...name].length > MAX_FIELD_LENGTH || [...email].length > MAX_FIELD_LENGTH) {
+      errors.push({ index, message: `Name and email must be at most ${MAX_FIELD_LENGTH} characters` });
+      return;
+    }
+
+    const key = email.toLowerCase();
+    if (seen.has(key)) {
+      errors.push({ index, email, message: 'Duplicate email within the batch' });
+      return;
+    }
+    seen.add(key);
+    valid.push({ index, name, email });
+  });
+
+  return { valid, errors };
+}
+
+// Inserts validated rows with a single multi-row INSERT. Emails that already
+// exist are reported as duplicates instead of failing the whole batch. The
+// existing emails are read without locks, so no gap locks are held against
+// concurrent batches; if one of them inserts the same email in between, the
+// INSERT fails and the transaction is run again, then finding that row.
+async function insertUserBatch(db, rows) {
+  if (rows.length === 0) {
+    return { created: [], duplicates: [] };
+  }
+
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await db.transaction((tx) => insertNewUsers(tx, rows));
+    } catch (error) {
+      if (!RETRYABLE_CODES.has(error.code) || attempt === MAX_ATTEMPTS) {
+        throw error;
+      }
+    }
+  }
+}
+
+async function insertNewUsers(tx, rows) {
+  const [existing] = await tx.query(
+    'SELECT email FROM users WHERE email IN (?)',
+    [rows.map((row) => row.email)]
+  );
+  const taken = new Set(existing.map((row) => row.email.toLowerCase()));
+  const fresh = rows.filter((row) => !taken.has(row.email.toLowerCase()));
+  const duplicates = rows
+    .filter((row) => taken.has(row.email.toLowerCase()))
+    .map(({ index, email }) => ({ index, email, message: 'User with this email already exists' }));
+
+  if (fresh.length === 0) {
+    return { created: [], duplicates };
+  }
+
+  // Every batch inserts in email order, so two batches sharing emails wait
+  // for one another instead of each holding a row the other needs
+  const ordered = [...fresh].sort((a, b) => a.email.toLowerCase().localeCompare(b.email.toLowerCase()));
+  await tx.query(
+    'INSERT INTO users (name, email) VALUES ?',
+    [ordered.map((row) => [row.name, row.email])]
+  );
+  const [created] = await tx.query(
+    'SELECT id, name, email, created_at FROM users WHERE email IN (?) ORDER BY id',
+    [fresh.map((row) => row.email)]
+  );
+
+  return { created, duplicates };
+}
+
+// Parses ?ids=1,2,3 (or repeated ids params) into unique positive integers.
+// Returns null when any entry is not a valid id.
+function parseIdList(value) {
+  const parts = (Array.isArray(value) ? value.join(',') : String(value))
+    .split(',')
+    .map((part) => part.trim())
+    .filter(Boolean);
+
+  const ids = [];
+  for (const part of parts) {
+    if (!/^[1-9][0-9]*$/.test(part)) {
+      return null;
+    }
+    ids.push(Number(part));
+  }
+  return ids.length > 0 ? [...new Set(ids)] : null;
+}
+
+module.exports = {
+  validateUserRows,
+  insertUserBatch,
+  parseIdList
+};
+'''
+
+project_files["application/backend/lib/user-search.js"] = '''const { HttpError } = require('./errors');
+
+// Prefix search over users. Email matches come first, then name matches
+// whose email did not match, each ordered by (column, id). Every page is
+// therefore a range scan on one index (the UNIQUE email key or idx_name)
+// that stops after `limit` rows, and the cursor records where it stopped.
+const PHASES = ['email', 'name'];
+
+function escapeLike(value) {
+  return value.replace(/[\\\\%_]/g, (char) => `\\\\${char}`);
+}
+
+// A cursor is [phase, value, id] of the last row returned, or
+// [phase, null, null] to start at the beginning of a phase
+function encodeCursor(phase, value, id) {
+  return Buffer.from(JSON.stringify([phase, value, id])).toString('base64url');
+}
+
+function decodeCursor(cursor) {
+  try {
+    const [phase, value, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    const atStart = value === null && id === null;
+    if (PHASES.includes(phase) && (atStart || (typeof value === 'string' && Number.isInteger(id)))) {
+      return { phase, value, id };
+    }
+  } catch (error) {
+    // Fall through to the 400 below
+  }
+  throw new HttpError(400, 'Invalid cursor', { code: 'INVALID_CURSOR' });
+}
+
+async function searchPhase(db, phase, pattern, after, limit) {
+  const conditions = [`${phase} LIKE ?`];
+  const params = [pattern];
+
+  if (phase === 'name') {
+    conditions.push('email NOT LIKE ?');
+    params.push(pattern);
+  }
+  if (after) {
+    conditions.push(`(${phase} > ? OR (${phase} = ? AND id > ?))`);
+    params.push(after.value, after.value, after.id);
+  }
+
+  const [rows] = await db.query(
+    `SELECT id, name, email, created_at FROM users
+     WHERE ${conditions.join(' AND ')}
+     ORDER BY ${phase}, id
+     LIMIT ?`,
+    [...params, limit]
+  );
+  return rows;
+}
+
+// Walks the phases from the cursor on. fetchPhase(phase, after, limit)
+// returns the next matches of one phase in (column, id) order, so storage
+// other than MySQL can page through results with the same cursors.
+async function paginateSearch(fetchPhase, { limit, cursor }) {
+  const start = cursor ? decodeCursor(cursor) : { phase: PHASES[0], value: null, id: null };
+  const data = [];
+
+  for (let i = PHASES.indexOf(start.phase); i < PHASES.length; i++) {
+    const phase = PHASES[i];
+    const after = phase === start.phase && start.value !== null ? start : null;
+    const remaining = limit - data.length;
+    // One extra row tells whether this phase has more matches
+    const rows = await fetchPhase(phase, after, remaining + 1);
+
+    if (rows.length > remaining) {
+      data.push(...rows.slice(0, remaining));
+      const last = data[data.length - 1];
+      return { data, nextCursor: encodeCursor(phase, last[phase], last.id) };
+    }
+    data.push(...rows);
+    if (data.length === limit && i + 1 < PHASES.length) {
+      return { data, nextCursor: encodeCursor(PHASES[i + 1], null, null) };
+    }
+  }
+
+  return { data, nextCursor: null };
+}
+
+// Returns up to `limit` users plus the cursor for the next page (null when
+// there are no more matches)
+function searchUsers(db, { q, limit, cursor }) {
+  const pattern = `${escapeLike(q)}%`;
+  return paginateSearch(
+    (phase, after, phaseLimit) => searchPhase(db, phase, pattern, after, phaseLimit),
+    { limit, cursor }
+  );
+}
+
+module.exports = {
+  paginateSearch,
+  searchUsers
+};
+'''
+
+project_files["application/backend/lib/user-list.js"] = '''const { HttpError } = require('./errors');
+
+// Pages of the user list, newest first, ordered by (created_at, id)
+// descending. The cursor records the last row returned, and the next page
+// is the range scan below it on idx_created_at (InnoDB secondary keys end
+// with the primary key), so a page costs the same however deep it is.
+
+// A cursor is [created_at in ms, id] of the last row returned
+function encodeCursor(user) {
+  return Buffer.from(JSON.stringify([new Date(user.created_at).getTime(), user.id])).toString('base64url');
+}
+
+function decodeCursor(cursor) {
+  try {
+    const [createdAt, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    if (Number.isInteger(createdAt) && Number.isInteger(id)) {
+      return { createdAt: new Date(createdAt), id };
+    }
+  } catch (error) {
+    // Fall through to the 400 below
+  }
+  throw new HttpError(400, 'Invalid cursor', { code: 'INVALID_CURSOR' });
+}
+
+// fetchAfter(after, limit) returns the next users after `after` (null for
+// the first page) in list order, so storage other than MySQL can page with
+// the same cursors
+async function paginateList(fetchAfter, { limit, cursor }) {
+  const after = cursor ? decodeCursor(cursor) : null;
+  // One extra row tells whether there is another page
+  const rows = await fetchAfter(after, limit + 1);
+
+  if (rows.length > limit) {
+    const data = rows.slice(0, limit);
+    return { data, nextCursor: encodeCursor(data[data.length - 1]) };
+  }
+  return { data: rows, nextCursor: null };
+}
+
+// Returns up to `limit` users plus the cursor for the next page (null on
+// the last page)
+function listUsersPage(db, { limit, cursor }) {
+  return paginateList(async (after, pageLimit) => {
+    const conditions = [];
+    const params = [];
+    if (after) {
+      conditions.push('(created_at < ? OR (created_at = ? AND id < ?))');
+      params.push(after.createdAt, after.createdAt, after.id);
+    }
+
+    // updated_at (as text, to keep its microseconds) is for the page ETag
+    const [rows] = await db.query(
+      `SELECT id, name, email, created_at,
+         DATE_FORMAT(updated_at, '%Y-%m-%d %H:%i:%s.%f') AS updated_at FROM users
+       ${conditions.length > 0 ? `WHERE ${conditions.join(' AND ')}` : ''}
+       ORDER BY created_at DESC, id DESC
+       LIMIT ?`,
+      [...params, pageLimit]
+    );
+    return rows;
+  }, { limit, cursor });
+}
+
+module.exports = {
+  paginateList,
+  listUsersPage
+};
+'''
+
+project_files["application/backend/lib/repositories/mysql-user-repository.js"] = '''const { insertUserBatch } = require('../user-batch');
+const { listUsersPage } = require('../user-list');
+const { searchUsers } = require('../user-search');
+
+const USER_COLUMNS = 'id, name, email, created_at';
+// updated_at as text: mysql2 turns TIMESTAMP(6) into a Date, which drops
+// the microseconds that tell writes within the same millisecond apart
+const withMicroseconds = (expression) => `DATE_FORMAT(${expression}, '%Y-%m-%d %H:%i:%s.%f')`;
+
+// Users table on MySQL, through the Database wrapper (bulkhead, breaker and
+// deadlines apply to every call). Rows are returned as mysql2 gives them.
+class MysqlUserRepository {
+  constructor(db) {
+    this.db = db;
+  }
+
+  // Cheap change indicator for ETags. Every write changes the row count or
+  // moves MAX(updated_at), which has microsecond precision. MAX is taken
+  // before formatting so it is read from the end of idx_updated_at.
+  async version() {
+    const [[row]] = await this.db.execute(
+      `SELECT COUNT(*) AS total, ${withMicroseconds('MAX(updated_at)')} AS last_modified FROM users`
+    );
+    return { total: row.total, lastModified: row.last_modified };
+  }
+
+  async list() {
+    const [rows] = await this.db.execute(
+      `SELECT ${USER_COLUMNS} FROM users ORDER BY created_at DESC`
+    );
+    return rows;
+  }
+
+  // { data, nextCursor } for one page of list(), see user-list.js
+  listPage(options) {
+    return listUsersPage(this.db, options);
+  }
+
+  // Includes updated_at, which the by-id ETag is built from
+  async findById(id) {
+    const [rows] = await this.db.execute(
+      `SELECT ${USER_COLUMNS}, ${withMicroseconds('updated_at')} AS updated_at FROM users WHERE id = ?`,
+      [id]
+    );
+    return rows[0] || null;
+  }
+
+  async findByIds(ids) {
+    const [rows] = await this.db.query(
+      `SELECT ${USER_COLUMNS} FROM users WHERE id IN (?)`,
+      [ids]
+    );
+    return rows;
+  }
+
+  search(options) {
+    return searchUsers(this.db, options);
+  }
+
+  // Returns the new user, or null when the email is already taken
+  async create({ name, email }) {
+    const [existing] = await this.db.execute(
+      'SELECT id FROM users WHERE email = ?',
+      [email]
+    );
+    if (existing.length > 0) {
+      return null;
+    }
+
+    const [result] = await this.db.execute(
+      'INSERT INTO users (name, email) VALUES (?, ?)',
+      [name, email]
+    );
+    return this.findCreated(result.insertId);
+  }
+
+  // Returns the updated user, or null when there is no user with that id
+  async update(id, { name, email }) {
+    const [result] = await this.db.execute(
+      'UPDATE users SET name = ?, email = ? WHERE id = ?',
+      [name, email, id]
+    );
+    if (result.affectedRows === 0) {
+      return null;
+    }
+    return this.findCreated(id);
+  }
+
+  async remove(id) {
+    const [result] = await this.db.execute(
+      'DELETE FROM users WHERE id = ?',
+      [id]
+    );
+    return result.affectedRows > 0;
+  }
+
+  insertBatch(rows) {
+    return insertUserBatch(this.db, rows);
+  }
+
+  // All users in primary key order on a stream connection (see
+  // Database.acquireStream), so the first row does not wait for a filesort.
+  // done(error) must be called once the stream has ended or failed; after an
+  // error the result set was not fully consumed, so the connection is
+  // destroyed rather than reused.
+  async streamAll(highWaterMark) {
+    const { connection, release } = await this.db.acquireStream();
+    const rows = connection.connection
+      .query(`SELECT ${USER_COLUMNS} FROM users ORDER BY id`)
+      .stream({ highWaterMark });
+
+    return { rows, done: release };
+  }
+
+  ping() {
+    return this.db.ping();
+  }
+
+  async findCreated(id) {
+    const [rows] = await this.db.execute(
+      `SELECT ${USER_COLUMNS} FROM users WHERE id = ?`,
+      [id]
+    );
+    return rows[0];
+  }
+}
+
+module.exports = MysqlUserRepository;
+'''
+
+project_files["application/backend/lib/repositories/memory-user-repository.js"] = '''const { Readable } = require('stream');
+const { paginateList } = require('../user-list');
+const { paginateSearch } = require('../user-search');
+
+// Users held in process memory, with the same interface and results as
+// MysqlUserRepository. It lets the API run without MySQL (DB_DRIVER=memory),
+// so HTTP benchmarks measure the Node process alone. latencyMs and jitterMs
+// add a simulated round trip to every call.
+class MemoryUserRepository {
+  constructor(options = {}) {
+    this.latencyMs = options.latencyMs || 0;
+    this.jitterMs = options.jitterMs || 0;
+    this.byId = new Map();
+    this.byEmail = new Map();
+    this.nextId = 1;
+    // Counts writes; it stands in for MAX(updated_at), which a clock with
+    // millisecond resolution would not move for every write
+    this.writes = 0;
+
+    for (let i = 1; i <= (options.seedUsers || 0); i++) {
+      this.insert({ name: `User ${i}`, email: `user${i}@example.com` });
+    }
+  }
+
+  delay() {
+    const ms = this.latencyMs + Math.random() * this.jitterMs;
+    return ms > 0 ? new Promise((resolve) => setTimeout(resolve, ms)) : Promise.resolve();
+  }
+
+  // Callers get copies, as they would get fresh rows from the driver
+  static toRow(user) {
+    return { id: user.id, name: user.name, email: user.email, created_at: user.created_at };
+  }
+
+  // Adds updated_at, which ETags are built from. It carries the number of
+  // the user's last write, so writes within one millisecond differ too.
+  static toVersionedRow(user) {
+    return {
+      ...MemoryUserRepository.toRow(user),
+      updated_at: `${user.updated_at.toISOString()}#${user.revision}`
+    };
+  }
+
+  insert({ name, email }) {
+    const now = new Date();
+    const user = { id: this.nextId++, name, email, created_at: now, updated_at: now };
+    this.byId.set(user.id, user);
+    this.byEmail.set(email.toLowerCase(), user);
+    this.writes += 1;
+    user.revision = this.writes;
+    return user;
+  }
+
+  async version() {
+    await this.delay();
+    return { total: this.byId.size, lastModified: this.writes };
+  }
+
+  async list() {
+    await this.delay();
+    return Array.from(this.byId.values())
+      .reverse()
+      .map(MemoryUserRepository.toRow);
+  }
+
+  async listPage({ limit, cursor }) {
+    await this.delay();
+    const users = Array.from(this.byId.values());
+
+    return paginateList(async (after, pageLimit) => users
+      .filter((user) => !after || compareCreated(user, { created_at: after.createdAt, id: after.id }) > 0)
+      .sort(compareCreated)
+      .slice(0, pageLimit)
+      .map(MemoryUserRepository.toVersionedRow), { limit, cursor });
+  }
+
+  async findById(id) {
+    await this.delay();
+    const user = this.byId.get(Number(id));
+    return user ? MemoryUserRepository.toVersionedRow(user) : null;
+  }
+
+  async findByIds(ids) {
+    await this.delay();
+    return ids
+      .map((id) => this.byId.get(id))
+      .filter(Boolean)
+      .map(MemoryUserRepository.toRow);
+  }
+
+  // Case-insensitive prefix match, ordered like the MySQL collation would
+  async search({ q, limit, cursor }) {
+    await this.delay();
+    const prefix = q.toLowerCase();
+    const users = Array.from(this.byId.values());
+
+    return paginateSearch(async (phase, after, phaseLimit) => users
+      .filter((user) => user[phase].toLowerCase().startsWith(prefix))
+      .filter((user) => phase !== 'name' || !user.email.toLowerCase().startsWith(prefix))
+      .filter((user) => !after || compareUsers(phase, user, { [phase]: after.value, id: after.id }) > 0)
+      .sort((a, b) => compareUsers(phase, a, b))
+      .slice(0, phaseLimit)
+      .map(MemoryUserRepository.toRow), { limit, cursor });
+  }
+
+  async create({ name, email }) {
+    await this.delay();
+    if (this.byEmail.has(email.toLowerCase())) {
+      return null;
+    }
+    return MemoryUserRepository.toRow(this.insert({ name, email }));
   }
-});
 
-// Error handling middleware
-app.use((err, req, res, next) => {
-  logger.error('Unhandled error:', err);
-  res.status(500).json({
-    success: false,
-    message: 'Internal server error'
-  });
-});
+  async update(id, { name, email }) {
+    await this.delay();
+    const user = this.byId.get(Number(id));
+    if (!user) {
+      return null;
+    }
 
-// 404 handler
-app.use('*', (req, res) => {
-  res.status(404).json({
-    success: false,
-    message: 'Route not found'
-  });
-});
+    const owner = this.byEmail.get(email.toLowerCase());
+    if (owner && owner !== user) {
+      // What the UNIQUE key makes MySQL report
+      const error = new Error(`Duplicate entry '${email}' for key 'users.email'`);
+      error.code = 'ER_DUP_ENTRY';
+      throw error;
+    }
 
-// Graceful shutdown
-process.on('SIGTERM', async () => {
-  logger.info('SIGTERM received, shutting down gracefully');
-  if (pool) {
-    await pool.end();
+    this.byEmail.delete(user.email.toLowerCase());
+    user.name = name;
+    user.email = email;
+    user.updated_at = new Date();
+    this.byEmail.set(email.toLowerCase(), user);
+    this.writes += 1;
+    user.revision = this.writes;
+    return MemoryUserRepository.toRow(user);
   }
-  process.exit(0);
-});
 
-process.on('SIGINT', async () => {
-  logger.info('SIGINT received, shutting down gracefully');
-  if (pool) {
-    await pool.end();
+  async remove(id) {
+    await this.delay();
+    const user = this.byId.get(Number(id));
+    if (!user) {
+      return false;
+    }
+    this.byId.delete(user.id);
+    this.byEmail.delete(user.email.toLowerCase());
+    this.writes += 1;
+    return true;
   }
-  process.exit(0);
-});
 
-// Start server
-async function startServer() {
-  await initializeDatabase();
-  
-  app.listen(PORT, '0.0.0.0', () => {
-    logger.info(\`Server running on port \${PORT}\`);
-    logger.info(\`Environment: \${process.env.NODE_ENV || 'development'}\`);
-  });
+  // Rows are already validated and unique within the batch
+  async insertBatch(rows) {
+    await this.delay();
+    const created = [];
+    const duplicates = [];
+
+    for (const row of rows) {
+      if (this.byEmail.has(row.email.toLowerCase())) {
+        duplicates.push({ index: row.index, email: row.email, message: 'User with this email already exists' });
+      } else {
+        created.push(MemoryUserRepository.toRow(this.insert(row)));
+      }
+    }
+    return { created, duplicates };
+  }
+
+  async streamAll(highWaterMark) {
+    await this.delay();
+    const users = Array.from(this.byId.values(), MemoryUserRepository.toRow);
+    return {
+      rows: Readable.from(users, { highWaterMark }),
+      done() {}
+    };
+  }
+
+  async ping() {
+    await this.delay();
+  }
 }
 
-startServer().catch(error => {
-  logger.error('Failed to start server:', error);
-  process.exit(1);
-});
+function compareUsers(phase, a, b) {
+  const left = a[phase].toLowerCase();
+  const right = b[phase].toLowerCase();
+  if (left !== right) {
+    return left < right ? -1 : 1;
+  }
+  return a.id - b.id;
+}
 
-module.exports = app;
+// Newest first, as ORDER BY created_at DESC, id DESC
+function compareCreated(a, b) {
+  return (b.created_at - a.created_at) || (b.id - a.id);
+}
+
+module.exports = MemoryUserRepository;
+'''
+
+project_files["application/backend/lib/repositories/index.js"] = '''const MysqlUserRepository = require('./mysql-user-repository');
+const MemoryUserRepository = require('./memory-user-repository');
+
+module.exports = {
+  MysqlUserRepository,
+  MemoryUserRepository
+};
 '''
 
 project_files["application/backend/Dockerfile"] = '''FROM node:18-alpine
@@ -397,8 +4433,8 @@ USER nodejs
 # Expose port
 EXPOSE 3000
 
-# Health check
-HEALTHCHECK --interval=30s --timeout=3s --start-period=5s --retries=3 \\
+# Health check (liveness; readiness is left to the load balancer)
+HEALTHCHECK --interval=30s --timeout=3s --start-period=30s --retries=3 \\
   CMD node -e "require('http').request({port: 3000, path: '/health'}, (res) => { process.exit(res.statusCode === 200 ? 0 : 1) }).end()"
 
 # Start the application
@@ -424,6 +4460,7 @@ project_files["application/frontend/package.json"] = '''{
     "axios": "^1.4.0",
     "styled-components": "^5.3.11",
     "react-toastify": "^9.1.3",
+    "react-window": "^1.8.10",
     "web-vitals": "^3.4.0"
   },
   "scripts": {
@@ -477,37 +4514,57 @@ project_files["application/frontend/public/index.html"] = '''<!DOCTYPE html>
 </html>
 '''
 
-project_files["application/frontend/src/App.js"] = '''import React, { useState, useEffect } from 'react';
+project_files["application/frontend/src/App.js"] = '''import React, { useState, useEffect, useCallback, useRef } from 'react';
 import axios from 'axios';
 import { ToastContainer, toast } from 'react-toastify';
 import 'react-toastify/dist/ReactToastify.css';
 import './App.css';
+import UserGrid from './UserGrid';
+import usePagedList from './usePagedList';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:3000';
+const USERS_URL = `${API_BASE_URL}/api/users`;
+const EMPTY_FORM = { name: '', email: '' };
+
+// The user was changed or removed by someone else (or the email is taken),
+// so local state cannot simply be rolled back and the list is reloaded
+const isConflict = (error) => [404, 409].includes(error.response?.status);
 
 function App() {
-  const [users, setUsers] = useState([]);
-  const [loading, setLoading] = useState(false);
-  const [formData, setFormData] = useState({ name: '', email: '' });
+  // Pages of the list are fetched as it is scrolled; users holds the pages
+  // currently kept, which come after `offset` users that were dropped
+  const {
+    users,
+    offset,
+    hasMore,
+    loading: pageLoading,
+    error: fetchError,
+    loadNext,
+    loadPrevious,
+    reload: fetchUsers,
+    setUsers,
+    invalidateFirstPage
+  } = usePagedList(USERS_URL);
+  const loading = pageLoading !== null && users.length === 0 && offset === 0;
+  const refreshing = pageLoading === 'reload';
+  const [formData, setFormData] = useState(EMPTY_FORM);
   const [editingUser, setEditingUser] = useState(null);
 
-  useEffect(() => {
-    fetchUsers();
-  }, []);
+  // Latest state for the card handlers, which stay the same across renders
+  // so that UserGrid's memoized cards do not re-render on every change
+  const latest = useRef({});
+  latest.current = { users, editingUser };
 
-  const fetchUsers = async () => {
-    try {
-      setLoading(true);
-      const response = await axios.get(\`\${API_BASE_URL}/api/users\`);
-      setUsers(response.data.data || []);
-    } catch (error) {
-      console.error('Error fetching users:', error);
+  useEffect(() => {
+    if (fetchError) {
+      console.error('Error fetching users:', fetchError);
       toast.error('Failed to fetch users');
-    } finally {
-      setLoading(false);
     }
-  };
+  }, [fetchError]);
 
+  // Mutations are applied to the list straight away and then replaced with
+  // the row the API returns, instead of reloading the whole list. A failed
+  // request rolls its change back; a conflict reloads the list.
   const handleSubmit = async (e) => {
     e.preventDefault();
     
@@ -516,55 +4573,96 @@ function App() {
       return;
     }
 
+    const submitted = formData;
+    const previous = editingUser;
+    // Placeholder row until the API assigns an id
+    const pendingId = `pending-${Date.now()}`;
+
+    if (previous) {
+      setUsers((current) => current.map((user) => (
+        user.id === previous.id ? { ...user, ...submitted } : user
+      )));
+      setEditingUser(null);
+    } else if (offset === 0) {
+      // New users go first in the list, so the row is only shown while the
+      // top of the list is held
+      setUsers((current) => [
+        { id: pendingId, ...submitted, created_at: new Date().toISOString(), pending: true },
+        ...current
+      ]);
+    }
+    setFormData(EMPTY_FORM);
+
     try {
-      setLoading(true);
-      
-      if (editingUser) {
-        await axios.put(\`\${API_BASE_URL}/api/users/\${editingUser.id}\`, formData);
+      if (previous) {
+        const response = await axios.put(`${USERS_URL}/${previous.id}`, submitted);
+        const saved = response.data.data;
+        setUsers((current) => current.map((user) => (user.id === previous.id ? saved : user)));
         toast.success('User updated successfully');
-        setEditingUser(null);
       } else {
-        await axios.post(\`\${API_BASE_URL}/api/users\`, formData);
+        const response = await axios.post(USERS_URL, submitted);
+        const saved = response.data.data;
+        if (latest.current.users.some((user) => user.id === pendingId)) {
+          setUsers((current) => current.map((user) => (user.id === pendingId ? saved : user)));
+        } else {
+          invalidateFirstPage();
+        }
         toast.success('User created successfully');
       }
-      
-      setFormData({ name: '', email: '' });
-      await fetchUsers();
     } catch (error) {
       console.error('Error saving user:', error);
+      if (isConflict(error)) {
+        fetchUsers();
+      } else if (previous) {
+        setUsers((current) => current.map((user) => (user.id === previous.id ? previous : user)));
+      } else {
+        setUsers((current) => current.filter((user) => user.id !== pendingId));
+      }
+      // Give the form back so the change can be corrected and retried,
+      // unless the user no longer exists
+      if (error.response?.status !== 404) {
+        setEditingUser(previous);
+        setFormData(submitted);
+      }
       const message = error.response?.data?.message || 'Failed to save user';
       toast.error(message);
-    } finally {
-      setLoading(false);
     }
   };
 
-  const handleEdit = (user) => {
+  const handleEdit = useCallback((user) => {
     setEditingUser(user);
     setFormData({ name: user.name, email: user.email });
-  };
+  }, []);
 
-  const handleDelete = async (userId) => {
+  const handleDelete = useCallback(async (deleted) => {
     if (!window.confirm('Are you sure you want to delete this user?')) {
       return;
     }
 
+    const index = latest.current.users.findIndex((user) => user.id === deleted.id);
+    setUsers((current) => current.filter((user) => user.id !== deleted.id));
+    if (latest.current.editingUser?.id === deleted.id) {
+      setEditingUser(null);
+      setFormData(EMPTY_FORM);
+    }
+
     try {
-      setLoading(true);
-      await axios.delete(\`\${API_BASE_URL}/api/users/\${userId}\`);
+      await axios.delete(`${USERS_URL}/${deleted.id}`);
       toast.success('User deleted successfully');
-      await fetchUsers();
     } catch (error) {
       console.error('Error deleting user:', error);
+      if (isConflict(error)) {
+        fetchUsers();
+      } else {
+        setUsers((current) => [...current.slice(0, index), deleted, ...current.slice(index)]);
+      }
       toast.error('Failed to delete user');
-    } finally {
-      setLoading(false);
     }
-  };
+  }, [fetchUsers, setUsers]);
 
   const handleCancel = () => {
     setEditingUser(null);
-    setFormData({ name: '', email: '' });
+    setFormData(EMPTY_FORM);
   };
 
   return (
@@ -601,7 +4699,7 @@ function App() {
               </div>
               <div className="form-actions">
                 <button type="submit" disabled={loading} className="btn btn-primary">
-                  {loading ? 'Processing...' : (editingUser ? 'Update User' : 'Add User')}
+                  {editingUser ? 'Update User' : 'Add User'}
                 </button>
                 {editingUser && (
                   <button type="button" onClick={handleCancel} className="btn btn-secondary">
@@ -614,48 +4712,30 @@ function App() {
 
           <section className="users-section">
             <div className="section-header">
-              <h2>Users ({users.length})</h2>
-              <button onClick={fetchUsers} disabled={loading} className="btn btn-refresh">
-                {loading ? '⟳' : '🔄'} Refresh
+              <h2>Users ({offset + users.length}{hasMore ? '+' : ''})</h2>
+              <button onClick={fetchUsers} disabled={refreshing} className="btn btn-refresh">
+                {refreshing ? '⟳' : '🔄'} Refresh
               </button>
             </div>
             
-            {loading && users.length === 0 ? (
+            {loading ? (
               <div className="loading">Loading users...</div>
-            ) : users.length === 0 ? (
+            ) : offset + users.length === 0 && !hasMore ? (
               <div className="empty-state">
                 <p>No users found. Add your first user above!</p>
               </div>
             ) : (
-              <div className="users-grid">
-                {users.map((user) => (
-                  <div key={user.id} className="user-card">
-                    <div className="user-info">
-                      <h3>{user.name}</h3>
-                      <p className="user-email">{user.email}</p>
-                      <p className="user-date">
-                        Created: {new Date(user.created_at).toLocaleDateString()}
-                      </p>
-                    </div>
-                    <div className="user-actions">
-                      <button
-                        onClick={() => handleEdit(user)}
-                        className="btn btn-edit"
-                        disabled={loading}
-                      >
-                        ✏️ Edit
-                      </button>
-                      <button
-                        onClick={() => handleDelete(user.id)}
-                        className="btn btn-delete"
-                        disabled={loading}
-                      >
-                        🗑️ Delete
-                      </button>
-                    </div>
-                  </div>
-                ))}
-              </div>
+              <UserGrid
+                users={users}
+                offset={offset}
+                hasMore={hasMore}
+                loadFailed={Boolean(fetchError) && pageLoading === null}
+                disabled={loading}
+                onEdit={handleEdit}
+                onDelete={handleDelete}
+                onLoadPrevious={loadPrevious}
+                onLoadMore={loadNext}
+              />
             )}
           </section>
         </div>
@@ -684,6 +4764,631 @@ function App() {
 export default App;
 '''
 
+project_files["application/frontend/src/UserGrid.js"] = '''import React, { memo, useEffect, useMemo, useRef, useState } from 'react';
+import { FixedSizeList, areEqual } from 'react-window';
+
+// Only the rows in view (plus OVERSCAN_ROWS on each side) are rendered, so
+// the DOM stays the same size whether there are a hundred users or 100k.
+// Rows have a fixed height; ROW_HEIGHT and GAP must match .users-grid-row
+// and .user-card in App.css.
+//
+// The users shown can be a window of a longer list: `offset` users before
+// them are drawn as placeholders, and with `hasMore` a last row stands for
+// the users after them. Sentinels in those rows call onLoadPrevious and
+// onLoadMore when they come near the visible part of the list.
+const CARD_MIN_WIDTH = 300;
+const GAP = 24;
+const ROW_HEIGHT = 200;
+const MAX_HEIGHT = 720;
+const OVERSCAN_ROWS = 2;
+
+// One formatter for all cards; toLocaleDateString() builds a new one per call
+const dateFormat = new Intl.DateTimeFormat();
+
+const UserCard = memo(function UserCard({ user, disabled, onEdit, onDelete }) {
+  return (
+    <div className={user.pending ? 'user-card pending' : 'user-card'}>
+      <div className="user-info">
+        <h3 title={user.name}>{user.name}</h3>
+        <p className="user-email" title={user.email}>{user.email}</p>
+        <p className="user-date">
+          Created: {dateFormat.format(new Date(user.created_at))}
+        </p>
+      </div>
+      <div className="user-actions">
+        <button
+          onClick={() => onEdit(user)}
+          className="btn btn-edit"
+          disabled={disabled || user.pending}
+        >
+          ✏️ Edit
+        </button>
+        <button
+          onClick={() => onDelete(user)}
+          className="btn btn-delete"
+          disabled={disabled || user.pending}
+        >
+          🗑️ Delete
+        </button>
+      </div>
+    </div>
+  );
+});
+
+// Calls onVisible when the element comes within a few rows of the list's
+// viewport. The observer is created again whenever `rows` changes, which
+// calls onVisible again if the sentinel is still in view after a load.
+function Sentinel({ rootRef, rows, onVisible, className, style, children }) {
+  const ref = useRef(null);
+
+  useEffect(() => {
+    const observer = new IntersectionObserver(([entry]) => {
+      if (entry.isIntersecting) {
+        onVisible();
+      }
+    }, { root: rootRef.current, rootMargin: `${ROW_HEIGHT * OVERSCAN_ROWS}px 0px` });
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [rootRef, rows, onVisible]);
+
+  return <div ref={ref} className={className} style={style}>{children}</div>;
+}
+
+const UserRow = memo(function UserRow({ index, style, data }) {
+  const { users, offset, columns, loadFailed, disabled, onEdit, onDelete } = data;
+  const { onLoadPrevious, onLoadMore, rootRef } = data;
+  const start = index * columns;
+  const end = Math.min(start + columns, offset + users.length);
+  const rows = `${offset}:${users.length}`;
+
+  if (start >= offset + users.length) {
+    return (
+      <Sentinel
+        rootRef={rootRef}
+        rows={rows}
+        onVisible={onLoadMore}
+        className="users-grid-more"
+        style={style}
+      >
+        {loadFailed ? (
+          <button onClick={onLoadMore} className="btn btn-refresh">Retry</button>
+        ) : 'Loading more users...'}
+      </Sentinel>
+    );
+  }
+
+  const cards = [];
+  for (let i = start; i < end; i++) {
+    const user = users[i - offset];
+    cards.push(user ? (
+      <UserCard
+        key={user.id}
+        user={user}
+        disabled={disabled}
+        onEdit={onEdit}
+        onDelete={onDelete}
+      />
+    ) : <div key={`placeholder-${i}`} className="user-card placeholder" />);
+  }
+
+  const rowStyle = { ...style, gridTemplateColumns: `repeat(${columns}, minmax(0, 1fr))` };
+  if (start < offset) {
+    return (
+      <Sentinel
+        rootRef={rootRef}
+        rows={rows}
+        onVisible={onLoadPrevious}
+        className="users-grid-row"
+        style={rowStyle}
+      >
+        {cards}
+      </Sentinel>
+    );
+  }
+
+  return (
+    <div className="users-grid-row" style={rowStyle}>
+      {cards}
+    </div>
+  );
+}, areEqual);
+
+// Rows are keyed by their first user, so existing rows keep their DOM when
+// users are added or removed elsewhere in the list
+function rowKey(index, data) {
+  const position = index * data.columns;
+  if (position < data.offset) {
+    return `placeholder-${index}`;
+  }
+  const user = data.users[position - data.offset];
+  return user ? user.id : 'more';
+}
+
+function useWidth(ref) {
+  const [width, setWidth] = useState(0);
+
+  useEffect(() => {
+    const observer = new ResizeObserver(([entry]) => setWidth(entry.contentRect.width));
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [ref]);
+
+  return width;
+}
+
+// Windowed grid of user cards. The callbacks should be stable
+// (useCallback), or every change in the parent re-renders all visible cards.
+function UserGrid({
+  users,
+  offset = 0,
+  hasMore = false,
+  loadFailed = false,
+  disabled,
+  onEdit,
+  onDelete,
+  onLoadPrevious,
+  onLoadMore
+}) {
+  const containerRef = useRef(null);
+  const outerRef = useRef(null);
+  const width = useWidth(containerRef);
+  const columns = Math.max(1, Math.floor((width + GAP) / (CARD_MIN_WIDTH + GAP)));
+  const rowCount = Math.ceil((offset + users.length) / columns) + (hasMore ? 1 : 0);
+  const itemData = useMemo(
+    () => ({
+      users,
+      offset,
+      columns,
+      loadFailed,
+      disabled,
+      onEdit,
+      onDelete,
+      onLoadPrevious,
+      onLoadMore,
+      rootRef: outerRef
+    }),
+    [users, offset, columns, loadFailed, disabled, onEdit, onDelete, onLoadPrevious, onLoadMore]
+  );
+
+  return (
+    <div ref={containerRef} className="users-grid">
+      {width > 0 && (
+        <FixedSizeList
+          height={Math.min(rowCount * ROW_HEIGHT, MAX_HEIGHT)}
+          width={width}
+          itemCount={rowCount}
+          itemSize={ROW_HEIGHT}
+          itemData={itemData}
+          itemKey={rowKey}
+          outerRef={outerRef}
+          overscanCount={OVERSCAN_ROWS}
+        >
+          {UserRow}
+        </FixedSizeList>
+      )}
+    </div>
+  );
+}
+
+export default UserGrid;
+'''
+
+project_files["application/frontend/src/requestCache.js"] = '''import axios from 'axios';
+
+// Small data layer for GET requests. Responses are cached by URL and query
+// parameters (so each page cursor has its own entry), and:
+//  - concurrent requests for the same key share one HTTP request;
+//  - cached data is returned at once, and revalidated in the background
+//    when it is older than staleMs (stale-while-revalidate);
+//  - a request nobody waits for any more, because its caller gave up or
+//    moved on to another key, is cancelled with its AbortController;
+//  - local writes (mutate) win over revalidations that were already in
+//    flight, so optimistic updates are not overwritten by older data.
+
+const DEFAULT_STALE_MS = 30 * 1000;
+const MAX_ENTRIES = 200;
+
+const entries = new Map();
+
+function cacheKey(url, params) {
+  const query = Object.keys(params || {})
+    .filter((name) => params[name] !== undefined && params[name] !== null && params[name] !== '')
+    .sort()
+    .map((name) => `${name}=${encodeURIComponent(params[name])}`)
+    .join('&');
+  return query ? `${url}?${query}` : url;
+}
+
+// Drops the least recently used entries that are not being loaded
+function evict() {
+  for (const [key, entry] of entries) {
+    if (entries.size <= MAX_ENTRIES) {
+      return;
+    }
+    if (!entry.request) {
+      entries.delete(key);
+    }
+  }
+}
+
+function entryFor(url, params) {
+  const key = cacheKey(url, params);
+  let entry = entries.get(key);
+  if (entry) {
+    // Map order doubles as recency for evict()
+    entries.delete(key);
+  } else {
+    entry = {
+      url,
+      params,
+      data: undefined,
+      updatedAt: 0,
+      version: 0,
+      request: null,
+      controller: null,
+      waiting: 0
+    };
+  }
+  entries.set(key, entry);
+  evict();
+  return entry;
+}
+
+function load(entry) {
+  if (entry.request) {
+    return entry.request;
+  }
+
+  const controller = new AbortController();
+  const version = entry.version;
+  entry.controller = controller;
+
+  entry.request = axios.get(entry.url, { params: entry.params, signal: controller.signal })
+    .then((response) => {
+      if (entry.version === version) {
+        entry.data = response.data;
+        entry.updatedAt = Date.now();
+      }
+      return entry.data;
+    })
+    .finally(() => {
+      entry.request = null;
+      entry.controller = null;
+    });
+  return entry.request;
+}
+
+// Marks a waiter as gone and cancels the request once nobody is left
+function release(entry) {
+  entry.waiting -= 1;
+  if (entry.waiting === 0 && entry.controller) {
+    entry.controller.abort();
+  }
+}
+
+// Reloads a stale entry in the background and passes the new data to
+// onUpdate, unless it was replaced by mutate() in the meantime
+function revalidate(entry, signal, onUpdate) {
+  const { version } = entry;
+  load(entry).then((data) => {
+    if (onUpdate && !(signal && signal.aborted) && entry.version === version) {
+      onUpdate(data);
+    }
+  }, () => {});
+}
+
+// Resolves with the data for url and params. Cached data is returned at
+// once, even when stale; a stale entry is then reloaded in the background
+// and options.onUpdate(data) is called with the result. Without cached data
+// the promise waits for a (shared) request. Aborting options.signal stops
+// waiting, which cancels the request if nobody else is waiting for it; the
+// caller should check signal.aborted before using the result.
+export function request(url, params, options = {}) {
+  const staleMs = options.staleMs === undefined ? DEFAULT_STALE_MS : options.staleMs;
+  const { signal, onUpdate } = options;
+  const entry = entryFor(url, params);
+  if (entry.data !== undefined) {
+    if (Date.now() - entry.updatedAt > staleMs) {
+      revalidate(entry, signal, onUpdate);
+    }
+    return Promise.resolve(entry.data);
+  }
+
+  let waiting = true;
+  const stopWaiting = () => {
+    if (waiting) {
+      waiting = false;
+      release(entry);
+    }
+  };
+  entry.waiting += 1;
+  if (signal) {
+    signal.addEventListener('abort', stopWaiting, { once: true });
+  }
+  return load(entry).finally(() => {
+    if (signal) {
+      signal.removeEventListener('abort', stopWaiting);
+    }
+    stopWaiting();
+  });
+}
+
+// Fetches into the cache without rendering anything, e.g. the next page
+export function prefetch(url, params, staleMs = DEFAULT_STALE_MS) {
+  request(url, params, { staleMs }).catch(() => {});
+}
+
+// Replaces cached data with updater(data). Revalidations already in flight
+// for the entry are discarded when they complete. An updater returning the
+// data it was given changes nothing.
+export function mutate(url, params, updater) {
+  const entry = entryFor(url, params);
+  const data = updater(entry.data);
+  if (data !== entry.data) {
+    entry.version += 1;
+    entry.data = data;
+  }
+}
+
+// Marks one entry, or with params omitted every entry whose key starts with
+// url, as stale, so its next use reloads it
+export function invalidate(url, params) {
+  const prefix = params ? cacheKey(url, params) : url;
+  entries.forEach((entry, key) => {
+    if (params ? key === prefix : key.startsWith(prefix)) {
+      entry.updatedAt = 0;
+    }
+  });
+}
+'''
+
+project_files["application/frontend/src/usePagedList.js"] = '''import axios from 'axios';
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { invalidate, mutate, prefetch, request } from './requestCache';
+
+// Pages of a cursor-paginated list ({ data, nextCursor } per page), loaded
+// on demand as the list scrolls. At most MAX_PAGES pages are held: going
+// further down drops pages from the top, which become `offset` rows the
+// grid draws as placeholders and loads again if they are scrolled back to
+// (the bottom pages are dropped then). Pages go through the request cache:
+// a cached page is shown at once and replaced when its revalidation brings
+// newer rows, local changes are written back to the cached pages, and the
+// page after the last loaded one is prefetched so it is usually there by
+// the time the end of the list is reached.
+const PAGE_SIZE = 50;
+const MAX_PAGES = 10;
+
+// pages and earlier are { cursor, count } for the pages held and those
+// dropped above them. nextCursor is null once the last page is loaded.
+// The first page is requested on mount.
+const INITIAL_STATE = {
+  users: [],
+  pages: [],
+  earlier: [],
+  offset: 0,
+  nextCursor: '',
+  loading: 'reload',
+  error: null
+};
+
+function appendPage(state, cursor, body) {
+  let { users, pages, earlier, offset } = state;
+  users = [...users, ...body.data];
+  pages = [...pages, { cursor, count: body.data.length }];
+
+  if (pages.length > MAX_PAGES) {
+    const [first, ...rest] = pages;
+    users = users.slice(first.count);
+    earlier = [...earlier, first];
+    offset += first.count;
+    pages = rest;
+  }
+  return { users, pages, earlier, offset, nextCursor: body.nextCursor, loading: null, error: null };
+}
+
+function prependPage(state, cursor, body) {
+  const dropped = state.earlier[state.earlier.length - 1];
+  // Rows may have moved between pages since the page was dropped
+  const held = new Set(state.users.map((user) => user.id));
+  const data = body.data.filter((user) => !held.has(user.id));
+  let users = [...data, ...state.users];
+  let pages = [{ cursor, count: data.length }, ...state.pages];
+  let { nextCursor } = state;
+
+  if (pages.length > MAX_PAGES) {
+    const last = pages[pages.length - 1];
+    users = users.slice(0, users.length - last.count);
+    pages = pages.slice(0, -1);
+    nextCursor = last.cursor;
+  }
+  return {
+    users,
+    pages,
+    earlier: state.earlier.slice(0, -1),
+    offset: Math.max(state.offset - dropped.count, 0),
+    nextCursor,
+    loading: null,
+    error: null
+  };
+}
+
+// Swaps in newer rows for a page still held, keeping rows created locally
+// that are not confirmed yet
+function replacePage(state, cursor, body) {
+  const index = state.pages.findIndex((page) => page.cursor === cursor);
+  if (index === -1) {
+    return state;
+  }
+  const start = state.pages.slice(0, index).reduce((sum, page) => sum + page.count, 0);
+  const end = start + state.pages[index].count;
+  const others = new Set([...state.users.slice(0, start), ...state.users.slice(end)].map((user) => user.id));
+  const data = [
+    ...state.users.slice(start, end).filter((user) => user.pending),
+    ...body.data.filter((user) => !others.has(user.id))
+  ];
+
+  return {
+    ...state,
+    users: [...state.users.slice(0, start), ...data, ...state.users.slice(end)],
+    pages: state.pages.map((page, i) => (i === index ? { ...page, count: data.length } : page)),
+    nextCursor: index === state.pages.length - 1 ? body.nextCursor : state.nextCursor
+  };
+}
+
+function sameRows(a, b) {
+  return a.length === b.length && a.every((row, i) => row === b[i]);
+}
+
+// Page sizes after a local change to the rows: every row stays on the page
+// it was on, and new rows join the page of the row before them
+function recount(pages, previous, next) {
+  if (pages.length === 0) {
+    return pages;
+  }
+  const pageOf = new Map();
+  let row = 0;
+  pages.forEach((page, index) => {
+    for (let i = 0; i < page.count; i++) {
+      pageOf.set(previous[row++].id, index);
+    }
+  });
+
+  const counts = pages.map(() => 0);
+  let current = 0;
+  next.forEach((user) => {
+    current = pageOf.has(user.id) ? pageOf.get(user.id) : current;
+    counts[current] += 1;
+  });
+  return pages.map((page, index) => ({ ...page, count: counts[index] }));
+}
+
+// Returns the rows held ({ users, offset }), whether more pages follow
+// (hasMore), which load is running (loading: 'reload', 'next', 'previous'
+// or null) and the last load error, plus:
+//  - loadNext() and loadPrevious(), for the ends of the list to call;
+//  - reload(), which starts again from the first page, showing the current
+//    rows until it arrives;
+//  - setUsers(update), to apply a local change to the rows held;
+//  - invalidateFirstPage(), for a user created while the first page is not
+//    held, so the page is reloaded when it is scrolled back to.
+function usePagedList(url) {
+  const [state, setState] = useState(INITIAL_STATE);
+  const latest = useRef(state);
+  latest.current = state;
+  const controller = useRef(null);
+  // True from the start of a load until its page is rendered. Kept apart
+  // from state.loading, as several sentinels can fire before a re-render.
+  const pending = useRef(false);
+  // Set by setUsers until the change is written back to the cached pages
+  const edited = useRef(false);
+
+  const load = useCallback((direction, cursor) => {
+    const current = new AbortController();
+    controller.current = current;
+    pending.current = true;
+    setState((previous) => ({ ...previous, loading: direction }));
+
+    const params = { limit: PAGE_SIZE, cursor };
+    const onUpdate = (body) => setState((previous) => replacePage(previous, cursor, body));
+    request(url, params, { signal: current.signal, onUpdate })
+      .then((body) => {
+        if (current.signal.aborted) {
+          return;
+        }
+        setState((previous) => {
+          if (direction === 'previous') {
+            return prependPage(previous, cursor, body);
+          }
+          return appendPage(direction === 'reload' ? INITIAL_STATE : previous, cursor, body);
+        });
+        if (direction !== 'previous' && body.nextCursor) {
+          prefetch(url, { limit: PAGE_SIZE, cursor: body.nextCursor });
+        }
+      })
+      .catch((error) => {
+        if (!current.signal.aborted && !axios.isCancel(error)) {
+          setState((previous) => ({ ...previous, loading: null, error }));
+        }
+      });
+  }, [url]);
+
+  const loadNext = useCallback(() => {
+    const { nextCursor } = latest.current;
+    if (!pending.current && nextCursor !== null) {
+      load('next', nextCursor);
+    }
+  }, [load]);
+
+  const loadPrevious = useCallback(() => {
+    const { earlier } = latest.current;
+    if (!pending.current && earlier.length > 0) {
+      load('previous', earlier[earlier.length - 1].cursor);
+    }
+  }, [load]);
+
+  const reload = useCallback(() => {
+    if (controller.current) {
+      controller.current.abort();
+    }
+    invalidate(url);
+    load('reload', '');
+  }, [url, load]);
+
+  const setUsers = useCallback((update) => {
+    edited.current = true;
+    setState((previous) => {
+      const users = update(previous.users);
+      return { ...previous, users, pages: recount(previous.pages, previous.users, users) };
+    });
+  }, []);
+
+  const invalidateFirstPage = useCallback(() => {
+    invalidate(url, { limit: PAGE_SIZE, cursor: '' });
+  }, [url]);
+
+  useEffect(() => {
+    pending.current = state.loading !== null;
+  }, [state]);
+
+  // Writes local changes into the cached pages they belong to, so pages
+  // loaded from the cache later show them. Unconfirmed rows are left out.
+  useEffect(() => {
+    if (!edited.current) {
+      return;
+    }
+    edited.current = false;
+    let start = 0;
+    state.pages.forEach((page) => {
+      const rows = state.users.slice(start, start + page.count).filter((user) => !user.pending);
+      start += page.count;
+      mutate(url, { limit: PAGE_SIZE, cursor: page.cursor }, (body) => (
+        !body || sameRows(body.data, rows) ? body : { ...body, data: rows, count: rows.length }
+      ));
+    });
+  }, [state, url]);
+
+  useEffect(() => {
+    load('reload', '');
+    return () => controller.current.abort();
+  }, [load]);
+
+  return {
+    users: state.users,
+    offset: state.offset,
+    hasMore: state.nextCursor !== null,
+    loading: state.loading,
+    error: state.error,
+    loadNext,
+    loadPrevious,
+    reload,
+    setUsers,
+    invalidateFirstPage
+  };
+}
+
+export default usePagedList;
+'''
+
 project_files["application/frontend/src/App.css"] = '''.App {
   min-height: 100vh;
   display: flex;
@@ -843,9 +5548,16 @@ project_files["application/frontend/src/App.css"] = '''.App {
 }
 
 .users-grid {
+  width: 100%;
+}
+
+/* Rows are positioned by react-window with a fixed height (ROW_HEIGHT in
+   UserGrid.js); the bottom padding is the gap between rows */
+.users-grid-row {
   display: grid;
-  grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-  gap: 1.5rem;
+  column-gap: 1.5rem;
+  padding-bottom: 1.5rem;
+  box-sizing: border-box;
 }
 
 .user-card {
@@ -853,6 +5565,8 @@ project_files["application/frontend/src/App.css"] = '''.App {
   border: 1px solid #e9ecef;
   border-radius: 8px;
   padding: 1.5rem;
+  box-sizing: border-box;
+  overflow: hidden;
   transition: transform 0.2s, box-shadow 0.2s;
 }
 
@@ -861,12 +5575,39 @@ project_files["application/frontend/src/App.css"] = '''.App {
   box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
 }
 
+/* Users of pages dropped from memory, loaded again when scrolled to */
+.user-card.placeholder {
+  background: #f1f3f5;
+  border-style: dashed;
+}
+
+/* Last row of the grid while more pages can be loaded */
+.users-grid-more {
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  color: #666;
+}
+
+/* Created locally, not yet confirmed by the API */
+.user-card.pending {
+  opacity: 0.6;
+}
+
 .user-info h3 {
   margin: 0 0 0.5rem 0;
   color: #333;
   font-size: 1.2rem;
 }
 
+/* Long names and emails are cut so every card fits its fixed-height row */
+.user-info h3,
+.user-email {
+  white-space: nowrap;
+  overflow: hidden;
+  text-overflow: ellipsis;
+}
+
 .user-email {
   color: #667eea;
   margin: 0 0 0.5rem 0;
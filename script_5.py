@@ -568,6 +568,572 @@ main() {
 main "$@"
 '''
 
+project_files["scripts/loadtest.py"] = '''#!/usr/bin/env python3
+"""Open-loop load test for the backend API.
+
+Requests are started on a fixed schedule (--rate per second, with constant
+or Poisson arrivals) whether or not earlier ones have finished, so a slow
+server shows up as higher latency rather than as fewer requests. Latency is
+measured from the scheduled start and so includes time spent waiting for a
+free connection.
+
+    python3 scripts/loadtest.py --url http://localhost:3000 --rate 200 --duration 60
+    python3 scripts/loadtest.py --mix get=50,list=10,search=10,create=15,update=10,delete=5
+    python3 scripts/loadtest.py --baseline loadtest-results/baseline.json
+
+Results are written to --out as results.json and report.html. Each run
+records the commit and the load settings. With --baseline, the run is
+compared with an earlier results.json, and the exit status is 1 when a
+latency percentile or error rate regressed by more than --max-regression.
+
+The backend rate limits each client IP (RATE_LIMIT_MAX per window). Raise it
+for the server under test, or most requests will be answered with 429.
+
+Only the standard library is used.
+"""
+
+import argparse
+import asyncio
+import gzip
+import html
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+DEFAULT_MIX = "get=50,list=10,search=10,create=15,update=10,delete=5"
+OPERATIONS = ("get", "list", "search", "create", "update", "delete")
+PERCENTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+# Differences below this are noise, whatever the relative change
+MIN_LATENCY_DELTA_MS = 1.0
+
+
+class HttpConnection:
+    """A keep-alive HTTP/1.1 connection. Only what the API needs is parsed:
+    the status line, Content-Length and chunked bodies."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, method, host, path, body=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        head = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {host}",
+            "Accept: application/json",
+            "Accept-Encoding: gzip",
+            f"Content-Length: {len(payload)}",
+        ]
+        if body is not None:
+            head.append("Content-Type: application/json")
+        self.writer.write(("\\r\\n".join(head) + "\\r\\n\\r\\n").encode() + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\\r\\n", b"\\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            data = b"".join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+        # Bodies are requested compressed, as browsers do, so the server's
+        # compression cost is part of what is measured
+        if headers.get("content-encoding", "").lower() == "gzip":
+            try:
+                data = gzip.decompress(data)
+            except (EOFError, zlib.error) as exc:
+                raise ValueError(f"invalid gzip body: {exc}") from exc
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return status, headers, data, keep_alive
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    """At most `size` connections; requests beyond that wait for one."""
+
+    def __init__(self, host, port, size):
+        self.host = host
+        self.port = port
+        self.slots = asyncio.Semaphore(size)
+        self.idle = []
+
+    async def request(self, method, path, body=None):
+        async with self.slots:
+            connection = self.idle.pop() if self.idle else await HttpConnection.open(self.host, self.port)
+            try:
+                status, headers, data, keep_alive = await connection.request(
+                    method, f"{self.host}:{self.port}", path, body
+                )
+            except BaseException:
+                connection.close()
+                raise
+            if keep_alive:
+                self.idle.append(connection)
+            else:
+                connection.close()
+            return status, headers, data
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle.clear()
+
+
+class Workload:
+    """Builds the requests of each operation. Existing users are read and
+    searched; only users created by this run are updated and deleted."""
+
+    def __init__(self, run_id):
+        self.run_id = run_id
+        self.sequence = 0
+        self.known_ids = []
+        self.created_ids = []
+        # Paths of users deleted by this run, for reads and updates that
+        # were already in flight when the DELETE went out
+        self.deleted_paths = set()
+
+    def next_email(self):
+        self.sequence += 1
+        return f"loadtest-{self.run_id}-{self.sequence}@example.com"
+
+    def request_for(self, operation):
+        if operation == "list":
+            return "GET", "/api/users", None
+        if operation == "search":
+            return "GET", "/api/users/search?q=loadtest&limit=20", None
+        if operation == "create":
+            email = self.next_email()
+            return "POST", "/api/users", {"name": f"Load Test {self.sequence}", "email": email}
+        if operation == "get" and self.known_ids:
+            return "GET", f"/api/users/{random.choice(self.known_ids)}", None
+        # Only rows this run created are changed, never existing data
+        if operation == "update" and self.created_ids:
+            user_id = random.choice(self.created_ids)
+            email = self.next_email()
+            return "PUT", f"/api/users/{user_id}", {"name": f"Load Test {self.sequence}", "email": email}
+        if operation == "delete" and self.created_ids:
+            user_id = self.created_ids.pop(random.randrange(len(self.created_ids)))
+            self.known_ids.remove(user_id)
+            self.deleted_paths.add(f"/api/users/{user_id}")
+            return "DELETE", f"/api/users/{user_id}", None
+        # Nothing to read, update or delete yet; create instead
+        return self.request_for("create")
+
+    def record(self, method, status, data):
+        if method == "POST" and status == 201:
+            user_id = json.loads(data)["data"]["id"]
+            self.known_ids.append(user_id)
+            self.created_ids.append(user_id)
+
+    def deleted_by_run(self, method, path, status):
+        """A 404 from racing one of this run's own deletes, not a server error."""
+        return method != "DELETE" and status == 404 and path in self.deleted_paths
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = []
+
+    def add(self, operation, started, latency_ms, status, error=None):
+        self.samples.append((operation, started, latency_ms, status, error))
+
+
+def parse_mix(text):
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}, use {', '.join(OPERATIONS)}")
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight for {name}: {weight!r}") from None
+    if sum(weights.values()) <= 0:
+        raise argparse.ArgumentTypeError("mix weights must add up to more than zero")
+    return weights
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize(samples, seconds):
+    latencies = sorted(sample[2] for sample in samples)
+    statuses = Counter(str(sample[3]) if sample[3] else "error" for sample in samples)
+    failures = sum(1 for sample in samples if not sample[3] or sample[3] >= 400)
+    summary = {
+        "requests": len(samples),
+        "throughput_rps": round(len(samples) / seconds, 2) if seconds else 0,
+        "error_rate": round(failures / len(samples), 4) if samples else 0,
+        "statuses": dict(sorted(statuses.items())),
+    }
+    for name, fraction in PERCENTILES:
+        value = percentile(latencies, fraction)
+        summary[f"{name}_ms"] = round(value, 2) if value is not None else None
+    summary["max_ms"] = round(latencies[-1], 2) if latencies else None
+    summary["mean_ms"] = round(sum(latencies) / len(latencies), 2) if latencies else None
+    return summary
+
+
+def timeline(samples, start):
+    buckets = {}
+    for sample in samples:
+        buckets.setdefault(int(sample[1] - start), []).append(sample)
+    return [
+        {
+            "second": second,
+            "requests": len(bucket),
+            "errors": sum(1 for sample in bucket if not sample[3] or sample[3] >= 400),
+            "p99_ms": round(percentile(sorted(sample[2] for sample in bucket), 0.99), 2),
+        }
+        for second, bucket in sorted(buckets.items())
+    ]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+async def seed(pool, workload, count):
+    """Reads the ids of existing users and creates `count` more."""
+    status, _, data = await pool.request("GET", "/api/users")
+    if status != 200:
+        raise RuntimeError(f"GET /api/users returned {status}; is the server up and the rate limit raised?")
+    workload.known_ids.extend(user["id"] for user in json.loads(data)["data"])
+
+    for _ in range(count):
+        method, path, body = workload.request_for("create")
+        status, _, data = await pool.request(method, path, body)
+        if status != 201:
+            raise RuntimeError(f"seeding failed: POST /api/users returned {status}")
+        workload.record(method, status, data)
+
+
+async def run_load(args, pool, workload):
+    operations = list(args.mix)
+    weights = [args.mix[name] for name in operations]
+    recorder = Recorder()
+    loop = asyncio.get_running_loop()
+    in_flight = set()
+    dropped = 0
+
+    async def issue(operation, scheduled, measured):
+        method, path, body = workload.request_for(operation)
+        try:
+            status, _, data = await asyncio.wait_for(pool.request(method, path, body), args.timeout)
+            workload.record(method, status, data)
+            error = None
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+            status, error = None, type(exc).__name__
+        if workload.deleted_by_run(method, path, status):
+            # The row went away under the request; counting it would
+            # inflate error_rate with misses the workload caused itself
+            return
+        if measured:
+            recorder.add(operation, scheduled, (loop.time() - scheduled) * 1000, status, error)
+
+    start = loop.time()
+    measure_from = start + args.warmup
+    end = measure_from + args.duration
+    next_at = start
+
+    while next_at < end:
+        delay = next_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        measured = next_at >= measure_from
+        if len(in_flight) >= args.max_in_flight:
+            # The server has fallen this far behind; count it instead of
+            # letting the backlog grow without bound
+            if measured:
+                dropped += 1
+        else:
+            operation = random.choices(operations, weights)[0]
+            task = asyncio.create_task(issue(operation, next_at, measured))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        next_at += random.expovariate(args.rate) if args.arrival == "poisson" else 1 / args.rate
+
+    if in_flight:
+        await asyncio.wait(in_flight, timeout=args.timeout)
+    return recorder.samples, measure_from, dropped
+
+
+def build_results(args, samples, start, dropped):
+    by_operation = {}
+    for sample in samples:
+        by_operation.setdefault(sample[0], []).append(sample)
+
+    summary = summarize(samples, args.duration)
+    summary["dropped"] = dropped
+    return {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "url": args.url,
+            "rate": args.rate,
+            "arrival": args.arrival,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "connections": args.connections,
+            "mix": args.mix,
+        },
+        "summary": summary,
+        "operations": {
+            name: summarize(group, args.duration) for name, group in sorted(by_operation.items())
+        },
+        "errors": dict(Counter(sample[4] for sample in samples if sample[4])),
+        "timeline": timeline(samples, start),
+    }
+
+
+def compare(results, baseline, max_regression):
+    """Lists the metrics of each operation that got worse than the baseline
+    by more than max_regression (a fraction)."""
+    rows = []
+    current_ops = dict(results["operations"], all=results["summary"])
+    baseline_ops = dict(baseline["operations"], all=baseline["summary"])
+
+    for name in sorted(set(current_ops) & set(baseline_ops)):
+        current, previous = current_ops[name], baseline_ops[name]
+        for metric in [f"{p}_ms" for p, _ in PERCENTILES] + ["error_rate"]:
+            now, before = current.get(metric), previous.get(metric)
+            if now is None or before is None:
+                continue
+            if metric == "error_rate":
+                regressed = now - before > max(0.01, before * max_regression)
+            else:
+                regressed = now - before > max(MIN_LATENCY_DELTA_MS, before * max_regression)
+            change = (now - before) / before if before else None
+            rows.append({
+                "operation": name,
+                "metric": metric,
+                "baseline": before,
+                "current": now,
+                "change": round(change, 4) if change is not None else None,
+                "regressed": regressed,
+            })
+
+    settings = ("rate", "arrival", "duration_s", "connections", "mix")
+    mismatched = [key for key in settings if results["meta"].get(key) != baseline["meta"].get(key)]
+    return {
+        "baseline_commit": baseline["meta"].get("commit"),
+        "max_regression": max_regression,
+        "settings_differ": mismatched,
+        "rows": rows,
+        "regressed": any(row["regressed"] for row in rows),
+    }
+
+
+def format_ms(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def render_chart(points, key, label, color, width=720, height=160):
+    if not points:
+        return ""
+    peak = max(point[key] for point in points) or 1
+    last = max(point["second"] for point in points) or 1
+    coords = " ".join(
+        f"{point['second'] / last * (width - 40) + 30:.1f},{height - 20 - point[key] / peak * (height - 40):.1f}"
+        for point in points
+    )
+    return (
+        f'<figure><figcaption>{html.escape(label)} (max {peak:g})</figcaption>'
+        f'<svg width="{width}" height="{height}" role="img">'
+        f'<line x1="30" y1="{height - 20}" x2="{width - 10}" y2="{height - 20}" stroke="#999"/>'
+        f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{coords}"/>'
+        f"</svg></figure>"
+    )
+
+
+def render_html(results):
+    meta, summary = results["meta"], results["summary"]
+    title = f"Load test {meta['commit'] or ''} {meta['started_at']}"
+
+    rows = []
+    for name, stats in [("all", summary)] + list(results["operations"].items()):
+        rows.append(
+            "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in (
+                name, stats["requests"], f"{stats['throughput_rps']:.1f}",
+                f"{stats['error_rate'] * 100:.2f}%", format_ms(stats["p50_ms"]),
+                format_ms(stats["p95_ms"]), format_ms(stats["p99_ms"]), format_ms(stats["max_ms"]),
+                ", ".join(f"{code}: {count}" for code, count in stats["statuses"].items()),
+            )) + "</tr>"
+        )
+
+    comparison = ""
+    if "comparison" in results:
+        result = results["comparison"]
+        lines = [
+            f"<tr class=\\"{'bad' if row['regressed'] else ''}\\">"
+            + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in (
+                row["operation"], row["metric"], row["baseline"], row["current"],
+                "-" if row["change"] is None else f"{row['change'] * 100:+.1f}%",
+            )) + "</tr>"
+            for row in result["rows"]
+        ]
+        warning = ""
+        if result["settings_differ"]:
+            warning = f"<p class=\\"bad\\">Settings differ from the baseline: {html.escape(', '.join(result['settings_differ']))}</p>"
+        comparison = (
+            f"<h2>Compared with {html.escape(str(result['baseline_commit']))}</h2>{warning}"
+            "<table><tr><th>operation</th><th>metric</th><th>baseline</th><th>current</th><th>change</th></tr>"
+            + "".join(lines) + "</table>"
+        )
+
+    settings = ", ".join(f"{key}={value}" for key, value in meta.items() if key not in ("started_at", "commit"))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5em; }}
+td, th {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+td:first-child, th:first-child {{ text-align: left; }}
+.bad {{ color: #b00020; font-weight: bold; }}
+</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+<p>{html.escape(settings)}</p>
+<p>Dropped (more than --max-in-flight outstanding): {summary['dropped']}</p>
+<table>
+<tr><th>operation</th><th>requests</th><th>req/s</th><th>errors</th><th>p50 ms</th><th>p95 ms</th><th>p99 ms</th><th>max ms</th><th>statuses</th></tr>
+{"".join(rows)}
+</table>
+{comparison}
+{render_chart(results["timeline"], "requests", "Requests per second", "#1565c0")}
+{render_chart(results["timeline"], "p99_ms", "p99 latency per second (ms)", "#c62828")}
+</body>
+</html>
+"""
+
+
+def print_summary(results):
+    print(f"{'operation':<10} {'requests':>9} {'req/s':>8} {'errors':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, stats in [("all", results["summary"])] + list(results["operations"].items()):
+        print(
+            f"{name:<10} {stats['requests']:>9} {stats['throughput_rps']:>8.1f} {stats['error_rate'] * 100:>6.2f}%"
+            f" {format_ms(stats['p50_ms']):>8} {format_ms(stats['p95_ms']):>8}"
+            f" {format_ms(stats['p99_ms']):>8} {format_ms(stats['max_ms']):>8}"
+        )
+    if results["summary"]["dropped"]:
+        print(f"dropped {results['summary']['dropped']} requests (more than --max-in-flight outstanding)")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split("\\n\\n")[0])
+    parser.add_argument("--url", default=os.environ.get("LOADTEST_URL", "http://localhost:3000"))
+    parser.add_argument("--rate", type=float, default=100, help="requests started per second")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="poisson")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds of load before measuring")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"default {DEFAULT_MIX}")
+    parser.add_argument("--connections", type=int, default=64, help="keep-alive connections at most")
+    parser.add_argument("--max-in-flight", type=int, default=10000)
+    parser.add_argument("--timeout", type=float, default=10, help="seconds before a request counts as failed")
+    parser.add_argument("--seed-users", type=int, default=50, help="users created before the run")
+    parser.add_argument("--out", default="loadtest-results", help="directory for results.json and report.html")
+    parser.add_argument("--baseline", help="results.json of an earlier run to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.10, help="allowed relative regression")
+    args = parser.parse_args(argv)
+    if args.rate <= 0 or args.duration <= 0 or args.connections <= 0:
+        parser.error("--rate, --duration and --connections must be positive")
+    return args
+
+
+async def main(argv):
+    args = parse_args(argv)
+    target = urlsplit(args.url)
+    pool = ConnectionPool(target.hostname, target.port or 80, args.connections)
+    workload = Workload(run_id=f"{int(time.time())}-{os.getpid()}")
+
+    try:
+        await seed(pool, workload, args.seed_users)
+        samples, start, dropped = await run_load(args, pool, workload)
+    except (OSError, RuntimeError, ValueError) as exc:
+        print(f"load test failed: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        pool.close()
+
+    results = build_results(args, samples, start, dropped)
+    if args.baseline:
+        with open(args.baseline) as handle:
+            results["comparison"] = compare(results, json.load(handle), args.max_regression)
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, "results.json"), "w") as handle:
+        json.dump(results, handle, indent=2)
+    with open(os.path.join(args.out, "report.html"), "w") as handle:
+        handle.write(render_html(results))
+
+    print_summary(results)
+    print(f"wrote {args.out}/results.json and {args.out}/report.html")
+
+    comparison = results.get("comparison")
+    if comparison:
+        if comparison["settings_differ"]:
+            print(f"warning: settings differ from the baseline: {', '.join(comparison['settings_differ'])}")
+        for row in comparison["rows"]:
+            if row["regressed"]:
+                print(f"regression: {row['operation']} {row['metric']} {row['baseline']} -> {row['current']}")
+        if comparison["regressed"]:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
+'''
+
 # Docker Compose for local development
 project_files["docker-compose.yml"] = '''version: '3.8'
 
@@ -595,6 +1161,16 @@ services:
       retries: 5
       interval: 30s
 
+  # Redis for rate limit buckets shared by backend instances
+  redis:
+    image: redis:7-alpine
+    container_name: threetier-redis
+    restart: unless-stopped
+    ports:
+      - "6379:6379"
+    networks:
+      - threetier-network
+
   # Backend API
   backend:
     build:
@@ -609,11 +1185,16 @@ services:
       - DB_USER=appuser
       - DB_PASSWORD=apppassword
       - DB_NAME=webapp_dev
+      - REDIS_URL=redis://redis:6379
+      # Raise for load tests, which send everything from one IP
+      - RATE_LIMIT_MAX=${RATE_LIMIT_MAX:-100}
     ports:
       - "3000:3000"
     depends_on:
       database:
         condition: service_healthy
+      redis:
+        condition: service_started
     volumes:
       - ./application/backend:/app
       - /app/node_modules
@@ -703,7 +1284,7 @@ CREATE TABLE IF NOT EXISTS users (
     name VARCHAR(255) NOT NULL,
     email VARCHAR(255) UNIQUE NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     INDEX idx_email (email),
     INDEX idx_created_at (created_at)
 );
@@ -719,8 +1300,9 @@ ON DUPLICATE KEY UPDATE
 name = VALUES(name);
 
 -- Create database user for application
+-- CREATE, ALTER and INDEX let the backend apply its schema migrations
 CREATE USER IF NOT EXISTS 'appuser'@'%' IDENTIFIED BY 'apppassword';
-GRANT SELECT, INSERT, UPDATE, DELETE ON webapp_dev.* TO 'appuser'@'%';
+GRANT SELECT, INSERT, UPDATE, DELETE, CREATE, ALTER, INDEX ON webapp_dev.* TO 'appuser'@'%';
 FLUSH PRIVILEGES;
 '''
 
@@ -782,6 +1364,10 @@ lint-fix: ## Fix linting issues
 	@echo "Fixing frontend linting issues..."
 	cd application/frontend && npm run lint:fix
 
+load-test: ## Open-loop load test of the local backend (RATE=, DURATION=, BASELINE=)
+	python3 scripts/loadtest.py --url http://localhost:3000 --rate $(or $(RATE),100) \\
+		--duration $(or $(DURATION),30) --out loadtest-results $(if $(BASELINE),--baseline $(BASELINE))
+
 # Infrastructure
 setup-backend: ## Setup Terraform backend infrastructure
 	./scripts/setup-backend.sh
@@ -820,8 +1406,8 @@ clean-all: ## Clean up everything including images
 	rm -f outputs.json
 
 # Database
-db-migrate: ## Run database migrations (placeholder)
-	@echo "Database migrations would go here"
+db-migrate: ## Run database migrations
+	docker-compose exec backend npm run migrate
 
 db-seed: ## Seed database with sample data
 	docker-compose exec database mysql -u root -prootpassword webapp_dev < scripts/init.sql
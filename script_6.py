@@ -78,7 +78,7 @@ The 3-Tier Web Application follows a modern cloud-native architecture deployed o
   - RESTful API design
   - Database connection pooling
   - Request logging and monitoring
-  - Health check endpoints
+  - Health check endpoints (`/health` liveness, `/ready` readiness once the DB pool is warm)
   - Graceful shutdown handling
 
 ### Data Tier
@@ -87,6 +87,7 @@ The 3-Tier Web Application follows a modern cloud-native architecture deployed o
 - **Backup Strategy**: Automated backups with point-in-time recovery
 - **Security**: Encryption at rest and in transit
 - **Monitoring**: Performance Insights enabled
+- **Schema**: Versioned migrations in `application/backend/migrations`, applied at startup under a MySQL advisory lock and recorded in `schema_migrations`; migrations that block writes (marked `-- migrate: offline`) are left to `npm run migrate` in a maintenance window
 
 ## Infrastructure as Code
 
@@ -135,10 +136,11 @@ Security Groups → RDS Instance
 - **Application Load Balancer**: Response time, error rates
 - **ECS Services**: CPU, memory utilization
 - **RDS Database**: Connection count, query performance
+- **Backend `/metrics`**: Prometheus format — per-route latency histograms, in-flight requests, DB pool active/idle/queued connections, event loop lag, GC pauses and cache hit/miss counters
 - **Custom Metrics**: Business logic metrics
 
 ### Logging Strategy
-- **Application Logs**: Structured JSON logs to CloudWatch
+- **Application Logs**: Structured JSON logs to CloudWatch; one line per request with `route`, `status`, `duration_ms` and `db_time_ms` (successful requests sampled via `LOG_SAMPLE_RATE_2XX`, errors and requests slower than `SLOW_REQUEST_MS` always logged)
 - **Access Logs**: ALB access logs to S3
 - **VPC Flow Logs**: Network traffic analysis
 - **Audit Logs**: API access and data changes
@@ -208,7 +210,7 @@ This guide covers deploying the 3-tier web application to AWS using Terraform an
 - AWS CLI v2
 - Terraform >= 1.0
 - Docker
-- Node.js 16+
+- Node.js 18.2+
 - Git
 
 ### AWS Account Setup
@@ -282,8 +284,15 @@ db_name = "webapp_dev"
 db_username = "admin"
 db_password = "your-secure-password"
 db_instance_class = "db.t3.micro"
+db_max_connections = 60
 ```
 
+`db_max_connections` sets the RDS `max_connections` parameter and also sizes
+the backend's connection pool: each task gets
+`floor(db_max_connections * 0.8 / (2 * backend_max_capacity))` connections
+(at least 2), so a full scale-out during a rolling deploy stays within the
+limit. The result is exported as the `DB_POOL_SIZE` task environment variable.
+
 3. **Initialize and Plan**:
 ```bash
 terraform init
@@ -587,13 +596,39 @@ DOCKER_REGISTRY=123456789012.dkr.ecr.us-east-1.amazonaws.com
 # Application Configuration
 NODE_ENV=development
 PORT=3000
+LOG_SAMPLE_RATE_2XX=1
+SLOW_REQUEST_MS=1000
+REQUEST_DEADLINE_MS=5000
+RATE_LIMIT_MAX=100
+RATE_LIMIT_WINDOW_MS=900000
+REDIS_URL=redis://localhost:6379
+IDEMPOTENCY_TTL_MS=86400000
+MIGRATE_ON_START=true
+IMPORT_CHUNK_SIZE=1000
+IMPORT_MAX_BYTES=536870912
+# none, otlp (OTLP/HTTP collector) or file (NDJSON spans in TRACE_FILE)
+TRACE_EXPORTER=none
+TRACE_SAMPLE_RATE=0.01
+OTEL_EXPORTER_OTLP_ENDPOINT=http://localhost:4318
+TRACE_FILE=traces.ndjson
 
 # Database Configuration
+# mysql, or memory to benchmark the API without a database (not persisted)
+DB_DRIVER=mysql
+MEMORY_DB_LATENCY_MS=0
 DB_HOST=localhost
 DB_PORT=3306
 DB_NAME=webapp_dev
 DB_USER=appuser
 DB_PASSWORD=apppassword
+DB_POOL_SIZE=10
+# Pool connections kept for exports, which hold one per download (at most
+# a quarter of DB_POOL_SIZE; statements get the rest)
+DB_MAX_STREAMS=2
+DB_QUEUE_LIMIT=40
+DB_ACQUIRE_TIMEOUT_MS=2000
+DB_QUERY_TIMEOUT_MS=10000
+DB_POOL_MIN_IDLE=5
 
 # Frontend Configuration
 REACT_APP_API_URL=http://localhost:3000
@@ -641,6 +676,9 @@ tfplan
 .aws/
 outputs.json
 
+# Load test reports
+loadtest-results/
+
 # IDE
 .vscode/
 .idea/
@@ -663,6 +701,7 @@ logs/
 npm-debug.log*
 yarn-debug.log*
 yarn-error.log*
+traces.ndjson
 
 # Docker
 *.tar
@@ -10,6 +10,7 @@ def get_file_description(file_path):
         '.gitignore': 'Git ignore patterns for the project',
         'deploy.sh': 'Automated deployment script for all environments',
         'setup-backend.sh': 'Script to initialize Terraform backend infrastructure',
+        'loadtest.py': 'Open-loop HTTP load test with latency percentile reports',
         'init.sql': 'Database initialization script with sample data',
     }
     